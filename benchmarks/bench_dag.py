@@ -0,0 +1,171 @@
+"""
+Benchmark of a pipeline DAG run with nothing new against running every stage.
+
+Copies the scraped data and the event cache to a temporary data directory, then runs
+the pipeline (scrape_past_events, scrape_next_event, clean, engineer_features,
+train, infer) through PipelineDAG three times: the first run has no fingerprints so runs
+every stage, the second has nothing new so should only run the scrapers, and the
+third is forced to run them all again. Reports each stage's time in each run.
+
+The scrapers replay html snapshots rather than requesting the site: by default a
+homepage listing only cached events and a next card built from the test pages, or
+a store recorded with ScraperSettings.SNAPSHOT_MODE = "record" with --snapshots.
+
+Run from the repository root:
+    python -m benchmarks.bench_dag
+"""
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+from src.config import PathSettings, ScraperSettings
+
+DATA_FILES = ["raw_ufc_data.csv", "event_cache.json"]
+
+NEXT_EVENT_URL = "http://www.ufcstats.com/event-details/next"
+FIGHTER_URLS = [
+    "http://www.ufcstats.com/fighter-details/4e7d5c5c2d8c8f7a",
+    "http://www.ufcstats.com/fighter-details/e5549c82bfb5582d",
+]
+# The bouts linked from the saved event page.
+FIGHT_URLS = [
+    "http://www.ufcstats.com/fight-details/1338e2c7480bdf9e",
+    "http://www.ufcstats.com/fight-details/a0f0004aadf10b71",
+    "http://www.ufcstats.com/fight-details/e5549c82bfb5582d",
+]
+# The matchup table of an upcoming bout: stat, red corner, blue corner.
+MATCHUP_STATS = [
+    ("Wins/Losses/Draws", "20-5-0", "18-4-1"),
+    ("Average Fight Time", "10:02", "09:11"),
+    ("Height", "6' 1\"", "5' 11\""),
+    ("Weight", "185 lbs.", "185 lbs."),
+    ("Reach", '76"', '74"'),
+    ("Stance", "Orthodox", "Southpaw"),
+    ("DOB", "Jul 23, 1990", "Mar 01, 1992"),
+    ("Strikes Landed per Min. (SLpM)", "4.50", "3.90"),
+    ("Striking Accuracy", "51%", "47%"),
+    ("Strikes Absorbed per Min. (SApM)", "3.10", "3.40"),
+    ("Defense", "58%", "55%"),
+    ("Takedowns Average/15 min.", "1.20", "0.80"),
+    ("Takedown Accuracy", "40%", "35%"),
+    ("Takedown Defense", "75%", "70%"),
+    ("Submission Average/15 min.", "0.5", "0.3"),
+]
+
+
+def _use_data_directory(directory: Path) -> None:
+    """
+    Points every data file at the directory. Must be called before the pipeline is
+    imported, as some classes take their paths as default arguments.
+    """
+    for name, value in list(vars(PathSettings).items()):
+        if isinstance(value, Path) and value.parent == PathSettings.DATA_DIR:
+            setattr(PathSettings, name, directory / value.name)
+    PathSettings.DATA_DIR = directory
+    os.environ["MLFLOW_TRACKING_URI"] = (directory / "mlruns").as_uri()
+
+
+def _matchup_page(bout: int) -> str:
+    rows = "".join(
+        "<tr>"
+        + "".join(
+            f'<td class="b-fight-details__table-text">{value}</td>' for value in stat
+        )
+        + "</tr>"
+        for stat in MATCHUP_STATS
+    )
+    names = [f"Red {bout}", f"Blue {bout}"]
+    fighters = "".join(
+        f'<a class="b-link b-fight-details__person-link" href="{url}">{name}</a>'
+        for url, name in zip(FIGHTER_URLS, names)
+    )
+    header = "".join(
+        f'<th><a class="b-fight-details__table-header-link">{name}</a></th>'
+        for name in names
+    )
+    return (
+        f'<html>{fighters}<i class="b-fight-details__fight-title">Middleweight Bout</i>'
+        f"<table><thead><tr><th></th>{header}</tr></thead>"
+        f"<tbody>{rows}</tbody></table></html>"
+    )
+
+
+def _record_site(snapshot_dir: Path) -> None:
+    """
+    Saves the pages a run with nothing new requests: a homepage listing cached events
+    only, and a next card built from the test pages.
+    """
+    from src.lib.networking import SnapshotStore
+    from src.lib.pipelines.constants import UFC_HOMEPAGE_URL
+
+    store = SnapshotStore(snapshot_dir)
+    with open(PathSettings.EVENT_CACHE_JSON) as f:
+        cached_events = json.load(f)[:25]
+    store.put(
+        UFC_HOMEPAGE_URL,
+        f'<html><a class="b-link b-link_style_white" href="{NEXT_EVENT_URL}">Next</a>'
+        + "".join(
+            f'<a class="b-link b-link_style_black" href="{event}">Event</a>'
+            for event in cached_events
+        )
+        + '<a class="b-statistics__paginate-link" href="?page=1">1</a>'
+        + '<a class="b-statistics__paginate-link" href="?page=all">All</a></html>',
+    )
+    store.put(
+        NEXT_EVENT_URL, (PathSettings.TEST_PAGES / "event_details.html").read_text()
+    )
+    for bout, url in enumerate(FIGHT_URLS):
+        store.put(url, _matchup_page(bout))
+    for url in FIGHTER_URLS:
+        store.put(url, PathSettings.TEST_FIGHTER_PROFILE.read_text())
+
+
+def main(max_parallel: int, snapshots: Optional[Path]) -> None:
+    source_dir = PathSettings.DATA_DIR
+    with tempfile.TemporaryDirectory() as directory:
+        for name in DATA_FILES:
+            shutil.copy(source_dir / name, Path(directory) / name)
+        _use_data_directory(Path(directory))
+        # Also a default argument, so set before the scrapers are imported.
+        ScraperSettings.SNAPSHOT_MODE = "replay"
+        if snapshots is not None:
+            PathSettings.SNAPSHOT_DIR = snapshots
+        else:
+            _record_site(PathSettings.SNAPSHOT_DIR)
+
+        from src.lib.jobs.dag import PipelineDAG, pipeline_stages
+
+        dag_stages = pipeline_stages()
+        runs = {}
+        for run, force in (("first", False), ("nothing new", False), ("forced", True)):
+            start = time.perf_counter()
+            report = PipelineDAG(
+                dag_stages, PathSettings.PIPELINE_STATE_JSON, max_parallel=max_parallel
+            ).run(force=force)
+            runs[run] = (report, time.perf_counter() - start)
+
+        print(f"{'run':>12}{'total s':>10}  stages")
+        for run, (report, seconds) in runs.items():
+            stages = ", ".join(
+                f"{result['stage']} {result['status']} {result['seconds']:.2f}s"
+                for result in report
+            )
+            print(f"{run:>12}{seconds:10.2f}  {stages}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-parallel", type=int, default=2)
+    parser.add_argument(
+        "--snapshots",
+        type=Path,
+        help="replay a recorded snapshot store, e.g. data/snapshots",
+    )
+    args = parser.parse_args()
+    main(args.max_parallel, args.snapshots)
@@ -0,0 +1,86 @@
+"""
+Benchmark for the vectorized DateCleaner against the previous per row strptime implementation.
+
+Builds synthetic frames by sampling the event dates and fighter DOBs of
+data/raw_ufc_data.csv (including the missing "--" DOBs) up to 1M rows, then
+cleans each with both implementations and checks they give identical results.
+
+Run from the repository root:
+    python -m benchmarks.bench_dates --rows 10000 100000 1000000
+"""
+
+import argparse
+import time
+from datetime import datetime
+from typing import List, Type
+
+import pandas as pd
+
+from src.config import PathSettings
+from src.lib.preprocessing.cleaners import CoreCleaner, DateCleaner
+
+
+class LoopDateCleaner(DateCleaner):
+    """
+    The previous implementation, parsing each date with strptime and dropping
+    missing DOBs in two passes. Kept here for comparison.
+    """
+
+    def _format(self):
+        self.df["date"] = self.df["date"].apply(
+            lambda x: datetime.strptime(x, "%B %d, %Y")
+        )
+        self.df.drop(self.df[self.df["blue_dob"] == "--"].index, inplace=True)
+        self.df.drop(self.df[self.df["red_dob"] == "--"].index, inplace=True)
+        for column in self.df.columns:
+            if "dob" in column:
+                self.df[column] = self.df[column].apply(
+                    lambda x: datetime.strptime(x, "%b %d, %Y")
+                )
+
+    def _create_age_columns(self):
+        for corner in ("red", "blue"):
+            self.df[f"{corner}_age"] = (
+                self.df["date"]
+                .sub(self.df[f"{corner}_dob"])
+                .dt.days.div(365.25)
+                .round(0)
+                .astype(int)
+            )
+
+
+def _synthetic_frame(n_rows: int) -> pd.DataFrame:
+    raw_df = pd.read_csv(
+        PathSettings.RAW_DATA_CSV, usecols=["date", "red_DOB", "blue_DOB"]
+    )
+    raw_df = CoreCleaner(raw_df).clean()
+    return raw_df.sample(n=n_rows, replace=True, random_state=0).reset_index(drop=True)
+
+
+def _time_clean(cleaner: Type[DateCleaner], df: pd.DataFrame):
+    start = time.perf_counter()
+    cleaned = cleaner(df.copy()).clean()
+    return time.perf_counter() - start, cleaned
+
+
+def main(row_counts: List[int]) -> None:
+    print(f"{'rows':>10}{'loop s':>10}{'vector s':>10}{'speedup':>10}")
+    for n_rows in row_counts:
+        df = _synthetic_frame(n_rows)
+        loop_time, loop_df = _time_clean(LoopDateCleaner, df)
+        vector_time, vector_df = _time_clean(DateCleaner, df)
+        pd.testing.assert_frame_equal(vector_df, loop_df)
+
+        print(
+            f"{n_rows:10}{loop_time:10.3f}{vector_time:10.3f}"
+            f"{loop_time / vector_time:9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    args = parser.parse_args()
+    main(args.rows)
@@ -0,0 +1,111 @@
+"""
+Benchmark for the vectorized HeightReachCleaner against the previous per cell implementation.
+
+Prepares data/raw_ufc_data.csv with the cleaners that run before
+HeightReachCleaner, then repeats it to scale the dataset (10x and 100x give
+synthetic datasets of ~78k and ~780k bouts). At each scale both
+implementations clean the same rows and must give identical results.
+
+Run from the repository root:
+    python -m benchmarks.bench_height_reach --scales 1 10 100
+"""
+
+import argparse
+import contextlib
+import io
+import time
+import warnings
+from typing import List, Type
+
+import numpy as np
+import pandas as pd
+
+from src.config import PathSettings
+from src.lib.preprocessing.cleaners import (
+    CoreCleaner,
+    DateCleaner,
+    FighterCleaner,
+    HeightReachCleaner,
+)
+
+
+class LoopHeightReachCleaner(HeightReachCleaner):
+    """
+    The previous implementation, converting each cell with python and filling
+    each missing value with a scalar .loc write. Kept here for comparison.
+    """
+
+    def _fill_missing_measurements(self, height_reach_cols: List[str]) -> None:
+        missing_mask = self.df[height_reach_cols].isna().any(axis=1)
+        missing_indices = self.df.index[missing_mask]
+        if missing_indices.empty:
+            return
+
+        avg_measurements = self._create_height_reach_avgs()
+        for col in height_reach_cols:
+            for idx in missing_indices:
+                if np.isnan(self.df.loc[idx, col]):
+                    weight_class = self.df.loc[idx, "weight_class"]
+                    self.df.loc[idx, col] = avg_measurements.loc[weight_class, col]
+
+    def _convert_reach_cell(self, reach: str) -> float:
+        try:
+            return float(reach.replace('"', "")) * self.INCHES_TO_CM
+        except (ValueError, AttributeError):
+            return np.nan
+
+    def _convert_height_cell(self, height: str) -> float:
+        try:
+            feet_str, inches_str = height.split("'")
+            inches = int(feet_str) * self.FEET_TO_INCHES + int(
+                inches_str.replace('"', "")
+            )
+            return round(inches * self.INCHES_TO_CM, 0)
+        except (ValueError, AttributeError):
+            return np.nan
+
+    def convert_to_cm(self, height_reach_cols: List[str]) -> None:
+        for column in height_reach_cols:
+            if "height" in column.lower():
+                self.df[column] = self.df[column].apply(self._convert_height_cell)
+            else:
+                self.df[column] = self.df[column].apply(self._convert_reach_cell)
+
+
+def _prepare() -> pd.DataFrame:
+    df = pd.read_csv(PathSettings.RAW_DATA_CSV)
+    # FighterCleaner prints the weight classes it finds.
+    with contextlib.redirect_stdout(io.StringIO()), warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for cleaner in (CoreCleaner, FighterCleaner, DateCleaner):
+            df = cleaner(df).clean()
+    return df.reset_index(drop=True)
+
+
+def _time_clean(cleaner: Type[HeightReachCleaner], df: pd.DataFrame):
+    start = time.perf_counter()
+    cleaned = cleaner(df.copy()).clean()
+    return time.perf_counter() - start, cleaned
+
+
+def main(scales: List[int]) -> None:
+    df = _prepare()
+
+    print(f"{'scale':>6}{'rows':>10}{'loop s':>10}{'vector s':>10}{'speedup':>10}")
+    for scale in scales:
+        scaled_df = pd.concat([df] * scale, ignore_index=True)
+        loop_time, loop_df = _time_clean(LoopHeightReachCleaner, scaled_df)
+        vector_time, vector_df = _time_clean(HeightReachCleaner, scaled_df)
+        pd.testing.assert_frame_equal(vector_df, loop_df, check_exact=True)
+
+        print(
+            f"{scale:5}x{len(scaled_df):10}{loop_time:10.3f}{vector_time:10.3f}"
+            f"{loop_time / vector_time:9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    args = parser.parse_args()
+    main(args.scales)
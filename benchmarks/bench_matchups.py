@@ -0,0 +1,145 @@
+"""
+Benchmark of MatchupPredictor against assembling the features with pandas and predicting with sklearn.
+
+Builds synthetic training data (--fighters fighters, --bouts bouts), fits the
+encoders and a random forest shaped like the one Training saves (300 trees,
+depth 5), then predicts batches of random matchups both ways. The previous way
+looks up both corners' states with .loc, encodes them with the encoders and
+calls the forest's predict_proba. Both must give the same probabilities.
+
+Run from the repository root:
+    python -m benchmarks.bench_matchups --repeats 20
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+
+from src.lib.constants.columns import INFERENCE_COLUMNS
+from src.lib.modelling import FeatureEncoders, MatchupPredictor
+
+FEATURES = [str(column) for column in INFERENCE_COLUMNS]
+STANCES = ["Orthodox", "Southpaw", "Switch"]
+WEIGHT_CLASSES = ["Flyweight", "Lightweight", "Welterweight", "Middleweight"]
+
+
+def _training_df(n_fighters: int, n_bouts: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    fighters = np.array([f"Fighter {i}" for i in range(n_fighters)])
+    red = rng.integers(0, n_fighters, n_bouts)
+    df = pd.DataFrame(
+        {
+            "date": pd.Timestamp("2000-01-01")
+            + pd.to_timedelta(np.sort(rng.integers(0, 9000, n_bouts)), unit="D"),
+            "weight_class": rng.choice(WEIGHT_CLASSES, n_bouts),
+            "title_bout": rng.choice(["N", "Y"], n_bouts, p=[0.95, 0.05]),
+            "winner": rng.choice(["W", "L"], n_bouts),
+            "red_fighter": fighters[red],
+            "blue_fighter": fighters[
+                (red + rng.integers(1, n_fighters, n_bouts)) % n_fighters
+            ],
+        }
+    )
+    for corner in ("red", "blue"):
+        df[f"{corner}_stance"] = rng.choice(STANCES, n_bouts)
+        df[f"{corner}_dob"] = "1990-06-15"
+        df[f"{corner}_height"] = rng.uniform(160, 200, n_bouts).round()
+        df[f"{corner}_reach"] = rng.uniform(160, 210, n_bouts).round()
+        df[f"{corner}_wins"] = rng.integers(0, 25, n_bouts)
+        df[f"{corner}_losses"] = rng.integers(0, 15, n_bouts)
+        df[f"{corner}_age"] = rng.integers(20, 40, n_bouts)
+        for stat in MatchupPredictor.AVERAGED_STATS:
+            df[f"{corner}_{stat}"] = rng.uniform(0, 1, n_bouts)
+            df[f"{corner}_{stat.replace('percent', 'average')}"] = rng.uniform(
+                0, 1, n_bouts
+            )
+    df["height_diff"] = df["red_height"] - df["blue_height"]
+    df["reach_diff"] = df["red_reach"] - df["blue_reach"]
+    return df
+
+
+def _pandas_probabilities(
+    predictor: MatchupPredictor, matchups: pd.DataFrame
+) -> np.ndarray:
+    """
+    The previous way, the features assembled with pandas and predicted with sklearn.
+    """
+    states = predictor.fighter_states
+    red = states.loc[matchups["red_fighter"]].reset_index(drop=True)
+    blue = states.loc[matchups["blue_fighter"]].reset_index(drop=True)
+    date = pd.Timestamp(matchups["date"].iloc[0])
+    features = pd.DataFrame(
+        {
+            "weight_class": red["weight_class"],
+            "title_bout": "N",
+            "height_diff": red["height"] - blue["height"],
+            "reach_diff": red["reach"] - blue["reach"],
+        }
+    )
+    for corner, corner_states in (("red", red), ("blue", blue)):
+        features[f"{corner}_age"] = (
+            (date - corner_states["dob"]).dt.days / 365.25
+        ).round()
+        for column in MatchupPredictor.CORNER_FEATURES:
+            features[f"{corner}_{column}"] = corner_states[column]
+    probabilities = predictor.model.predict_proba(
+        predictor.encoders.transform(features[FEATURES])
+    )
+    return probabilities[:, list(predictor.model.classes_).index(1.0)]
+
+
+def _time(function, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings)) * 1000
+
+
+def main(n_fighters: int, n_bouts: int, repeats: int) -> None:
+    training_df = _training_df(n_fighters, n_bouts)
+    encoders = FeatureEncoders.fit(training_df)
+    model = RandomForestClassifier(
+        random_state=42, max_depth=5, n_estimators=300, min_samples_split=5
+    )
+    model.fit(
+        encoders.transform(training_df[FEATURES]),
+        encoders.encode_outcome(training_df["winner"]),
+    )
+    predictor = MatchupPredictor(
+        model,
+        encoders,
+        MatchupPredictor.fighter_states(training_df[MatchupPredictor.TRAINING_COLUMNS]),
+    )
+
+    rng = np.random.default_rng(1)
+    fighters = predictor.fighter_states.index.to_numpy()
+    print(f"{'matchups':>10}{'pandas ms':>12}{'numpy ms':>12}")
+    for n_matchups in (1, 10, 100):
+        matchups = pd.DataFrame(
+            {
+                "red_fighter": rng.choice(fighters, n_matchups),
+                "blue_fighter": rng.choice(fighters, n_matchups),
+                "date": "2025-03-01",
+            }
+        )
+        np.testing.assert_allclose(
+            predictor.predict(matchups)["red_win_probability"],
+            _pandas_probabilities(predictor, matchups),
+        )
+        pandas_ms = _time(lambda: _pandas_probabilities(predictor, matchups), repeats)
+        numpy_ms = _time(lambda: predictor.predict(matchups), repeats)
+        print(f"{n_matchups:>10}{pandas_ms:12.2f}{numpy_ms:12.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fighters", type=int, default=2500)
+    parser.add_argument("--bouts", type=int, default=7000)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+    main(args.fighters, args.bouts, args.repeats)
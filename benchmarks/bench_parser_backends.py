@@ -0,0 +1,93 @@
+"""
+Benchmark for the bs4 and lxml parser backends of each scraper.
+
+Times parse_html on an event, bout and fighter page (the test pages in
+tests/html_pages, or every page of that type recorded in the html snapshot
+store with --snapshots) with each backend, and checks both backends give
+identical output for every page.
+
+Run from the repository root:
+    python -m benchmarks.bench_parser_backends --repeats 50
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from loguru import logger
+
+from src.config import PathSettings
+from src.lib.networking import SnapshotStore
+from src.lib.scrapers import BoutScraper, CardScraper, FighterScraper
+
+Page = Tuple[Callable[..., Any], tuple]
+
+
+def _test_pages() -> Dict[str, List[Page]]:
+    def read(name: str) -> str:
+        return (PathSettings.TEST_PAGES / name).read_text()
+
+    return {
+        "event": [(CardScraper.parse_html, ("event", read("event_details.html")))],
+        "bout": [
+            (BoutScraper.parse_html, ("bout", read(name), "", ""))
+            for name in ("fight_details.html", "fight_details_red_loss.html")
+        ],
+        "fighter": [
+            (FighterScraper.parse_html, ("fighter", read("fighter_profile.html"), True))
+        ],
+    }
+
+
+def _snapshot_pages() -> Dict[str, List[Page]]:
+    store = SnapshotStore(PathSettings.SNAPSHOT_DIR)
+    pages: Dict[str, List[Page]] = {"event": [], "bout": [], "fighter": []}
+    for url in store.urls:
+        html = store.get(url)
+        if "/event-details/" in url:
+            pages["event"].append((CardScraper.parse_html, (url, html)))
+        elif "/fight-details/" in url:
+            pages["bout"].append((BoutScraper.parse_html, (url, html, "", "")))
+        elif "/fighter-details/" in url:
+            pages["fighter"].append((FighterScraper.parse_html, (url, html, True)))
+    return pages
+
+
+def _time_per_page(pages: List[Page], backend: str, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for parse, args in pages:
+            parse(*args, backend=backend)
+    return (time.perf_counter() - start) / (repeats * len(pages))
+
+
+def main(repeats: int, snapshots: bool) -> None:
+    # Card parsing logs every step, keep the output to the results.
+    logger.remove()
+    pages_by_type = _snapshot_pages() if snapshots else _test_pages()
+
+    print(f"{'page':10}{'pages':>7}{'bs4 ms':>10}{'lxml ms':>10}{'speedup':>10}")
+    for page_type, pages in pages_by_type.items():
+        if not pages:
+            continue
+        for parse, args in pages:
+            assert parse(*args, backend="lxml") == parse(*args, backend="bs4"), args[0]
+
+        bs4_time = _time_per_page(pages, "bs4", repeats)
+        lxml_time = _time_per_page(pages, "lxml", repeats)
+        print(
+            f"{page_type:10}{len(pages):7}{bs4_time * 1000:10.2f}{lxml_time * 1000:10.2f}"
+            f"{bs4_time / lxml_time:9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=50)
+    parser.add_argument(
+        "--snapshots",
+        action="store_true",
+        help="parse the pages recorded in data/snapshots instead of the test pages",
+    )
+    args = parser.parse_args()
+    main(args.repeats, args.snapshots)
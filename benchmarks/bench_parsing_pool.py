@@ -0,0 +1,90 @@
+"""
+Benchmark for parsing pages in the ParsingPool with different numbers of workers.
+
+Uses the pages recorded in the html snapshot store (data/snapshots, see
+ScraperSettings.SNAPSHOT_MODE) when there are any, otherwise the fighter
+profile test page repeated. Every page is handed to the pool at once, as the
+engine does when a card's bouts are fetched concurrently, and the throughput
+is compared against parsing inline on the event loop. Also checks every
+worker count parses the same results.
+
+Run from the repository root:
+    python -m benchmarks.bench_parsing_pool --pages 400 --workers 0 1 2 4
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from typing import Any, Callable, List, Tuple
+
+from loguru import logger
+
+from src.config import PathSettings
+from src.lib.networking import SnapshotStore
+from src.lib.scrapers import BoutScraper, CardScraper, FighterScraper, ParsingPool
+
+Job = Tuple[Callable[..., Any], tuple]
+
+
+def _job(url: str, html: str) -> Job:
+    if "fight-details" in url:
+        return BoutScraper.parse_html, (url, html, "", "")
+    if "event-details" in url:
+        return CardScraper.parse_html, (url, html)
+    return FighterScraper.parse_html, (url, html, True)
+
+
+def _load_jobs(n_pages: int) -> List[Job]:
+    if PathSettings.SNAPSHOT_DIR.exists():
+        store = SnapshotStore(PathSettings.SNAPSHOT_DIR)
+        # Homepage listings aren't parsed by the pool.
+        urls = [url for url in store.urls if "-details/" in url][:n_pages]
+        if urls:
+            return [_job(url, store.get(url)) for url in urls]
+
+    html = PathSettings.TEST_FIGHTER_PROFILE.read_text()
+    return [_job(f"fighter-details/{i}", html) for i in range(n_pages)]
+
+
+async def _parse_all(parsing_pool: ParsingPool, jobs: List[Job]) -> List[Any]:
+    return await asyncio.gather(
+        *(parsing_pool.run(parse, *args) for parse, args in jobs)
+    )
+
+
+def _bench(workers: int, jobs: List[Job]) -> Tuple[float, List[Any]]:
+    with ParsingPool(max_workers=workers) as parsing_pool:
+        # Start the worker processes outside the timing.
+        if workers:
+            asyncio.run(_parse_all(parsing_pool, jobs[:workers]))
+        start = time.perf_counter()
+        results = asyncio.run(_parse_all(parsing_pool, jobs))
+        return time.perf_counter() - start, results
+
+
+def main(n_pages: int, worker_counts: List[int]) -> None:
+    # Card parsing logs every step, keep the output to the results.
+    logger.remove()
+    jobs = _load_jobs(n_pages)
+
+    print(f"pages: {len(jobs)}, cpus: {os.cpu_count()}")
+    baseline_time, baseline_results = None, None
+    for workers in worker_counts:
+        elapsed, results = _bench(workers, jobs)
+        if baseline_results is None:
+            baseline_time, baseline_results = elapsed, results
+        assert results == baseline_results
+
+        print(
+            f"workers {workers:2}: {elapsed:7.3f}s, {len(jobs) / elapsed:7.1f} pages/s, "
+            f"{baseline_time / elapsed:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=400)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 1, 2, 4])
+    args = parser.parse_args()
+    main(args.pages, args.workers)
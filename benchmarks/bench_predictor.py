@@ -0,0 +1,158 @@
+"""
+Load test for /predictor/predictor/ with the model registry against loading the model on every request.
+
+Trains a random forest shaped like the one Training saves (300 trees, depth 5)
+on synthetic features, writes it and a synthetic 13 bout card to a temporary
+directory, then sends the same requests to the endpoint through Django's test
+client, first with the previous view and then with the current one, and
+reports the latency percentiles. Both must return the same predictions.
+--mmap-mode memory-maps the weights in the registry.
+
+Run from the repository root:
+    python -m benchmarks.bench_predictor --requests 200
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import types
+from importlib import import_module
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+from joblib import dump
+from sklearn.ensemble import RandomForestClassifier
+
+from src.config import InferenceSettings, PathSettings, StorageSettings
+from src.lib.constants.columns import INFERENCE_COLUMNS
+from src.lib.modelling.encoders import FeatureEncoders
+
+FEATURES = [str(column) for column in INFERENCE_COLUMNS]
+CATEGORIES = {
+    "weight_class": ["Lightweight", "Welterweight", "Middleweight"],
+    "title_bout": ["N", "Y"],
+    "red_stance": ["Orthodox", "Southpaw", "Switch"],
+    "blue_stance": ["Orthodox", "Southpaw", "Switch"],
+}
+ENDPOINT = "/predictor/predictor/"
+
+
+def _features(n_rows: int, rng: np.random.Generator) -> pd.DataFrame:
+    features = pd.DataFrame(
+        rng.uniform(0, 1, (n_rows, len(FEATURES))), columns=FEATURES
+    )
+    for column, values in CATEGORIES.items():
+        features[column] = rng.choice(values, n_rows)
+    return features
+
+
+def _write_model_and_card(directory: Path) -> None:
+    rng = np.random.default_rng(0)
+    features = _features(5000, rng)
+    features["winner"] = rng.choice(["W", "L"], len(features))
+    encoders = FeatureEncoders.fit(features)
+    encoders.save(PathSettings.MODEL_ENCODERS)
+    random_forest = RandomForestClassifier(
+        random_state=42, max_depth=5, n_estimators=300, min_samples_split=5
+    )
+    random_forest.fit(
+        encoders.transform(features[FEATURES]),
+        encoders.encode_outcome(features["winner"]),
+    )
+    dump(random_forest, PathSettings.MODEL_WEIGHTS)
+
+    card = _features(13, rng)
+    card.insert(0, "red_fighter", [f"Red Fighter {i}" for i in range(len(card))])
+    card.insert(1, "blue_fighter", [f"Blue Fighter {i}" for i in range(len(card))])
+    card.to_csv(PathSettings.NEXT_EVENT_CSV, index=False)
+
+
+def _loading_urlconf() -> types.ModuleType:
+    """
+    The previous view, loading the model and the card on every request.
+    """
+    from django.http import JsonResponse
+    from django.urls import path
+
+    from src.lib.data_managers import get_storage
+    from src.lib.modelling.inference import Inference
+
+    def predictor(request):
+        inference = Inference(
+            PathSettings.MODEL_WEIGHTS,
+            PathSettings.NEXT_EVENT_CSV,
+            storage=get_storage(StorageSettings.NEXT_EVENT),
+            encoders=PathSettings.MODEL_ENCODERS,
+        )
+        return JsonResponse({"data": inference.predict()})
+
+    urlconf = types.ModuleType("loading_urls")
+    urlconf.urlpatterns = [path(ENDPOINT.lstrip("/"), predictor)]
+    return urlconf
+
+
+def _load_test(client, n_requests: int, urlconf: Optional[types.ModuleType] = None):
+    from django.test import override_settings
+    from django.urls import clear_url_caches
+
+    latencies: List[float] = []
+    with override_settings(ROOT_URLCONF=urlconf or "src.server.urls"):
+        clear_url_caches()
+        for _ in range(n_requests):
+            start = time.perf_counter()
+            response = client.get(ENDPOINT)
+            latencies.append(time.perf_counter() - start)
+            assert response.status_code == 200
+    clear_url_caches()
+    return np.array(latencies) * 1000, json.loads(response.content)
+
+
+def main(n_requests: int, mmap_mode: Optional[str]) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        InferenceSettings.MODEL_MMAP_MODE = mmap_mode
+        PathSettings.MODEL_WEIGHTS = Path(directory) / "model_weights.joblib"
+        PathSettings.NEXT_EVENT_CSV = Path(directory) / "next_event.csv"
+        PathSettings.MODEL_ENCODERS = Path(directory) / "model_encoders.joblib"
+        _write_model_and_card(Path(directory))
+
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "src.server.settings")
+        import django
+        from django.test import Client
+        from django.test.utils import setup_test_environment
+        from loguru import logger
+
+        django.setup()
+        setup_test_environment()
+        # Imports every app's views, so it isn't counted in the first request.
+        import_module("src.server.urls")
+        # The view logs every prediction.
+        logger.remove()
+        client = Client()
+
+        loading_ms, loading_response = _load_test(
+            client, n_requests, _loading_urlconf()
+        )
+        registry_ms, registry_response = _load_test(client, n_requests)
+        assert loading_response == registry_response
+
+        # The registry loads the model on the first request, the percentiles are of the rest.
+        print(f"{'view':>10}{'first ms':>10}{'p50 ms':>10}{'p99 ms':>10}")
+        for name, latencies in (("loading", loading_ms), ("registry", registry_ms)):
+            print(
+                f"{name:>10}{latencies[0]:10.2f}{np.percentile(latencies[1:], 50):10.2f}"
+                f"{np.percentile(latencies[1:], 99):10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument(
+        "--mmap-mode", default=None, help='joblib mmap_mode for the registry, e.g. "r"'
+    )
+    args = parser.parse_args()
+    main(args.requests, args.mmap_mode)
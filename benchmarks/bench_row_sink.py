@@ -0,0 +1,73 @@
+"""
+Microbenchmark for adding scraped rows to CSVProcessingHandler.
+
+Replays rows from data/raw_ufc_data.csv as the string dicts the scrapers produce
+and compares the previous one row DataFrame + pd.concat per row against the
+buffered row sink. Also checks both approaches produce the same dataframe.
+
+Run from the repository root:
+    python -m benchmarks.bench_row_sink --rows 10000
+"""
+
+import argparse
+import tempfile
+import time
+from itertools import cycle, islice
+from pathlib import Path
+from typing import Dict, List
+
+import pandas as pd
+
+from src.config import PathSettings
+from src.lib.data_managers import CSVProcessingHandler
+
+
+def _load_rows(n_rows: int) -> List[Dict[str, str]]:
+    raw_df = pd.read_csv(PathSettings.RAW_DATA_CSV, dtype=str, keep_default_na=False)
+    records = raw_df.to_dict(orient="records")
+    return list(islice(cycle(records), n_rows))
+
+
+def _concat_per_row(rows: List[Dict[str, str]]) -> pd.DataFrame:
+    """
+    The approach add_row used before the row sink.
+    """
+    df = pd.DataFrame()
+    for row in rows:
+        row_df = pd.DataFrame.from_dict(row, orient="index").T
+        df = pd.concat([df, row_df], ignore_index=True)
+    return df
+
+
+def _row_sink(rows: List[Dict[str, str]], csv_path: Path) -> pd.DataFrame:
+    handler = CSVProcessingHandler(csv_path, allow_creation=True)
+    for row in rows:
+        handler.add_row(row)
+    return handler.df
+
+
+def main(n_rows: int) -> None:
+    rows = _load_rows(n_rows)
+
+    start = time.perf_counter()
+    concat_df = _concat_per_row(rows)
+    concat_time = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        start = time.perf_counter()
+        sink_df = _row_sink(rows, Path(tmp_dir) / "raw_ufc_data.csv")
+        sink_time = time.perf_counter() - start
+
+    pd.testing.assert_frame_equal(concat_df, sink_df)
+
+    print(f"rows: {n_rows}, columns: {len(sink_df.columns)}")
+    print(f"concat per row: {concat_time:8.3f}s")
+    print(f"row sink:       {sink_time:8.3f}s")
+    print(f"speedup:        {concat_time / sink_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    args = parser.parse_args()
+    main(args.rows)
@@ -0,0 +1,97 @@
+"""
+Benchmark comparing one ClientSession per page against the pooled SessionManager.
+
+Serves the saved fighter profile from a local stub HTTP server and fetches it
+repeatedly through FighterScraper, first without a session (a fresh connection
+per page, as every scraper used to do) and then with a shared SessionManager.
+
+Run from the repository root:
+    python -m benchmarks.bench_sessions --requests 2000 --concurrency 10
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Optional
+
+from aiohttp import web
+from loguru import logger
+
+from src.config import PathSettings
+from src.lib.networking import AdaptiveRateLimiter, SessionManager
+from src.lib.scrapers import FighterScraper
+
+
+async def _start_stub_server(html: str) -> web.AppRunner:
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(text=html, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/fighter-details/{fighter_id}", handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner
+
+
+def _server_url(runner: web.AppRunner) -> str:
+    host, port = runner.addresses[0][:2]
+    return f"http://{host}:{port}"
+
+
+async def _fetch_all(
+    base_url: str,
+    n_requests: int,
+    concurrency: int,
+    session: Optional[SessionManager],
+) -> float:
+    """
+    Fetches n_requests pages and returns the achieved requests per second.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def fetch(i: int) -> None:
+        async with sem:
+            scraper = FighterScraper(
+                f"{base_url}/fighter-details/{i}", red_corner=True, session=session
+            )
+            await scraper._aget_html()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(fetch(i) for i in range(n_requests)))
+    return n_requests / (time.perf_counter() - start)
+
+
+async def main(n_requests: int, concurrency: int) -> None:
+    # Per-request logging would dominate the timings.
+    logger.remove()
+
+    with open(PathSettings.TEST_FIGHTER_PROFILE, "r") as f:
+        html = f.read()
+
+    runner = await _start_stub_server(html)
+    base_url = _server_url(runner)
+    try:
+        before = await _fetch_all(base_url, n_requests, concurrency, session=None)
+        # Rate limiting is benchmarked separately, here only connection reuse is measured.
+        unlimited = AdaptiveRateLimiter(
+            requests_per_second=1e9, max_requests_per_second=1e9, burst=1e9
+        )
+        async with SessionManager(rate_limiter=unlimited) as session:
+            after = await _fetch_all(base_url, n_requests, concurrency, session)
+    finally:
+        await runner.cleanup()
+
+    print(f"requests: {n_requests}, concurrency: {concurrency}")
+    print(f"session per page: {before:8.1f} req/s")
+    print(f"pooled session:   {after:8.1f} req/s")
+    print(f"speedup:          {after / before:8.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
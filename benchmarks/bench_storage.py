@@ -0,0 +1,81 @@
+"""
+Benchmark for the csv and parquet storage backends.
+
+Writes the training dataset (data/training_data.csv, produced by the feature
+engineering pipeline) with each backend and compares the write time, the full
+read time, a projected read of the columns Inference uses and the size on disk.
+Also checks both backends read back the same dataframe.
+
+Run from the repository root:
+    python -m benchmarks.bench_storage --repeats 5
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+import pandas as pd
+
+from src.config import PathSettings
+from src.lib.constants.columns import INFERENCE_COLUMNS, Columns
+from src.lib.data_managers import CSVStorage, ParquetStorage, StorageBackendABC
+
+
+def _best_of(repeats: int, func: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def _bench_backend(
+    storage: StorageBackendABC, df: pd.DataFrame, path: Path, repeats: int
+) -> Dict[str, float]:
+    inference_columns = [Columns.RED_FIGHTER, Columns.BLUE_FIGHTER, *INFERENCE_COLUMNS]
+    return {
+        "write": _best_of(repeats, lambda: storage.write(df, path)),
+        "read": _best_of(repeats, lambda: storage.read(path)),
+        "projected read": _best_of(
+            repeats, lambda: storage.read(path, columns=inference_columns)
+        ),
+        "size (MB)": storage.resolve(path).stat().st_size / 1_000_000,
+    }
+
+
+def main(csv_path: Path, repeats: int) -> None:
+    df = CSVStorage().read(csv_path)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "training_data"
+        csv_storage, parquet_storage = CSVStorage(), ParquetStorage()
+        results["csv"] = _bench_backend(csv_storage, df, path, repeats)
+        results["parquet"] = _bench_backend(parquet_storage, df, path, repeats)
+
+        pd.testing.assert_frame_equal(
+            csv_storage.read(path),
+            parquet_storage.read(path),
+            check_dtype=False,
+            check_categorical=False,
+        )
+
+    print(f"rows: {len(df)}, columns: {len(df.columns)}, best of {repeats}")
+    print(f"{'':16}{'csv':>10}{'parquet':>10}{'ratio':>10}")
+    for metric in results["csv"]:
+        csv_value, parquet_value = results["csv"][metric], results["parquet"][metric]
+        print(
+            f"{metric:16}{csv_value:10.3f}{parquet_value:10.3f}"
+            f"{csv_value / parquet_value:9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--path", type=Path, default=PathSettings.TRAINING_DATA_CSV)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    main(args.path, args.repeats)
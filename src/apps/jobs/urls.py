@@ -0,0 +1,9 @@
+from django.urls import path
+
+from . import views
+
+urlpatterns = [
+    path("", views.recent_jobs, name="recent_jobs"),
+    path("<int:job_id>/", views.job_status, name="job_status"),
+    path("pipeline/", views.run_pipeline, name="run_pipeline"),
+]
@@ -0,0 +1,48 @@
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from django.http import JsonResponse
+from django.urls import reverse
+from src.config import PathSettings
+from src.lib.jobs import JobQueue
+
+
+@lru_cache(maxsize=None)
+def get_job_queue() -> JobQueue:
+    # Created on first use, so importing the views doesn't create the database.
+    return JobQueue(PathSettings.JOBS_DB)
+
+
+def enqueue(kind: str, params: Optional[Dict[str, Any]] = None) -> JsonResponse:
+    """
+    Queues the job for the runner and responds straight away with its id and where
+    to follow its progress, see src.lib.jobs.
+    """
+    job_id = get_job_queue().enqueue(kind, params)
+    return JsonResponse(
+        {"job_id": job_id, "status_url": reverse("job_status", args=[job_id])},
+        status=202,
+    )
+
+
+def run_pipeline(request):
+    # Scrapes, cleans, engineers the features and retrains the model in one job.
+    full = request.GET.get("full", "false").lower() == "true"
+    return enqueue("pipeline", {"full": full})
+
+
+def job_status(request, job_id: int):
+    job = get_job_queue().get(job_id)
+    if job is None:
+        return JsonResponse({"error": f"No job with id {job_id}"}, status=404)
+    return JsonResponse(job)
+
+
+def recent_jobs(request):
+    try:
+        limit = int(request.GET.get("limit", 20))
+    except ValueError:
+        limit = 0
+    if limit < 1:
+        return JsonResponse({"error": "limit must be a positive integer"}, status=400)
+    return JsonResponse({"data": get_job_queue().recent(limit)})
@@ -4,4 +4,6 @@ from . import views
 urlpatterns = [
     path("predictor/", views.predictor, name="predictor"),
     path("next_event/", views.show_next_event, name="next_event"),
+    path("matchups/", views.predict_matchups, name="matchups"),
+    path("train/", views.train, name="train"),
 ]
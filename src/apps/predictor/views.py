@@ -1,20 +1,97 @@
+import json
+
+import numpy as np
 import pandas as pd
 from loguru import logger as log
 
 from django.http import JsonResponse
-from src.config import PathSettings
-from src.lib.modelling.inference import Inference
+from django.urls import reverse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+from src.apps.jobs.views import enqueue
+from src.config import InferenceSettings, PathSettings, StorageSettings
+from src.lib.data_managers import get_storage
+from src.lib.exceptions import (
+    ModelNotTrainedException,
+    NoNextEventException,
+    UnknownFighterException,
+)
+from src.lib.modelling.registry import ModelRegistry
+
+# One per worker process, the model and predictions are reloaded when their files change.
+model_registry = ModelRegistry(
+    PathSettings.MODEL_WEIGHTS,
+    PathSettings.NEXT_EVENT_FEATURES_CSV,
+    storage=get_storage(StorageSettings.NEXT_EVENT),
+    mmap_mode=InferenceSettings.MODEL_MMAP_MODE,
+    encoders_path=PathSettings.MODEL_ENCODERS,
+    training_path=PathSettings.TRAINING_DATA_CSV,
+    training_storage=get_storage(StorageSettings.TRAINING_DATA),
+)
+
+
+def _model_not_trained(exc: ModelNotTrainedException) -> JsonResponse:
+    return JsonResponse(
+        {"error": exc.message, "train_url": reverse("train")}, status=503
+    )
 
 
 def predictor(request):
-    inference = Inference(PathSettings.MODEL_WEIGHTS, PathSettings.NEXT_EVENT_CSV)
-    predictions = inference.predict()
+    try:
+        predictions = model_registry.predictions()
+    except ModelNotTrainedException as exc:
+        return _model_not_trained(exc)
+    except NoNextEventException as exc:
+        return JsonResponse({"error": exc.message}, status=404)
     log.info(predictions)
     return JsonResponse({"data": predictions})
 
 
 def show_next_event(request):
-    df = pd.read_csv(PathSettings.NEXT_EVENT_CSV)
+    df = get_storage(StorageSettings.NEXT_EVENT).read(
+        PathSettings.NEXT_EVENT_CSV, columns=["red_fighter", "blue_fighter"]
+    )
     # get red and blue fighters for event and store in json
     fighters = df[["red_fighter", "blue_fighter"]].to_dict(orient="records")
     return JsonResponse({"data": fighters})
+
+
+@csrf_exempt
+@require_POST
+def predict_matchups(request):
+    """
+    Predicts the winner of any matchups. The body is one matchup or a list of them:
+    {"red_fighter": "...", "blue_fighter": "...", "weight_class": "Lightweight",
+    "title_bout": false, "date": "2025-03-01"}, only the fighters are required.
+    """
+    try:
+        body = json.loads(request.body)
+        matchups = pd.DataFrame(body if isinstance(body, list) else [body])
+    except (json.JSONDecodeError, ValueError, TypeError):
+        return JsonResponse(
+            {"error": "Body must be a matchup or a list of them"}, status=400
+        )
+    if matchups.empty or not {"red_fighter", "blue_fighter"}.issubset(matchups.columns):
+        return JsonResponse(
+            {"error": "Every matchup needs a red_fighter and a blue_fighter"},
+            status=400,
+        )
+    if "title_bout" in matchups:
+        matchups["title_bout"] = np.where(
+            matchups["title_bout"].fillna(False).astype(bool), "Y", "N"
+        )
+
+    try:
+        predictions = model_registry.matchup_predictor().predict(matchups)
+    except UnknownFighterException as exc:
+        return JsonResponse(
+            {"error": exc.message, "unknown_fighters": exc.fighters}, status=404
+        )
+    except ModelNotTrainedException as exc:
+        return _model_not_trained(exc)
+    return JsonResponse({"data": predictions.to_dict(orient="records")})
+
+
+def train(request):
+    # Retrained by the job runner, the registry picks up the new model when it's saved.
+    return enqueue("train")
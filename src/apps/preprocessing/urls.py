@@ -4,4 +4,5 @@ from . import views
 
 urlpatterns = [
     path("preprocess_data/", views.preprocess_data, name="preprocess_data"),
+    path("engineer_features/", views.engineer_features, name="engineer_features"),
 ]
@@ -1,10 +1,13 @@
-from django.http import HttpResponse
-
-from src.lib.pipelines import DataCleaningPipeline
+from src.apps.jobs.views import enqueue
 
 
 def preprocess_data(request):
-    data_cleaning_pipeline = DataCleaningPipeline()
-    data_cleaning_pipeline.run()
+    # ?full=true cleans every bout again instead of only the newly scraped ones.
+    full = request.GET.get("full", "false").lower() == "true"
+    return enqueue("clean_data", {"full": full})
+
 
-    return HttpResponse("Preprocessing data")
+def engineer_features(request):
+    # ?full=true builds the training data from every bout again.
+    full = request.GET.get("full", "false").lower() == "true"
+    return enqueue("engineer_features", {"full": full})
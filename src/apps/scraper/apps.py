@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class UfcConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "src.apps.scraper"
+
+    def ready(self) -> None:
+        from src.lib.data_managers.storage import STORAGE_BACKENDS
+
+        from .storage import ORMStorage
+
+        # The raw data can be stored in the database once the models are loaded.
+        STORAGE_BACKENDS["orm"] = ORMStorage
@@ -0,0 +1,166 @@
+"""
+Module to store the scraped bouts in the database, as an alternative to the raw csv file.
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+from django.db import close_old_connections, transaction
+
+from src.config import StorageSettings, console
+from src.lib.constants.columns import RAW_COLUMNS
+from src.lib.data_managers import ProcessingHandlerABC
+from src.lib.preprocessing.keys import RAW_DATE_FORMAT, bout_keys
+
+from .models import RAW_COLUMN_FIELDS, RawUFCData
+
+# The table's version is written next to where the raw csv file would be.
+TABLE_VERSION_SUFFIX = ".table.json"
+
+
+def _to_instances(rows_df: pd.DataFrame) -> List[RawUFCData]:
+    """
+    Builds a model instance per bout, keyed by its date and fighters. Columns the
+    model doesn't have are dropped and missing values are stored as empty text.
+    If a bout appears more than once the last row is kept.
+    """
+    rows_df = rows_df.reindex(columns=RAW_COLUMNS).astype(object)
+    rows_df = rows_df.where(rows_df.notna(), "")
+    rows_df["bout_key"] = bout_keys(rows_df)
+    rows_df["bout_date"] = pd.to_datetime(
+        rows_df["date"], format=RAW_DATE_FORMAT
+    ).dt.date
+    rows_df = rows_df.drop_duplicates(subset="bout_key", keep="last")
+
+    fields = {column: RAW_COLUMN_FIELDS[column] for column in RAW_COLUMNS}
+    return [
+        RawUFCData(
+            bout_key=row["bout_key"],
+            bout_date=row["bout_date"],
+            **{field: str(row[column]) for column, field in fields.items()},
+        )
+        for row in rows_df.to_dict("records")
+    ]
+
+
+def upsert_bouts(rows_df: pd.DataFrame, batch_size: Optional[int] = None) -> int:
+    """
+    Inserts the bouts in batches, updating the ones already stored rather than adding
+    them twice, so scraping the same card again is safe.
+
+    Args:
+        rows_df (pd.DataFrame): raw bouts, with the columns as the scrapers name them.
+        batch_size (Optional[int]): bouts per insert. Defaults to StorageSettings.ORM_BATCH_SIZE.
+
+    Returns:
+        int: the number of bouts written.
+    """
+    instances = _to_instances(rows_df)
+    with transaction.atomic():
+        RawUFCData.objects.bulk_create(
+            instances,
+            batch_size=batch_size or StorageSettings.ORM_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["bout_key"],
+            update_fields=["bout_date", "updated_at", *RAW_COLUMN_FIELDS.values()],
+        )
+    return len(instances)
+
+
+def write_table_version(path: Path) -> Path:
+    """
+    Writes the RawUFCData table's version to a small json file, so the pipeline
+    can fingerprint the table rather than the whole database. The file is only
+    rewritten when the version changes.
+
+    Args:
+        path (Path): the raw data path, given with any suffix.
+
+    Returns:
+        Path: the version file.
+    """
+    version_path = path.with_suffix(TABLE_VERSION_SUFFIX)
+    version = json.dumps(RawUFCData.objects.version(), sort_keys=True)
+    if version_path.exists() and version_path.read_text() == version:
+        return version_path
+
+    version_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = version_path.with_suffix(version_path.suffix + ".tmp")
+    with open(tmp_path, "w") as f:
+        f.write(version)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, version_path)
+    return version_path
+
+
+class ORMProcessingHandler(ProcessingHandlerABC):
+    """
+    Writes the scraped bouts to the RawUFCData table as each card completes.
+
+    Rows are buffered and upserted in batches on each flush, so once a card has been
+    flushed it is committed, and a card scraped again replaces its earlier rows.
+    The scraping pipeline flushes from inside its event loop, where Django doesn't
+    allow queries, so the database is written from a thread of its own.
+    """
+
+    def __init__(self, path: Path, batch_size: Optional[int] = None) -> None:
+        """
+        Args:
+            path (Path): the raw data path, the table's version is written beside it.
+            batch_size (Optional[int]): bouts per insert. Defaults to StorageSettings.ORM_BATCH_SIZE.
+        """
+        self.path = path
+        self.batch_size = batch_size
+
+        self._pending_rows: List[Dict[str, str]] = []
+        self._rows_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+        self.instantiate()
+
+    def instantiate(self) -> int:
+        """
+        Counts the bouts already stored, they are never loaded.
+
+        Returns:
+            int: the number of bouts in the table.
+        """
+        return self._executor.submit(RawUFCData.objects.count).result()
+
+    def add_row(self, row: Dict[str, str]):
+        """
+        Buffers a row until the next flush. Safe to call from concurrent scraping tasks.
+        """
+        with self._rows_lock:
+            self._pending_rows.append(dict(row))
+
+    def flush(self) -> None:
+        """
+        Upserts the buffered rows.
+        """
+        with self._rows_lock:
+            rows = self._pending_rows
+            self._pending_rows = []
+        if not rows:
+            return
+
+        written = self._executor.submit(
+            upsert_bouts, pd.DataFrame(rows, dtype=object), self.batch_size
+        ).result()
+        console.log(f"Stored {written} bouts in the database.")
+
+    def write(self) -> None:
+        """
+        Upserts any rows not yet flushed, updates the table's version and closes the
+        handler's connection.
+        """
+        self.flush()
+        self._executor.submit(write_table_version, self.path).result()
+        self._executor.submit(close_old_connections).result()
+        self._executor.shutdown()
@@ -0,0 +1,309 @@
+# Generated by Django 5.1.6 on 2026-10-17 13:16
+
+import datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraper", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="rawufcdata",
+            name="bout_date",
+            field=models.DateField(default=datetime.date(1993, 11, 12)),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="rawufcdata",
+            name="bout_key",
+            field=models.CharField(default="", max_length=255),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_Ctrl",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_DOB",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_Fighter",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_Height",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_KD",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_Reach",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_Rev",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_SApM",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_SLpM",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_STANCE",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_Sig_str",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_Sig_str_percent",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_Str_Acc",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_Str_Def",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_Sub_Avg",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_Sub_att",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_TD_Acc",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_TD_Avg",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_TD_Def",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_Td",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_Td_percent",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_Total_str",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_Weight",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="blue_record",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="date",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="location",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_Ctrl",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_DOB",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_Fighter",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_Height",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_KD",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_Reach",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_Rev",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_SApM",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_SLpM",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_STANCE",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_Sig_str",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_Sig_str_percent",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_Str_Acc",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_Str_Def",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_Sub_Avg",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_Sub_att",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_TD_Acc",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_TD_Avg",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_TD_Def",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_Td",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_Td_percent",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_Total_str",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_Weight",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="red_record",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="title_bout",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="weight_class",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="rawufcdata",
+            name="winner",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AddIndex(
+            model_name="rawufcdata",
+            index=models.Index(fields=["bout_date"], name="raw_bout_date"),
+        ),
+        migrations.AddIndex(
+            model_name="rawufcdata",
+            index=models.Index(fields=["red_Fighter"], name="raw_red_fighter"),
+        ),
+        migrations.AddIndex(
+            model_name="rawufcdata",
+            index=models.Index(fields=["blue_Fighter"], name="raw_blue_fighter"),
+        ),
+        migrations.AddConstraint(
+            model_name="rawufcdata",
+            constraint=models.UniqueConstraint(
+                fields=("bout_key",), name="unique_raw_bout_key"
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-17 13:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraper", "0002_raw_text_fields_and_bout_key"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="rawufcdata",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
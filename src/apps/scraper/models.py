@@ -1,72 +1,158 @@
+"""
+Models for the scraped data, kept as the scrapers return it.
+"""
+
+import re
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence
+
+import pandas as pd
 from django.db import models
-from django.db.models import CharField, BooleanField, IntegerField, FloatField
-from typing import Optional
+from django.db.models import CharField, DateField, DateTimeField
+
+from src.lib.constants.columns import RAW_COLUMNS
+
+
+def _field_name(column: str) -> str:
+    """
+    The model field for a raw column, e.g. "red_Sig. str. %" -> "red_Sig_str_percent".
+    """
+    return re.sub(r"[^0-9A-Za-z]+", "_", column.replace("%", "percent")).strip("_")
+
+
+# Each raw column and the field it is stored in.
+RAW_COLUMN_FIELDS: Dict[str, str] = {
+    column: _field_name(column) for column in RAW_COLUMNS
+}
+
+
+class RawUFCDataQuerySet(models.QuerySet):
+    """
+    Queries over the scraped bouts, so a stage can load only the bouts it needs
+    rather than the whole dataset.
+    """
 
-# Create your models here.
+    def after(self, since: date) -> "RawUFCDataQuerySet":
+        """
+        Bouts fought after the date, using the index on the bout's date.
+        """
+        return self.filter(bout_date__gt=since)
+
+    def for_fighter(self, name: str) -> "RawUFCDataQuerySet":
+        """
+        Bouts the fighter fought in, in either corner.
+        """
+        return self.filter(models.Q(red_Fighter=name) | models.Q(blue_Fighter=name))
+
+    def version(self) -> Dict[str, Any]:
+        """
+        The number of bouts, the latest bout and when a bout was last stored. Any
+        bout added, removed or scraped again changes at least one of them.
+        """
+        version = self.aggregate(
+            bouts=models.Count("id"),
+            latest_bout=models.Max("bout_date"),
+            last_updated=models.Max("updated_at"),
+        )
+        return {
+            key: value.isoformat() if hasattr(value, "isoformat") else value
+            for key, value in version.items()
+        }
+
+    def to_dataframe(self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        The bouts as a dataframe with the raw columns, in the order they were scraped.
+
+        Args:
+            columns (Optional[Sequence[str]]): only these raw columns. Defaults to all of them.
+        """
+        columns = list(columns) if columns is not None else RAW_COLUMNS
+        fields: List[str] = [RAW_COLUMN_FIELDS[column] for column in columns]
+        rows = self.order_by("id").values_list(*fields)
+        return pd.DataFrame(list(rows), columns=columns, dtype=object)
 
 
 class RawUFCData(models.Model):
+    """
+    A scraped bout. Values are stored as the text scraped from the site, e.g.
+    "147 of 314" or 6' 1", and are only parsed by the cleaning stage.
+    """
+
+    # Identifies the bout, see src.lib.preprocessing.keys.bout_keys.
+    bout_key: CharField = models.CharField(max_length=255)
+    bout_date: DateField = models.DateField()
+    updated_at: DateTimeField = models.DateTimeField(auto_now=True)
+
     # Fight information
-    date: CharField = models.CharField(max_length=100)
-    location: CharField = models.CharField(max_length=100)
-    weight_class: CharField = models.CharField(max_length=100)
-    title_bout: BooleanField = models.BooleanField()
-    winner: CharField = models.CharField(max_length=100)
-    red_Fighter: CharField = models.CharField(max_length=100)
-    blue_Fighter: CharField = models.CharField(max_length=100)
+    date: CharField = models.CharField(max_length=100, blank=True)
+    location: CharField = models.CharField(max_length=100, blank=True)
+    weight_class: CharField = models.CharField(max_length=100, blank=True)
+    title_bout: CharField = models.CharField(max_length=100, blank=True)
+    winner: CharField = models.CharField(max_length=100, blank=True)
+    red_Fighter: CharField = models.CharField(max_length=100, blank=True)
+    blue_Fighter: CharField = models.CharField(max_length=100, blank=True)
 
     # Fight statistics
-    red_KD: IntegerField = models.IntegerField()
-    blue_KD: IntegerField = models.IntegerField()
-    red_Sig_str: IntegerField = models.IntegerField()
-    blue_Sig_str: IntegerField = models.IntegerField()
-    red_Sig_str_percent: FloatField = models.FloatField()
-    blue_Sig_str_percent: FloatField = models.FloatField()
-    red_Total_str: IntegerField = models.IntegerField()
-    blue_Total_str: IntegerField = models.IntegerField()
-    red_Td: IntegerField = models.IntegerField()
-    blue_Td: IntegerField = models.IntegerField()
-    red_Td_percent: FloatField = models.FloatField()
-    blue_Td_percent: FloatField = models.FloatField()
-    red_Sub_att: IntegerField = models.IntegerField()
-    blue_Sub_att: IntegerField = models.IntegerField()
-    red_Rev: IntegerField = models.IntegerField()
-    blue_Rev: IntegerField = models.IntegerField()
-    red_Ctrl: IntegerField = models.IntegerField()
-    blue_Ctrl: IntegerField = models.IntegerField()
+    red_KD: CharField = models.CharField(max_length=100, blank=True)
+    blue_KD: CharField = models.CharField(max_length=100, blank=True)
+    red_Sig_str: CharField = models.CharField(max_length=100, blank=True)
+    blue_Sig_str: CharField = models.CharField(max_length=100, blank=True)
+    red_Sig_str_percent: CharField = models.CharField(max_length=100, blank=True)
+    blue_Sig_str_percent: CharField = models.CharField(max_length=100, blank=True)
+    red_Total_str: CharField = models.CharField(max_length=100, blank=True)
+    blue_Total_str: CharField = models.CharField(max_length=100, blank=True)
+    red_Td: CharField = models.CharField(max_length=100, blank=True)
+    blue_Td: CharField = models.CharField(max_length=100, blank=True)
+    red_Td_percent: CharField = models.CharField(max_length=100, blank=True)
+    blue_Td_percent: CharField = models.CharField(max_length=100, blank=True)
+    red_Sub_att: CharField = models.CharField(max_length=100, blank=True)
+    blue_Sub_att: CharField = models.CharField(max_length=100, blank=True)
+    red_Rev: CharField = models.CharField(max_length=100, blank=True)
+    blue_Rev: CharField = models.CharField(max_length=100, blank=True)
+    red_Ctrl: CharField = models.CharField(max_length=100, blank=True)
+    blue_Ctrl: CharField = models.CharField(max_length=100, blank=True)
 
     # Red corner fighter details
-    red_Height: FloatField = models.FloatField()
-    red_Weight: FloatField = models.FloatField()
-    red_Reach: FloatField = models.FloatField()
-    red_STANCE: CharField = models.CharField(
-        max_length=100, default="Orthodox", blank=True
-    )
-    red_DOB: CharField = models.CharField(max_length=100)
-    red_SLpM: FloatField = models.FloatField()
-    red_Str_Acc: FloatField = models.FloatField()
-    red_SApM: FloatField = models.FloatField()
-    red_Str_Def: FloatField = models.FloatField()
-    red_TD_Avg: FloatField = models.FloatField()
-    red_TD_Acc: FloatField = models.FloatField()
-    red_TD_Def: FloatField = models.FloatField()
-    red_Sub_Avg: FloatField = models.FloatField()
-    red_record: CharField = models.CharField(max_length=100)
+    red_Height: CharField = models.CharField(max_length=100, blank=True)
+    red_Weight: CharField = models.CharField(max_length=100, blank=True)
+    red_Reach: CharField = models.CharField(max_length=100, blank=True)
+    red_STANCE: CharField = models.CharField(max_length=100, blank=True)
+    red_DOB: CharField = models.CharField(max_length=100, blank=True)
+    red_SLpM: CharField = models.CharField(max_length=100, blank=True)
+    red_Str_Acc: CharField = models.CharField(max_length=100, blank=True)
+    red_SApM: CharField = models.CharField(max_length=100, blank=True)
+    red_Str_Def: CharField = models.CharField(max_length=100, blank=True)
+    red_TD_Avg: CharField = models.CharField(max_length=100, blank=True)
+    red_TD_Acc: CharField = models.CharField(max_length=100, blank=True)
+    red_TD_Def: CharField = models.CharField(max_length=100, blank=True)
+    red_Sub_Avg: CharField = models.CharField(max_length=100, blank=True)
+    red_record: CharField = models.CharField(max_length=100, blank=True)
 
     # Blue corner fighter details
-    blue_Height: FloatField = models.FloatField()
-    blue_Weight: FloatField = models.FloatField()
-    blue_Reach: FloatField = models.FloatField()
-    blue_STANCE: CharField = models.CharField(
-        max_length=100, default="Orthodox", blank=True
-    )
-    blue_DOB: CharField = models.CharField(max_length=100)
-    blue_SLpM: FloatField = models.FloatField()
-    blue_Str_Acc: FloatField = models.FloatField()
-    blue_SApM: FloatField = models.FloatField()
-    blue_Str_Def: FloatField = models.FloatField()
-    blue_TD_Avg: FloatField = models.FloatField()
-    blue_TD_Acc: FloatField = models.FloatField()
-    blue_TD_Def: FloatField = models.FloatField()
-    blue_Sub_Avg: FloatField = models.FloatField()
-    blue_record: CharField = models.CharField(max_length=100)
+    blue_Height: CharField = models.CharField(max_length=100, blank=True)
+    blue_Weight: CharField = models.CharField(max_length=100, blank=True)
+    blue_Reach: CharField = models.CharField(max_length=100, blank=True)
+    blue_STANCE: CharField = models.CharField(max_length=100, blank=True)
+    blue_DOB: CharField = models.CharField(max_length=100, blank=True)
+    blue_SLpM: CharField = models.CharField(max_length=100, blank=True)
+    blue_Str_Acc: CharField = models.CharField(max_length=100, blank=True)
+    blue_SApM: CharField = models.CharField(max_length=100, blank=True)
+    blue_Str_Def: CharField = models.CharField(max_length=100, blank=True)
+    blue_TD_Avg: CharField = models.CharField(max_length=100, blank=True)
+    blue_TD_Acc: CharField = models.CharField(max_length=100, blank=True)
+    blue_TD_Def: CharField = models.CharField(max_length=100, blank=True)
+    blue_Sub_Avg: CharField = models.CharField(max_length=100, blank=True)
+    blue_record: CharField = models.CharField(max_length=100, blank=True)
+
+    objects = RawUFCDataQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            # Scraping a bout again updates it rather than adding it twice.
+            models.UniqueConstraint(fields=["bout_key"], name="unique_raw_bout_key"),
+        ]
+        indexes = [
+            models.Index(fields=["bout_date"], name="raw_bout_date"),
+            models.Index(fields=["red_Fighter"], name="raw_red_fighter"),
+            models.Index(fields=["blue_Fighter"], name="raw_blue_fighter"),
+        ]
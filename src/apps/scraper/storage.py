@@ -0,0 +1,62 @@
+"""
+Module for the storage backend reading and writing the raw data from the database.
+"""
+
+from datetime import date
+from io import StringIO
+from pathlib import Path
+from typing import Optional, Sequence
+
+import pandas as pd
+from django.db import transaction
+
+from src.lib.data_managers import StorageBackendABC
+from src.lib.preprocessing.keys import bout_keys
+
+from .handlers import TABLE_VERSION_SUFFIX, upsert_bouts, write_table_version
+from .models import RawUFCData, RawUFCDataQuerySet
+
+
+class ORMStorage(StorageBackendABC):
+    """
+    The raw data in the RawUFCData table, registered as "orm" by the scraper app.
+    The table holds the one dataset, paths only place the file holding its version
+    (bout count, latest bout and last update), which is what they resolve to. The
+    pipeline fingerprints that file rather than the database, so writes to other
+    tables don't rerun cleaning. The values are parsed as they would be from the csv
+    file, so the cleaning stage gets the same dataframe either way.
+    """
+
+    suffix = TABLE_VERSION_SUFFIX
+
+    def read(self, path: Path, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        return self._read(RawUFCData.objects.all(), columns)
+
+    def read_after(
+        self, since: date, columns: Optional[Sequence[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Reads only the bouts fought after the date, using the index on the bout's date.
+
+        Raises:
+            FileNotFoundError: If no bouts have been stored.
+        """
+        return self._read(RawUFCData.objects.after(since), columns)
+
+    def _read(
+        self, bouts: RawUFCDataQuerySet, columns: Optional[Sequence[str]]
+    ) -> pd.DataFrame:
+        if not RawUFCData.objects.exists():
+            raise FileNotFoundError("No bouts have been stored in the database.")
+        text_df = bouts.to_dataframe(columns)
+        # Empty values are stored as empty text, as they are in the csv file.
+        return pd.read_csv(StringIO(text_df.to_csv(index=False)))
+
+    def write(self, df: pd.DataFrame, path: Path) -> None:
+        """
+        Replaces the stored bouts with the dataframe's, as writing the csv file would.
+        """
+        with transaction.atomic():
+            RawUFCData.objects.exclude(bout_key__in=set(bout_keys(df))).delete()
+            upsert_bouts(df)
+        write_table_version(path)
@@ -5,4 +5,9 @@ from . import views
 urlpatterns = [
     path("scrape_past_events/", views.scrape_past_events, name="scrape_past_events"),
     path("scrape_next_event/", views.scrape_next_event, name="scrape_next_event"),
+    path(
+        "refresh_fighter_profiles/",
+        views.refresh_fighter_profiles,
+        name="refresh_fighter_profiles",
+    ),
 ]
@@ -3,7 +3,9 @@ Script to store all the configuration variables
 """
 
 from pathlib import Path
+from typing import Optional
 import logging
+import os
 from rich.console import Console
 
 
@@ -27,6 +29,114 @@ class Config:
     )
 
 
+class ScraperSettings:
+    """
+    This class will hold the settings for the HTTP layer shared by the scrapers.
+    """
+
+    # Total number of pooled connections shared across all scrapers.
+    CONNECTION_LIMIT: int = 100
+
+    # Maximum number of pooled connections open to a single host.
+    CONNECTION_LIMIT_PER_HOST: int = 20
+
+    # Seconds an idle connection is kept open for reuse.
+    KEEPALIVE_TIMEOUT: float = 30.0
+
+    # Seconds a resolved hostname is cached for.
+    DNS_CACHE_TTL: int = 300
+
+    # Total seconds allowed for a single request.
+    REQUEST_TIMEOUT: float = 100.0
+
+    # Homepage listing pages requested together while looking for events not in the cache.
+    HOMEPAGE_PAGES_PER_BATCH: int = 3
+
+    # Maximum number of requests in flight at once across every scraper in a run.
+    MAX_CONCURRENT_REQUESTS: int = 20
+
+    # Starting requests per second sent to each host, adapted as the host responds.
+    REQUESTS_PER_SECOND: float = 10.0
+    MIN_REQUESTS_PER_SECOND: float = 0.5
+    MAX_REQUESTS_PER_SECOND: float = 50.0
+
+    # Number of requests that can be sent to a host back to back.
+    RATE_LIMIT_BURST: float = 10.0
+
+    # Rate multiplier when throttled (429, 5xx, timeouts) and rate added back per success.
+    RATE_LIMIT_BACKOFF_FACTOR: float = 0.5
+    RATE_LIMIT_RECOVERY_STEP: float = 0.1
+
+    # Seconds after cutting the rate in which further throttles are ignored.
+    RATE_LIMIT_THROTTLE_COOLDOWN: float = 1.0
+
+    # Retries for a throttled or failed request, waiting base * 2^attempt seconds (capped) between them.
+    MAX_RETRIES: int = 5
+    RETRY_BACKOFF_BASE: float = 1.0
+    RETRY_BACKOFF_MAX: float = 60.0
+
+    # Seconds a cached fighter profile is used before it is scraped again.
+    FIGHTER_PROFILE_TTL: float = 24 * 60 * 60
+
+    # Worker processes bouts, cards and fighter profiles are parsed in. 0 parses on the event loop,
+    # which is quicker on a single core as pages don't need shipping between processes.
+    PARSER_WORKERS: int = min(4, (os.cpu_count() or 1) - 1)
+
+    # Parser used to extract cards, bouts and fighter profiles. "lxml" uses compiled XPath
+    # expressions, "bs4" walks full BeautifulSoup trees. Both give identical output.
+    PARSER_BACKEND: str = "lxml"
+
+    # Html snapshots (PathSettings.SNAPSHOT_DIR). "off", "record" to save every page fetched,
+    # or "replay" to serve pages from the snapshots without touching the network.
+    SNAPSHOT_MODE: str = "off"
+
+
+class InferenceSettings:
+    """
+    This class will hold the settings for serving predictions.
+    """
+
+    # joblib mmap_mode the model weights are loaded with, e.g. "r" to memory-map the
+    # trees' arrays from the file instead of reading them in. None loads them into memory.
+    MODEL_MMAP_MODE: Optional[str] = None
+
+
+class JobSettings:
+    """
+    This class will hold the settings for the background jobs, see src.lib.jobs.
+    """
+
+    # Jobs run at once, each in its own process. The pipeline's stages read and write
+    # the same data files, so by default they run one after another.
+    MAX_CONCURRENT_JOBS: int = 1
+
+    # Seconds the runner waits between checks for new jobs.
+    POLL_INTERVAL: float = 1.0
+
+    # Stages of the pipeline DAG run at once, see src.lib.jobs.dag. Only stages that
+    # don't depend on each other, e.g. scraping the next event and cleaning, overlap.
+    MAX_PARALLEL_STAGES: int = 2
+
+
+class StorageSettings:
+    """
+    This class will hold the storage format used for each stage's dataset.
+    Options are "csv" and "parquet", see src.lib.data_managers.storage, and for the
+    raw data "orm", the scraper app's database table.
+    """
+
+    RAW_DATA: str = "csv"
+
+    CLEAN_DATA: str = "csv"
+
+    TRAINING_DATA: str = "csv"
+
+    NEXT_EVENT: str = "csv"
+
+    # Bouts written to the database per insert when the raw data is stored with "orm".
+    ORM_BATCH_SIZE: int = 500
+
+
 class PathSettings:
     """
     This class will hold all the paths to the data files.
@@ -42,16 +152,44 @@ class PathSettings:
 
     EVENT_CACHE_JSON: Path = DATA_DIR / "event_cache.json"
 
+    EVENT_CACHE_LOG: Path = DATA_DIR / "event_cache.jsonl"
+
     FIGHTER_PROFILE_CACHE_CSV: Path = DATA_DIR / "fighter_profile_cache.csv"
 
     CLEAN_DATA_CSV: Path = DATA_DIR / "clean_ufc_data.csv"
 
+    # Raw bouts already cleaned and each cleaner's running state, for incremental cleaning.
+    CLEANING_STATE_JSON: Path = DATA_DIR / "cleaning_state.json"
+
     TRAINING_DATA_CSV: Path = DATA_DIR / "training_data.csv"
 
     NEXT_EVENT_CSV: Path = DATA_DIR / "next_event.csv"
 
+    # The next card with each fighter's averages up to date, written by feature engineering.
+    NEXT_EVENT_FEATURES_CSV: Path = DATA_DIR / "next_event_features.csv"
+
+    # Coefficients of the models imputing fighters' first bout averages.
+    REGRESSION_MODELS_JSON: Path = DATA_DIR / "regression_models.json"
+
+    # Every fighter's running stat totals, for incremental feature engineering.
+    FIGHTER_STATS_JSON: Path = DATA_DIR / "fighter_stats.json"
+
     MODEL_WEIGHTS: Path = DATA_DIR / "model_weights.joblib"
 
+    # Encoders of the model's categorical columns, saved alongside the weights.
+    MODEL_ENCODERS: Path = DATA_DIR / "model_encoders.joblib"
+
+    SNAPSHOT_DIR: Path = DATA_DIR / "snapshots"
+
+    # Queue of the background jobs, with each job's status and stage timings.
+    JOBS_DB: Path = DATA_DIR / "jobs.sqlite3"
+
+    # Fingerprints of each pipeline stage's inputs when it last ran, see src.lib.jobs.dag.
+    PIPELINE_STATE_JSON: Path = DATA_DIR / "pipeline_state.json"
+
+    # The next card's predictions from the last pipeline run.
+    PREDICTIONS_JSON: Path = DATA_DIR / "predictions.json"
+
     TEST_PAGES: Path = TEST_DIR / "html_pages"
 
     TEST_FIGHTER_PROFILE: Path = TEST_PAGES / "fighter_profile.html"
@@ -28,6 +28,8 @@ class Columns(StrEnum):
     BLUE_TD_PERCENT = "blue_td_percent"
     RED_TD_DEFENCE_PERCENT = "red_td_defence_percent"
     BLUE_TD_DEFENCE_PERCENT = "blue_td_defence_percent"
+    RED_DOB = "red_dob"
+    BLUE_DOB = "blue_dob"
     RED_AGE = "red_age"
     BLUE_AGE = "blue_age"
     RED_RECORD = "red_record"
@@ -149,6 +151,8 @@ NEXT_EVENT_COLUMN_MAPPING = {
     "blue_Takedown Defense": "blue_td_defence_average",
     "red_Stance": "red_stance",
     "blue_Stance": "blue_stance",
+    "red_DOB": "red_dob",
+    "blue_DOB": "blue_dob",
 }
 
 INFERENCE_COLUMNS = [
@@ -174,6 +178,86 @@ INFERENCE_COLUMNS = [
     Columns.BLUE_TD_DEFENCE_AVERAGE,
 ]
 
+# Scraped bout stats with values like "12 of 30" (landed of attempted), after the
+# CoreCleaner has standardised the names. Each is split into _attempted, _landed
+# and _percent columns.
+ATTEMPT_LANDED_COLUMNS = [
+    "red_sig_str",
+    "blue_sig_str",
+    "red_total_str",
+    "blue_total_str",
+    "red_td",
+    "blue_td",
+]
+
+# Scraped bout stats with values like "40%".
+PERCENT_STRING_COLUMNS = ["red_sig_str_%", "blue_sig_str_%", "red_td_%", "blue_td_%"]
+
+# Defence percentages and the opponent's accuracy they are derived from.
+DEFENCE_PERCENT_SOURCES = {
+    Columns.RED_SIG_STR_DEFENCE_PERCENT: "blue_sig_str_%",
+    Columns.BLUE_SIG_STR_DEFENCE_PERCENT: "red_sig_str_%",
+    Columns.RED_TD_DEFENCE_PERCENT: "blue_td_%",
+    Columns.BLUE_TD_DEFENCE_PERCENT: "red_td_%",
+}
+
+# Columns of the scraped data, as the scrapers name them.
+RAW_COLUMNS = (
+    [
+        "date",
+        "location",
+        "weight_class",
+        "title_bout",
+        "winner",
+        "red_Fighter",
+        "blue_Fighter",
+    ]
+    + [
+        f"{corner}_{column}"
+        for column in [
+            "KD",
+            "Sig. str.",
+            "Sig. str. %",
+            "Total str.",
+            "Td",
+            "Td %",
+            "Sub. att",
+            "Rev.",
+            "Ctrl",
+        ]
+        for corner in ("red", "blue")
+    ]
+    + [
+        f"{corner}_{column}"
+        for corner in ("red", "blue")
+        for column in [
+            "Height",
+            "Weight",
+            "Reach",
+            "STANCE",
+            "DOB",
+            "SLpM",
+            "Str. Acc.",
+            "SApM",
+            "Str. Def",
+            "TD Avg.",
+            "TD Acc.",
+            "TD Def.",
+            "Sub. Avg.",
+            "record",
+        ]
+    ]
+)
+
+# Low cardinality label columns, stored as categoricals where the storage format supports it.
+CATEGORICAL_COLUMNS = [
+    Columns.WEIGHT_CLASS,
+    Columns.TITLE_BOUT,
+    Columns.WINNER,
+    Columns.RED_STANCE,
+    Columns.BLUE_STANCE,
+]
+
 
 # Derived column sets
 # INFERENCE_COLUMNS = BASE_COLUMNS + STAT_COLUMNS
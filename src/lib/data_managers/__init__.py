@@ -1,2 +1,13 @@
-from .cache import CacheABC, JSONCache
-from .handlers import CSVProcessingHandler, ProcessingHandlerABC
+from .cache import CacheABC, EventLogCache, EventStatus, JSONCache
+from .handlers import (
+    CSVProcessingHandler,
+    ProcessingHandlerABC,
+    StreamingCSVProcessingHandler,
+)
+from .fighter_cache import FighterProfileCache, ProfileRefresh
+from .storage import (
+    CSVStorage,
+    ParquetStorage,
+    StorageBackendABC,
+    get_storage,
+)
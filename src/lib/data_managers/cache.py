@@ -3,10 +3,12 @@ Module to handle the caching of UFC event links processed.
 """
 
 import json
+import os
 
 from abc import ABC, abstractmethod
+from enum import StrEnum
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Optional
 
 
 class CacheABC(ABC):
@@ -32,5 +34,164 @@ class JSONCache(CacheABC):
             return []
 
     def write(self, cache: List[str]) -> None:
-        with open(self.cache_file_path, "w") as f:
+        """
+        Writes to a temporary file and renames it over the cache so a crash
+        while checkpointing never leaves a corrupt cache behind.
+        """
+        tmp_path = self.cache_file_path.with_name(self.cache_file_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
             json.dump(cache, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.cache_file_path)
+
+
+class EventStatus(StrEnum):
+    SCRAPED = "scraped"
+    # The card was fetched but some of its bouts failed, none of its rows were kept.
+    PARTIAL = "partial"
+    FAILED = "failed"
+
+
+class EventLogCache(CacheABC):
+    """
+    Event cache backed by an append-only log of json lines, one per status change.
+
+    Events are held in an insertion ordered dict so membership checks are O(1)
+    while the order events were first seen is kept for display. Every status
+    change is appended to the log straight away, so checkpointing an event
+    doesn't rewrite the whole cache. Replaying the log keeps the last status
+    recorded for each event. Only scraped events count as cached, failed and
+    partial events are scraped again on the next run.
+
+    The log also records once every past event has been scraped at least once, so
+    later runs know they only need to look for events newer than the cached ones.
+    Until then an interrupted backfill is resumed by listing every event again.
+    """
+
+    EVENT_KEY: str = "event"
+    STATUS_KEY: str = "status"
+    HISTORY_COMPLETE_KEY: str = "history_complete"
+
+    def __init__(self, log_path: Path, legacy_json_path: Optional[Path] = None):
+        """
+        Initialises the cache and replays the log saved to disk.
+
+        Args:
+            log_path (Path): json lines file the status changes are appended to.
+            legacy_json_path (Optional[Path], optional): JSONCache file imported as
+                scraped events when the log doesn't exist yet. Defaults to None.
+        """
+        self.log_path = log_path
+        self.legacy_json_path = legacy_json_path
+        self._events: Dict[str, EventStatus] = {}
+        self.history_complete: bool = False
+
+        self.instantiate()
+
+    def instantiate(self) -> None:
+        if not self.log_path.exists():
+            if self.legacy_json_path is not None:
+                for event_link in JSONCache(self.legacy_json_path).get():
+                    self._events[event_link] = EventStatus.SCRAPED
+                if self._events:
+                    self.write()
+            return
+
+        with open(self.log_path, "r") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-append can only leave the last line incomplete.
+                    continue
+                if self.HISTORY_COMPLETE_KEY in entry:
+                    self.history_complete = entry[self.HISTORY_COMPLETE_KEY]
+                    continue
+                self._events[entry[self.EVENT_KEY]] = EventStatus(
+                    entry[self.STATUS_KEY]
+                )
+
+    def __contains__(self, event_link: object) -> bool:
+        return self._events.get(event_link) == EventStatus.SCRAPED
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.get())
+
+    def __len__(self) -> int:
+        return sum(status == EventStatus.SCRAPED for status in self._events.values())
+
+    def get(self, status: EventStatus = EventStatus.SCRAPED) -> List[str]:
+        """
+        Returns the events with the given status in the order they were first seen.
+        """
+        return [
+            event_link
+            for event_link, event_status in self._events.items()
+            if event_status == status
+        ]
+
+    def status(self, event_link: str) -> Optional[EventStatus]:
+        return self._events.get(event_link)
+
+    @property
+    def to_retry(self) -> List[str]:
+        """
+        The partial and failed events, scraped again on the next run.
+        """
+        return self.get(EventStatus.PARTIAL) + self.get(EventStatus.FAILED)
+
+    def mark(self, event_link: str, status: EventStatus) -> None:
+        """
+        Records the status of an event and appends it to the log.
+        """
+        if self._events.get(event_link) == status:
+            return
+        self._events[event_link] = status
+
+        self._append({self.EVENT_KEY: event_link, self.STATUS_KEY: str(status)})
+
+    def mark_history_complete(self) -> None:
+        """
+        Records that every past event has been scraped, or attempted and marked to retry.
+        """
+        if self.history_complete:
+            return
+        self.history_complete = True
+        self._append({self.HISTORY_COMPLETE_KEY: True})
+
+    def _append(self, entry: Dict[str, object]) -> None:
+        with open(self.log_path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            str(status): sum(
+                event_status == status for event_status in self._events.values()
+            )
+            for status in EventStatus
+        }
+
+    def write(self, cache: Optional[List[str]] = None) -> None:
+        """
+        Compacts the log to a single line per event.
+
+        Args:
+            cache (Optional[List[str]], optional): events to mark as scraped first. Defaults to None.
+        """
+        for event_link in cache or []:
+            self._events[event_link] = EventStatus.SCRAPED
+
+        tmp_path = self.log_path.with_name(self.log_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            for event_link, status in self._events.items():
+                entry = {self.EVENT_KEY: event_link, self.STATUS_KEY: str(status)}
+                f.write(json.dumps(entry) + "\n")
+            if self.history_complete:
+                f.write(json.dumps({self.HISTORY_COMPLETE_KEY: True}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.log_path)
@@ -0,0 +1,234 @@
+"""
+Module to cache the fighter profiles scraped during a run.
+"""
+
+import asyncio
+import hashlib
+import time
+from enum import StrEnum
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import pandas as pd
+
+from src.config import ScraperSettings
+
+
+class ProfileRefresh(StrEnum):
+    """
+    Outcome of revalidating a cached fighter profile.
+    """
+
+    # The host answered 304 to the conditional request.
+    NOT_MODIFIED = "not_modified"
+    # The page was sent again but its content hash hadn't changed, so it wasn't parsed.
+    UNCHANGED = "unchanged"
+    UPDATED = "updated"
+    FAILED = "failed"
+
+
+class FighterProfileCache:
+    """
+    In-memory cache of fighter profiles keyed by the profile URL and backed by a csv file.
+
+    Profiles are stored without a corner prefix so the same entry can be used
+    whether the fighter is in the red or blue corner. Entries older than the ttl
+    are treated as missing so records and career stats are refreshed.
+
+    Alongside each profile the cache keeps the validators of the page it was parsed
+    from (etag, last_modified and a content hash) so it can be revalidated cheaply.
+    """
+
+    URL_COLUMN: str = "url"
+    FETCHED_AT_COLUMN: str = "fetched_at"
+    ETAG_COLUMN: str = "etag"
+    LAST_MODIFIED_COLUMN: str = "last_modified"
+    CONTENT_HASH_COLUMN: str = "content_hash"
+    VALIDATOR_COLUMNS: List[str] = [
+        ETAG_COLUMN,
+        LAST_MODIFIED_COLUMN,
+        CONTENT_HASH_COLUMN,
+    ]
+
+    def __init__(
+        self,
+        csv_path: Optional[Path] = None,
+        ttl: Optional[float] = ScraperSettings.FIGHTER_PROFILE_TTL,
+    ) -> None:
+        """
+        Initialises the cache and loads any profiles already saved to disk.
+
+        Args:
+            csv_path (Optional[Path], optional): file the cache is persisted to.
+                Defaults to None, in which case the cache only lives in memory.
+            ttl (Optional[float], optional): seconds before a profile is refetched.
+                None means profiles never expire.
+        """
+        self.csv_path = csv_path
+        self.ttl = ttl
+
+        self._profiles: Dict[str, Dict[str, str]] = {}
+        self._fetched_at: Dict[str, float] = {}
+        self._validators: Dict[str, Dict[str, str]] = {}
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+        self.instantiate()
+
+    def instantiate(self) -> None:
+        """
+        Loads the profiles saved to disk. Values are kept as strings so cached
+        profiles are identical to freshly scraped ones.
+        """
+        if self.csv_path is None:
+            return
+        try:
+            df = pd.read_csv(self.csv_path, dtype=str, keep_default_na=False)
+        except (FileNotFoundError, pd.errors.EmptyDataError):
+            return
+
+        for record in df.to_dict(orient="records"):
+            url = record.pop(self.URL_COLUMN)
+            fetched_at = float(record.pop(self.FETCHED_AT_COLUMN))
+            # Caches written before validators were kept don't have these columns.
+            validators = {
+                column: record.pop(column, "") for column in self.VALIDATOR_COLUMNS
+            }
+            # Columns are the union of all profiles, drop the ones this profile didn't have.
+            profile = {key: value for key, value in record.items() if value != ""}
+            self.put(url, profile, fetched_at)
+            self.set_validators(url, validators)
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def __contains__(self, url: str) -> bool:
+        return self.get(url) is not None
+
+    @property
+    def urls(self) -> List[str]:
+        return list(self._profiles)
+
+    def is_stale(self, url: str) -> bool:
+        if url not in self._fetched_at:
+            return True
+        if self.ttl is None:
+            return False
+        return time.time() - self._fetched_at[url] > self.ttl
+
+    def get(self, url: str) -> Optional[Dict[str, str]]:
+        """
+        Returns a copy of the cached profile, or None if it is missing or stale.
+        """
+        if self.is_stale(url):
+            return None
+        return dict(self._profiles[url])
+
+    def put(
+        self, url: str, profile: Dict[str, str], fetched_at: Optional[float] = None
+    ) -> None:
+        self._profiles[url] = dict(profile)
+        self._fetched_at[url] = time.time() if fetched_at is None else fetched_at
+
+    def touch(self, url: str) -> None:
+        """
+        Marks a cached profile as fetched now, after revalidating it showed no changes.
+        """
+        if url in self._profiles:
+            self._fetched_at[url] = time.time()
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """
+        Returns the validators of the page the profile was parsed from.
+        """
+        return dict(self._validators.get(url, {}))
+
+    def set_validators(self, url: str, validators: Dict[str, str]) -> None:
+        self._validators[url] = {
+            key: value for key, value in validators.items() if value
+        }
+
+    @staticmethod
+    def content_hash(html: str) -> str:
+        return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+    def invalidate(self, url: Optional[str] = None) -> None:
+        """
+        Removes a single profile from the cache, or every profile if no url is given.
+        """
+        if url is None:
+            self._profiles.clear()
+            self._fetched_at.clear()
+            self._validators.clear()
+        else:
+            self._profiles.pop(url, None)
+            self._fetched_at.pop(url, None)
+            self._validators.pop(url, None)
+
+    async def get_or_fetch(
+        self, url: str, fetch: Callable[[], Awaitable[Dict[str, str]]]
+    ) -> Dict[str, str]:
+        """
+        Returns the cached profile for the url, calling fetch if it is missing or stale.
+        Concurrent calls for the same url while a fetch is running share its result.
+
+        Args:
+            url (str): URL of the fighter profile.
+            fetch (Callable[[], Awaitable[Dict[str, str]]]): coroutine function that scrapes the profile.
+
+        Returns:
+            Dict[str, str]: the fighter profile, without a corner prefix.
+        """
+        profile = self.get(url)
+        if profile is not None:
+            self.hits += 1
+            return profile
+
+        if url in self._in_flight:
+            self.coalesced += 1
+            return dict(await asyncio.shield(self._in_flight[url]))
+
+        self.misses += 1
+        task = asyncio.ensure_future(fetch())
+        self._in_flight[url] = task
+        try:
+            # Shielded so a cancelled caller doesn't cancel the fetch for everyone waiting on it.
+            profile = await asyncio.shield(task)
+            self.put(url, profile)
+        finally:
+            del self._in_flight[url]
+
+        return dict(profile)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "size": len(self._profiles),
+        }
+
+    def write(self) -> None:
+        """
+        Writes every cached profile to the csv file.
+        """
+        if self.csv_path is None:
+            return
+
+        records = [
+            {
+                self.URL_COLUMN: url,
+                self.FETCHED_AT_COLUMN: self._fetched_at[url],
+                **{
+                    column: self._validators.get(url, {}).get(column, "")
+                    for column in self.VALIDATOR_COLUMNS
+                },
+                **profile,
+            }
+            for url, profile in self._profiles.items()
+        ]
+        pd.DataFrame(records).to_csv(self.csv_path, index=False)
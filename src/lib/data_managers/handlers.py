@@ -1,9 +1,18 @@
+import os
+import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional, Sequence, Set
 
 import pandas as pd
 
+from src.lib.preprocessing.keys import bout_keys
+
+from .storage import CSVStorage, StorageBackendABC
+
+# The raw columns a bout's key is built from, see bout_keys.
+BOUT_KEY_COLUMNS: List[str] = ["date", "red_Fighter", "blue_Fighter"]
+
 
 class ProcessingHandlerABC(ABC):
 
@@ -28,16 +37,75 @@ class ProcessingHandlerABC(ABC):
         """
         pass
 
+    def flush(self) -> None:
+        """
+        Persists the rows added so far. Called after each card is scraped.
+        Processors that only write at the end don't need to implement it.
+        """
+        pass
+
 
 class CSVProcessingHandler(ProcessingHandlerABC):
-    def __init__(self, csv_path: Path, allow_creation: bool = False):
-        self.csv_path = csv_path
+    def __init__(
+        self,
+        csv_path: Path,
+        allow_creation: bool = False,
+        storage: Optional[StorageBackendABC] = None,
+        columns: Optional[Sequence[str]] = None,
+    ):
+        """
+        Args:
+            csv_path (Path): path to the dataset, the suffix is set by the storage backend.
+            allow_creation (bool, optional): create an empty dataframe if the file doesn't exist.
+            storage (Optional[StorageBackendABC], optional): format the dataset is stored in. Defaults to csv.
+            columns (Optional[Sequence[str]], optional): only load these columns. Defaults to all of them.
+        """
+        self.storage = storage if storage is not None else CSVStorage()
+        self.csv_path = self.storage.resolve(csv_path)
         self.allow_creation = allow_creation
-        self.df: pd.DataFrame = self.instantiate()
+        self.columns = columns
+
+        # Rows added since the dataframe was last built. Appending a dict is cheap,
+        # concatenating a one row dataframe per bout is quadratic in the number of rows.
+        self._pending_rows: List[Dict[str, str]] = []
+        self._rows_lock = threading.Lock()
+
+        self.df = self.instantiate()
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """
+        The data as a dataframe, including any rows added since it was last accessed.
+        """
+        if self._pending_rows:
+            self._materialise_rows()
+        return self._df
+
+    @df.setter
+    def df(self, data_frame: pd.DataFrame) -> None:
+        with self._rows_lock:
+            self._pending_rows = []
+            self._df = data_frame
+
+    def _materialise_rows(self) -> None:
+        """
+        Builds the pending rows into a dataframe in one go and appends it to the existing data.
+        Columns keep the order they were first seen in, new columns are added at the end.
+        """
+        with self._rows_lock:
+            if not self._pending_rows:
+                return
+            rows_df = pd.DataFrame(self._pending_rows, dtype=object)
+            self._pending_rows = []
+
+            if self._df.empty and len(self._df.columns) == 0:
+                self._df = rows_df
+            else:
+                self._df = pd.concat([self._df, rows_df], ignore_index=True)
 
     def instantiate(self) -> pd.DataFrame:
         """
-        Method to load the csv file into a dataframe.
+        Method to load the file into a dataframe using the storage backend.
         Handles cases where file does not exist with two options:
         1. If allow_creation is True, creates an empty dataframe. For cases where the existance of the file is not necessary.
         2. If allow_creation is False, raises a FileNotFoundError. For cases where the existance of the file is necessary.
@@ -49,7 +117,7 @@ class CSVProcessingHandler(ProcessingHandlerABC):
             pd.DataFrame: the csv file as a dataframe (or the newly created empty dataframe)
         """
         try:
-            data_frame: pd.DataFrame = pd.read_csv(self.csv_path)
+            data_frame: pd.DataFrame = self.storage.read(self.csv_path, self.columns)
         except FileNotFoundError as exc:
             if self.allow_creation:
                 data_frame = pd.DataFrame()
@@ -61,11 +129,134 @@ class CSVProcessingHandler(ProcessingHandlerABC):
         return data_frame
 
     def add_row(self, row: Dict[str, str]):
-        row_df = pd.DataFrame.from_dict(row, orient="index").T
-        self.df = pd.concat([self.df, row_df], ignore_index=True)
+        """
+        Buffers a row to be added to the dataframe. Safe to call from concurrent scraping tasks.
+        """
+        with self._rows_lock:
+            self._pending_rows.append(dict(row))
 
     def write(self):
         """
-        Method to write the dataframe to a csv file.
+        Method to write the dataframe to a file using the storage backend.
+        """
+        self.storage.write(self.df, self.csv_path)
+
+
+class StreamingCSVProcessingHandler(ProcessingHandlerABC):
+    """
+    Appends rows to the csv file as each card completes rather than holding the
+    whole dataset in memory and rewriting the file at the end of a run.
+
+    Each flush is appended and fsynced before returning, so once a card's rows
+    have been flushed they survive the process dying. Bouts already in the file are
+    skipped, so a card scraped again after a crash (flushed but not yet marked as
+    scraped in the event cache) isn't appended twice.
+    """
+
+    def __init__(self, csv_path: Path) -> None:
+        self.csv_path = csv_path
+
+        self._pending_rows: List[Dict[str, str]] = []
+        self._rows_lock = threading.Lock()
+
+        self.columns: List[str] = self.instantiate()
+        self._stored_keys: Set[str] = self._read_stored_keys()
+
+    def instantiate(self) -> List[str]:
+        """
+        Reads only the header of the existing file, the rows are never loaded.
+
+        Returns:
+            List[str]: the columns of the existing file, empty if there is no file yet.
+        """
+        try:
+            return pd.read_csv(self.csv_path, nrows=0).columns.tolist()
+        except (FileNotFoundError, pd.errors.EmptyDataError):
+            return []
+
+    def _read_stored_keys(self) -> Set[str]:
+        """
+        The keys of the bouts already in the file, reading only the key columns.
+        """
+        if not set(BOUT_KEY_COLUMNS).issubset(self.columns):
+            return set()
+        keys_df = pd.read_csv(self.csv_path, usecols=BOUT_KEY_COLUMNS, dtype=str)
+        return set(bout_keys(keys_df).dropna())
+
+    def _drop_stored_bouts(self, rows_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Drops the rows of bouts already in the file or earlier in the rows.
+        Rows without a date and both fighters are always kept.
+        """
+        if not set(BOUT_KEY_COLUMNS).issubset(rows_df.columns):
+            return rows_df
+        keys = bout_keys(rows_df)
+        stored = keys.notna() & (keys.isin(self._stored_keys) | keys.duplicated())
+        self._stored_keys.update(keys[~stored].dropna())
+        return rows_df[~stored]
+
+    def add_row(self, row: Dict[str, str]):
+        """
+        Buffers a row until the next flush. Safe to call from concurrent scraping tasks.
+        """
+        with self._rows_lock:
+            self._pending_rows.append(dict(row))
+
+    def flush(self) -> None:
+        """
+        Appends the buffered rows to the csv file.
+        If the rows contain columns the file doesn't have yet, the file is rewritten with
+        the new columns first.
+        """
+        with self._rows_lock:
+            rows = self._pending_rows
+            self._pending_rows = []
+        if not rows:
+            return
+
+        rows_df = self._drop_stored_bouts(pd.DataFrame(rows, dtype=object))
+        if rows_df.empty:
+            return
+
+        new_columns = [
+            column for column in rows_df.columns if column not in self.columns
+        ]
+
+        if self.columns and new_columns:
+            self._rewrite_with_columns(self.columns + new_columns)
+
+        write_header = not self.columns
+        if write_header:
+            self.columns = rows_df.columns.tolist()
+
+        data = rows_df.reindex(columns=self.columns).to_csv(
+            index=False, header=write_header
+        )
+        with open(self.csv_path, "a", newline="") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _rewrite_with_columns(self, columns: List[str]) -> None:
+        """
+        Rewrites the existing file with extra (empty) columns.
+        Written to a temporary file and renamed over the original so a crash
+        part way through never leaves a half written file behind.
+
+        Args:
+            columns (List[str]): the full list of columns in their new order.
+        """
+        existing_df = pd.read_csv(self.csv_path, dtype=str, keep_default_na=False)
+        tmp_path = self.csv_path.with_name(self.csv_path.name + ".tmp")
+        with open(tmp_path, "w", newline="") as f:
+            existing_df.reindex(columns=columns, fill_value="").to_csv(f, index=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.csv_path)
+        self.columns = columns
+
+    def write(self) -> None:
+        """
+        Appends any rows not yet flushed.
         """
-        self.df.to_csv(self.csv_path, index=False)
+        self.flush()
@@ -0,0 +1,113 @@
+"""
+Module to handle how each stage's datasets are stored on disk.
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Type
+
+import pandas as pd
+
+from src.lib.constants.columns import CATEGORICAL_COLUMNS
+
+
+class StorageBackendABC(ABC):
+    """
+    Abstract base class for the file formats a dataset can be stored in.
+    Paths are given with any suffix and resolved to the backend's own.
+    """
+
+    suffix: str
+
+    def resolve(self, path: Path) -> Path:
+        """
+        Returns the path with the suffix for this storage format.
+        """
+        return path.with_suffix(self.suffix)
+
+    @abstractmethod
+    def read(self, path: Path, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Reads the dataset, optionally only the given columns (in the given order).
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        pass
+
+    @abstractmethod
+    def write(self, df: pd.DataFrame, path: Path) -> None:
+        pass
+
+
+class CSVStorage(StorageBackendABC):
+    """
+    Plain csv files. Every value is parsed from text each time the file is read.
+    """
+
+    suffix = ".csv"
+
+    def read(self, path: Path, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        df = pd.read_csv(self.resolve(path), usecols=columns)
+        # usecols keeps the file's column order, match the order that was asked for.
+        return df[list(columns)] if columns is not None else df
+
+    def write(self, df: pd.DataFrame, path: Path) -> None:
+        df.to_csv(self.resolve(path), index=False)
+
+
+class ParquetStorage(StorageBackendABC):
+    """
+    Columnar parquet files written with pyarrow.
+    Dtypes (datetimes, floats, categoricals) are kept as they were written and
+    columns can be read on their own without parsing the rest of the file.
+    """
+
+    suffix = ".parquet"
+
+    def __init__(self, categorical_columns: Sequence[str] = CATEGORICAL_COLUMNS):
+        """
+        Args:
+            categorical_columns (Sequence[str]): low cardinality string columns stored as categoricals.
+        """
+        self.categorical_columns = categorical_columns
+
+    def read(self, path: Path, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        return pd.read_parquet(
+            self.resolve(path),
+            columns=list(columns) if columns is not None else None,
+            engine="pyarrow",
+        )
+
+    def write(self, df: pd.DataFrame, path: Path) -> None:
+        categorical_columns: List[str] = [
+            column
+            for column in self.categorical_columns
+            if column in df.columns and df[column].dtype == object
+        ]
+        df = df.astype({column: "category" for column in categorical_columns})
+        df.to_parquet(self.resolve(path), index=False, engine="pyarrow")
+
+
+STORAGE_BACKENDS: Dict[str, Type[StorageBackendABC]] = {
+    "csv": CSVStorage,
+    "parquet": ParquetStorage,
+}
+
+
+def get_storage(name: str) -> StorageBackendABC:
+    """
+    Returns the storage backend registered under the given name.
+
+    Args:
+        name (str): name of the backend, one of STORAGE_BACKENDS.
+
+    Raises:
+        ValueError: If no backend is registered under the name.
+    """
+    try:
+        return STORAGE_BACKENDS[name]()
+    except KeyError as exc:
+        raise ValueError(
+            f"Unknown storage backend '{name}', choose from {list(STORAGE_BACKENDS)}"
+        ) from exc
@@ -1,3 +1,3 @@
 from .scraping import ScrapingEngine
-from .data_cleaning import DataCleaningEngine
+from .data_cleaning import DataCleaningEngine, IncrementalDataCleaningEngine
 from .preprocessing import PreprocessingEngine
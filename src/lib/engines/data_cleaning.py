@@ -2,13 +2,28 @@
 Module responsible for cleaning the raw data scraped from the web.
 """
 
-from typing import List, Type
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple, Type
 from pathlib import Path
 
-from src.lib.data_managers import CSVProcessingHandler
-from src.config import PathSettings
+import numpy as np
+import pandas as pd
+from rich.console import Console
+
+from src.lib.data_managers import (
+    CSVProcessingHandler,
+    StorageBackendABC,
+    get_storage,
+)
+from src.config import PathSettings, StorageSettings
 
 from src.lib.preprocessing.cleaners.abstract import CleanerABC
+from src.lib.preprocessing.keys import bout_keys, drop_duplicate_bouts
+
+console = Console()
+
+CleanerStates = Dict[str, Dict[str, Any]]
 
 
 class DataCleaningEngine(CSVProcessingHandler):
@@ -19,24 +34,201 @@ class DataCleaningEngine(CSVProcessingHandler):
         CSVProcessingHandler: Class containing functionality for all csv data.
     """
 
-    def __init__(self, csv_path: Path, allow_creation: bool = False) -> None:
-        super().__init__(csv_path, allow_creation)
+    def __init__(
+        self,
+        csv_path: Path,
+        allow_creation: bool = False,
+        storage: Optional[StorageBackendABC] = None,
+    ) -> None:
+        super().__init__(csv_path, allow_creation, storage)
 
         # Additional flag for where an error occurs during scraping and data isn't saved
         if (not allow_creation) and (self.df.empty):
             raise ValueError("DataFrame must not be empty")
 
     def clean_raw_data(self, cleaners: List[Type[CleanerABC]]):
-        for cleaner in cleaners:
-            self.df = cleaner(self.df).clean()
+        self.df, _ = self._run_cleaners(drop_duplicate_bouts(self.df), cleaners)
 
-        self.df.to_csv(PathSettings.CLEAN_DATA_CSV, index=False)
+        get_storage(StorageSettings.CLEAN_DATA).write(
+            self.df, PathSettings.CLEAN_DATA_CSV
+        )
+
+    @staticmethod
+    def _run_cleaners(
+        df: pd.DataFrame,
+        cleaners: List[Type[CleanerABC]],
+        states: Optional[CleanerStates] = None,
+    ) -> Tuple[pd.DataFrame, CleanerStates]:
+        """
+        Runs each cleaner over the dataframe in turn, starting each from its saved state.
+
+        Returns:
+            Tuple[pd.DataFrame, CleanerStates]: the cleaned dataframe and each cleaner's
+                state afterwards, by cleaner name.
+        """
+        states = dict(states or {})
+        for cleaner_type in cleaners:
+            cleaner = cleaner_type(df, state=states.get(cleaner_type.__name__))
+            df = cleaner.clean()
+            states[cleaner_type.__name__] = cleaner.state
+        return df, states
 
     def clean_next_event(self, cleaners: List[Type[CleanerABC]]):
         for cleaner in cleaners:
             self.df = cleaner(self.df).clean_next_event()
 
-        self.df.to_csv(PathSettings.NEXT_EVENT_CSV, index=False)
+        get_storage(StorageSettings.NEXT_EVENT).write(
+            self.df, PathSettings.NEXT_EVENT_CSV
+        )
 
     def get_fights_per_fighter(self):
         return self.df["red_fighter"].append(self.df["blue_fighter"]).value_counts()
+
+
+class IncrementalDataCleaningEngine(DataCleaningEngine):
+    """
+    Cleans only the raw bouts that weren't cleaned on a previous run and merges them
+    into the existing clean dataset.
+
+    A state file records the key of every raw bout already cleaned (including ones
+    the cleaners dropped) and each cleaner's state, e.g. the running weight class
+    totals behind the height/reach averages. After the new bouts are cleaned each
+    cleaner refreshes the merged data, so the result matches cleaning every bout
+    from scratch.
+
+    Falls back to a full clean when there is no usable state or clean dataset, when
+    bouts have been removed from the raw data, or when the new bouts clean into
+    different columns than the existing data.
+    """
+
+    PROCESSED: str = "processed"
+    CLEANERS: str = "cleaners"
+
+    def __init__(
+        self,
+        csv_path: Path,
+        storage: Optional[StorageBackendABC] = None,
+        clean_path: Path = PathSettings.CLEAN_DATA_CSV,
+        clean_storage: Optional[StorageBackendABC] = None,
+        state_path: Path = PathSettings.CLEANING_STATE_JSON,
+    ) -> None:
+        """
+        Args:
+            csv_path (Path): the raw data.
+            storage (Optional[StorageBackendABC]): storage backend of the raw data.
+            clean_path (Path): the clean dataset to merge new bouts into.
+            clean_storage (Optional[StorageBackendABC]): storage backend of the clean dataset.
+            state_path (Path): json file holding the processed bouts and cleaner states.
+        """
+        super().__init__(csv_path, allow_creation=False, storage=storage)
+        self.clean_path = clean_path
+        self.clean_storage = clean_storage or get_storage(StorageSettings.CLEAN_DATA)
+        self.state_path = state_path
+
+    def clean_raw_data(self, cleaners: List[Type[CleanerABC]]):
+        # A card appended to the raw data twice would otherwise be merged twice.
+        self.df = drop_duplicate_bouts(self.df)
+        raw_keys: pd.Series = bout_keys(self.df)
+        state: Optional[Dict[str, Any]] = self._load_state()
+        clean_df: Optional[pd.DataFrame] = self._load_clean_data()
+
+        if state is None or clean_df is None:
+            console.log("No previous clean found, cleaning all bouts")
+            self._clean_all(cleaners, raw_keys)
+            return
+
+        processed: List[str] = state[self.PROCESSED]
+        cleaner_names = {cleaner.__name__ for cleaner in cleaners}
+        if set(state[self.CLEANERS]) != cleaner_names:
+            console.log(
+                "Cleaners have changed since the last clean, cleaning all bouts"
+            )
+            self._clean_all(cleaners, raw_keys)
+            return
+        if not set(processed).issubset(raw_keys):
+            console.log("Bouts were removed from the raw data, cleaning all bouts")
+            self._clean_all(cleaners, raw_keys)
+            return
+
+        new_rows: pd.Series = ~raw_keys.isin(processed)
+        if not new_rows.any():
+            console.log("No new bouts to clean")
+            return
+
+        new_df, states = self._run_cleaners(
+            self.df[new_rows].copy(), cleaners, state[self.CLEANERS]
+        )
+        if set(new_df.columns) != set(clean_df.columns):
+            console.log("New bouts clean into different columns, cleaning all bouts")
+            self._clean_all(cleaners, raw_keys)
+            return
+
+        self.df = self._merge(clean_df, new_df, raw_keys)
+        for cleaner_type in cleaners:
+            self.df = cleaner_type(
+                self.df, state=states[cleaner_type.__name__]
+            ).refresh()
+
+        self._save(
+            states, processed + raw_keys[new_rows].tolist(), n_new=int(new_rows.sum())
+        )
+
+    def _clean_all(self, cleaners: List[Type[CleanerABC]], raw_keys: pd.Series) -> None:
+        self.df, states = self._run_cleaners(self.df, cleaners)
+        self._save(states, raw_keys.tolist(), n_new=len(raw_keys))
+
+    def _merge(
+        self, clean_df: pd.DataFrame, new_df: pd.DataFrame, raw_keys: pd.Series
+    ) -> pd.DataFrame:
+        """
+        Appends the newly cleaned bouts to the clean data, ordered as they are in the raw data.
+        """
+        new_df = new_df[clean_df.columns]
+        # Csv files don't keep dtypes (dates, int16/float32 stats), cast the existing
+        # data back to the dtypes the cleaners give.
+        clean_df = clean_df.astype(
+            {
+                column: new_df[column].dtype
+                for column in new_df.columns
+                if new_df[column].dtype != object
+                and new_df[column].dtype != clean_df[column].dtype
+            }
+        )
+
+        merged: pd.DataFrame = pd.concat([clean_df, new_df], ignore_index=True)
+        raw_positions: np.ndarray = pd.Index(raw_keys).get_indexer(bout_keys(merged))
+        return merged.iloc[np.argsort(raw_positions, kind="stable")].reset_index(
+            drop=True
+        )
+
+    def _load_clean_data(self) -> Optional[pd.DataFrame]:
+        try:
+            return self.clean_storage.read(self.clean_path)
+        except FileNotFoundError:
+            return None
+
+    def _load_state(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.state_path, "r") as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if self.PROCESSED not in state or self.CLEANERS not in state:
+            return None
+        return state
+
+    def _save(self, states: CleanerStates, processed: List[str], n_new: int) -> None:
+        """
+        Writes the clean data, then the state. The state is written last so that if
+        writing the data fails the next run cleans these bouts again.
+        """
+        self.clean_storage.write(self.df, self.clean_path)
+
+        tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({self.PROCESSED: processed, self.CLEANERS: states}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.state_path)
+
+        console.log(f"Cleaned {n_new} bouts, {len(self.df)} bouts in the clean data")
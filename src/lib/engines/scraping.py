@@ -1,25 +1,40 @@
-from typing import List, Dict
+import asyncio
+from typing import List, Dict, Optional
 from rich.console import Console
 
-from src.lib.exceptions import ScrapingException
+from src.config import PathSettings
+from src.lib.exceptions import PartialCardException, ScrapingException
 from src.lib.data_managers.handlers import ProcessingHandlerABC
-from src.lib.scrapers import CardScraper, BoutScraper, FighterScraper, HomepageScraper
+from src.lib.data_managers.fighter_cache import FighterProfileCache, ProfileRefresh
+from src.lib.networking import SessionManager
+from src.lib.scrapers import CardScraper, BoutScraper, FighterScraper, ParsingPool
 
 console = Console()
 
 
 class ScrapingEngine:
-    def __init__(self):
-        pass
+    def __init__(
+        self,
+        fighter_cache: Optional[FighterProfileCache] = None,
+        parsing_pool: Optional[ParsingPool] = None,
+    ):
+        # Fighters appear in many bouts, so each profile is only scraped once per run.
+        self.fighter_cache = (
+            fighter_cache
+            if fighter_cache is not None
+            else FighterProfileCache(PathSettings.FIGHTER_PROFILE_CACHE_CSV)
+        )
+        # Pages are fetched on the event loop and parsed in worker processes.
+        self.parsing_pool = parsing_pool if parsing_pool is not None else ParsingPool()
 
     def run(
         self,
         link_to_event: str,
-        homepage: HomepageScraper,
         raw_data_processor: ProcessingHandlerABC,
+        session: Optional[SessionManager] = None,
     ):
         try:
-            return self.scrape_card(link_to_event, homepage, raw_data_processor)
+            return self.scrape_card(link_to_event, raw_data_processor, session)
         except ScrapingException as e:
             console.log(e)
             raise e
@@ -27,36 +42,63 @@ class ScrapingEngine:
     async def scrape_card(
         self,
         link_to_event: str,
-        homepage: HomepageScraper,
         raw_data_processor: ProcessingHandlerABC,
+        session: Optional[SessionManager] = None,
     ):
         # Instantiate the card scraper and get the event details.
-        fight_card = CardScraper(link_to_event)
+        fight_card = CardScraper(
+            link_to_event, session=session, parsing_pool=self.parsing_pool
+        )
         event_name, date, location, fight_links = await fight_card.scrape_url()
 
         self._display_event_details(event_name, date, location, fight_links)
 
-        # Iterate through each fight on the card and scrape the data.
+        # Scrape every fight on the card concurrently, the session bounds the requests in flight.
+        results = await asyncio.gather(
+            *(
+                self.scrape_fight(fight, date, location, session)
+                for fight in fight_links
+            ),
+            return_exceptions=True,
+        )
+
+        # Only add the card once every fight succeeded, in the order they appear on the card.
+        failed_fights = [
+            fight
+            for fight, result in zip(fight_links, results)
+            if isinstance(result, BaseException)
+        ]
+        if failed_fights:
+            raise PartialCardException(
+                f"Failed to scrape {len(failed_fights)} of {len(fight_links)} fights on {link_to_event}: {failed_fights}"
+            )
 
-        for fight in fight_links:
-            try:
-                full_fight_details = await self.scrape_fight(fight, date, location)
-                raw_data_processor.add_row(full_fight_details)
-            except Exception:
-                raise ScrapingException(f"Failed to scrape {fight}")
+        for full_fight_details in results:
+            raw_data_processor.add_row(full_fight_details)
 
         console.rule("", style="black")
-        homepage.cache.append(link_to_event)
         console.log(f"Finished scraping {link_to_event}")
 
     async def scrape_fight(
-        self, fight: str, date: str, location: str
+        self,
+        fight: str,
+        date: str,
+        location: str,
+        session: Optional[SessionManager] = None,
     ) -> Dict[str, str]:
-        bout: BoutScraper = BoutScraper(url=fight, date=date, location=location)
+        bout: BoutScraper = BoutScraper(
+            url=fight,
+            date=date,
+            location=location,
+            session=session,
+            parsing_pool=self.parsing_pool,
+        )
         try:
             full_bout_details, fighter_links = await bout.scrape_url()
 
-            fighter_profiles: Dict[str, str] = await self.scrape_fighter(fighter_links)
+            fighter_profiles: Dict[str, str] = await self.scrape_fighter(
+                fighter_links, session
+            )
         except Exception:
             raise ScrapingException(f"Failed to scrape {fight}")
 
@@ -82,12 +124,15 @@ class ScrapingEngine:
             justify="center",
         )
 
-    async def scrape_fighter(self, fighter_links: List[str]) -> Dict[str, str]:
+    async def scrape_fighter(
+        self, fighter_links: List[str], session: Optional[SessionManager] = None
+    ) -> Dict[str, str]:
         """
         Method responsible for extracting the fighter profiles from the bout and formating them.
 
         Args:
             fighter_links (List[str]): URLS to all found fighter profiles
+            session (Optional[SessionManager], optional): shared session to make requests with.
 
         Returns:
             Dict[str, str]: All extracted info as a dictionary. keys prefixed by corner of each fighter.
@@ -95,13 +140,15 @@ class ScrapingEngine:
 
         assert len(fighter_links) >= 2, "There should be two fighters per bout."
 
-        # Create object to extract info for each corner.
-        red_fighter = FighterScraper(fighter_links[0], red_corner=True)
-        blue_fighter = FighterScraper(fighter_links[1], red_corner=False)
-
-        # Scrape the info for each fighter.
-        red_fighter_profile: Dict[str, str] = await red_fighter.scrape_url()
-        blue_fighter_profile: Dict[str, str] = await blue_fighter.scrape_url()
+        # Scrape both corners concurrently, using the cached profile where possible.
+        red_fighter_profile, blue_fighter_profile = await asyncio.gather(
+            self._get_fighter_profile(
+                fighter_links[0], red_corner=True, session=session
+            ),
+            self._get_fighter_profile(
+                fighter_links[1], red_corner=False, session=session
+            ),
+        )
 
         # Combine the two dictionaries into one.
         fighter_profiles: Dict[str, str] = {
@@ -110,3 +157,125 @@ class ScrapingEngine:
         }
 
         return fighter_profiles
+
+    async def _get_fighter_profile(
+        self,
+        fighter_link: str,
+        red_corner: bool,
+        session: Optional[SessionManager] = None,
+    ) -> Dict[str, str]:
+        """
+        Gets a single fighter's profile from the cache, scraping it if it isn't cached.
+
+        Args:
+            fighter_link (str): URL to the fighter's profile.
+            red_corner (bool): whether the fighter is in the red corner for the bout.
+            session (Optional[SessionManager], optional): shared session to make requests with.
+
+        Returns:
+            Dict[str, str]: the fighter's profile with keys prefixed by their corner.
+        """
+        fighter = FighterScraper(
+            fighter_link,
+            red_corner=red_corner,
+            session=session,
+            parsing_pool=self.parsing_pool,
+        )
+
+        async def fetch() -> Dict[str, str]:
+            html, validators = await fighter.fetch_if_modified()
+            profile: Dict[str, str] = await fighter.parse_page(html)  # type: ignore
+            # Kept so the profile can be revalidated by refresh_fighter_profiles.
+            self.fighter_cache.set_validators(
+                fighter_link,
+                {
+                    **validators,
+                    FighterProfileCache.CONTENT_HASH_COLUMN: FighterProfileCache.content_hash(
+                        html  # type: ignore
+                    ),
+                },
+            )
+            return self._strip_prefix(profile, fighter.prefix)
+
+        profile = await self.fighter_cache.get_or_fetch(fighter_link, fetch)
+        return {fighter.prefix + key: value for key, value in profile.items()}
+
+    @staticmethod
+    def _strip_prefix(profile: Dict[str, str], prefix: str) -> Dict[str, str]:
+        """
+        Cache is corner agnostic so the prefix is removed before storing.
+        """
+        return {key.removeprefix(prefix): value for key, value in profile.items()}
+
+    async def refresh_fighter_profiles(
+        self, session: Optional[SessionManager] = None
+    ) -> Dict[str, int]:
+        """
+        Revalidates every cached fighter profile so records and career stats stay current
+        without a full crawl. Each page is requested conditionally and only re-parsed
+        when the host sends a page whose content differs from the cached one.
+
+        Args:
+            session (Optional[SessionManager], optional): shared session to make requests with.
+
+        Returns:
+            Dict[str, int]: number of profiles for each ProfileRefresh outcome.
+        """
+        fighter_links = self.fighter_cache.urls
+        results = await asyncio.gather(
+            *(
+                self._refresh_fighter_profile(fighter_link, session)
+                for fighter_link in fighter_links
+            ),
+            return_exceptions=True,
+        )
+
+        counts: Dict[str, int] = {str(outcome): 0 for outcome in ProfileRefresh}
+        for fighter_link, result in zip(fighter_links, results):
+            if isinstance(result, BaseException):
+                console.log(f"Failed to refresh {fighter_link}: {result}")
+                result = ProfileRefresh.FAILED
+            counts[result] += 1
+        return counts
+
+    async def _refresh_fighter_profile(
+        self, fighter_link: str, session: Optional[SessionManager] = None
+    ) -> ProfileRefresh:
+        """
+        Revalidates a single cached fighter profile.
+
+        Args:
+            fighter_link (str): URL to the fighter's profile.
+            session (Optional[SessionManager], optional): shared session to make requests with.
+
+        Returns:
+            ProfileRefresh: whether the profile was updated.
+        """
+        # Profiles are cached without a corner, the prefix is only needed to strip it again.
+        fighter = FighterScraper(
+            fighter_link,
+            red_corner=True,
+            session=session,
+            parsing_pool=self.parsing_pool,
+        )
+        validators = self.fighter_cache.validators(fighter_link)
+        html, new_validators = await fighter.fetch_if_modified(validators)
+
+        if html is None:
+            self.fighter_cache.touch(fighter_link)
+            return ProfileRefresh.NOT_MODIFIED
+
+        content_hash = FighterProfileCache.content_hash(html)
+        self.fighter_cache.set_validators(
+            fighter_link,
+            {**new_validators, FighterProfileCache.CONTENT_HASH_COLUMN: content_hash},
+        )
+        if content_hash == validators.get(FighterProfileCache.CONTENT_HASH_COLUMN):
+            self.fighter_cache.touch(fighter_link)
+            return ProfileRefresh.UNCHANGED
+
+        profile = await fighter.parse_page(html)
+        self.fighter_cache.put(
+            fighter_link, self._strip_prefix(profile, fighter.prefix)
+        )
+        return ProfileRefresh.UPDATED
@@ -1 +1,6 @@
-from .scraping import ScrapingException
+from .modelling import (
+    ModelNotTrainedException,
+    NoNextEventException,
+    UnknownFighterException,
+)
+from .scraping import PartialCardException, ScrapingException
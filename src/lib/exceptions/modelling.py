@@ -0,0 +1,39 @@
+from pathlib import Path
+from typing import List
+
+
+class UnknownFighterException(Exception):
+    """
+    Exception raised when a prediction is asked for a fighter with no bouts in the training data.
+    """
+
+    def __init__(self, fighters: List[str]):
+        self.fighters = fighters
+        self.message = f"No bouts found for: {', '.join(fighters)}"
+        super().__init__(self.message)
+
+
+class ModelNotTrainedException(Exception):
+    """
+    Exception raised when the model or the encoders saved with it are missing, e.g. a
+    model trained before the encoders were saved alongside it, so it must be retrained.
+    """
+
+    def __init__(self, missing: Path):
+        self.missing = missing
+        self.message = f"The model must be retrained, {Path(missing).name} is missing"
+        super().__init__(self.message)
+
+
+class NoNextEventException(Exception):
+    """
+    Exception raised when predictions are asked for and the next card's features are
+    missing, e.g. there is no upcoming card or the features haven't been built yet.
+    """
+
+    def __init__(self, missing: Path):
+        self.missing = missing
+        self.message = (
+            f"There is no upcoming card to predict, {Path(missing).name} is missing"
+        )
+        super().__init__(self.message)
@@ -6,3 +6,12 @@ class ScrapingException(Exception):
     def __init__(self, message: str = "An error occurred during scraping."):
         self.message = message
         super().__init__(self.message)
+
+
+class PartialCardException(ScrapingException):
+    """
+    Exception raised when a card was scraped but some of its bouts failed.
+    """
+
+    def __init__(self, message: str = "Some bouts on the card failed to scrape."):
+        super().__init__(message)
@@ -0,0 +1,3 @@
+from .queue import JobQueue, JobStatus, StageStatus
+from .runner import JobRunner, run_job
+from .stages import JOB_KINDS
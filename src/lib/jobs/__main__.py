@@ -0,0 +1,26 @@
+"""
+Runs the queued background jobs until stopped.
+
+Run from the repository root, alongside the web server:
+    python -m src.lib.jobs --max-jobs 1
+"""
+
+import argparse
+
+from src.config import JobSettings, PathSettings
+from . import JobQueue, JobRunner
+from .stages import setup_django
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-jobs", type=int, default=JobSettings.MAX_CONCURRENT_JOBS)
+    parser.add_argument(
+        "--until-empty",
+        action="store_true",
+        help="exit once every queued job has run",
+    )
+    args = parser.parse_args()
+    setup_django()
+    JobRunner(JobQueue(PathSettings.JOBS_DB), max_jobs=args.max_jobs).run(
+        until_empty=args.until_empty
+    )
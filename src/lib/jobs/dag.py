@@ -0,0 +1,475 @@
+"""
+Module to run the whole pipeline, from scraping to the next card's predictions, as a
+DAG of stages that are skipped when their outputs are already up to date.
+
+Run from the repository root, e.g. nightly:
+    python -m src.lib.jobs.dag
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import time
+import traceback
+from enum import StrEnum
+from graphlib import TopologicalSorter
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from loguru import logger
+
+from src.config import JobSettings, PathSettings, StorageSettings, console
+from src.lib.data_managers import get_storage
+from . import stages
+
+
+class DAGStage:
+    """
+    A stage of the pipeline and the files it reads and writes.
+
+    A stage depends on every stage writing one of its inputs. Its fingerprint is the
+    hash of each input file, of its code and of its settings; when none of them have
+    changed since it last succeeded, and its outputs still exist, it is skipped.
+    Stages whose real input isn't a file, like the scrapers reading the site, aren't
+    cacheable and always run.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        run: Callable[[Dict[str, Any]], None],
+        inputs: Sequence[Path] = (),
+        outputs: Sequence[Path] = (),
+        code: Sequence[Path] = (),
+        settings: Sequence[type] = (),
+        cacheable: bool = True,
+    ) -> None:
+        """
+        Args:
+            name (str): unique name of the stage.
+            run (Callable[[Dict[str, Any]], None]): runs the stage, called with the run's parameters.
+            inputs (Sequence[Path]): files the stage reads.
+            outputs (Sequence[Path]): files the stage writes, may include its inputs.
+            code (Sequence[Path]): source files or packages the stage's results depend on.
+            settings (Sequence[type]): settings classes the stage's results depend on.
+            cacheable (bool): False if the stage must always run.
+        """
+        self.name = name
+        self.run = run
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.code = list(code)
+        self.settings = list(settings)
+        self.cacheable = cacheable
+
+
+class FileHashes:
+    """
+    Sha256 of files' contents, only hashed again when a file's modification time or
+    size changes, so checking unchanged inputs costs a stat per file.
+    """
+
+    def __init__(self, cache: Optional[Dict[str, List[Any]]] = None) -> None:
+        # Path: [mtime_ns, size, sha256].
+        self.cache: Dict[str, List[Any]] = cache or {}
+
+    def hash(self, path: Path) -> Optional[str]:
+        """
+        The file's hash, or the combined hash of the python files in a package.
+        None if it doesn't exist.
+        """
+        if path.is_dir():
+            digest = hashlib.sha256()
+            for file in sorted(path.rglob("*.py")):
+                digest.update(str(file.relative_to(path)).encode())
+                digest.update((self.hash(file) or "").encode())
+            return digest.hexdigest()
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+
+        key = str(path)
+        cached = self.cache.get(key)
+        if cached is not None and cached[:2] == [stat.st_mtime_ns, stat.st_size]:
+            return cached[2]
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        self.cache[key] = [stat.st_mtime_ns, stat.st_size, digest.hexdigest()]
+        return digest.hexdigest()
+
+
+class StageResult(StrEnum):
+    RAN = "ran"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+    # Not run because a stage it depends on failed.
+    BLOCKED = "blocked"
+
+
+class PipelineDAG:
+    """
+    Runs the stages in dependency order, independent stages in parallel, each in its
+    own process, and reports how long each took and why it ran or was skipped.
+
+    The fingerprint of each stage that succeeds is saved, taken after it ran so a
+    stage rewriting one of its own inputs isn't run again for its own change. Stages
+    that always run, like the scrapers, should write the same bytes when nothing has
+    changed, or every stage after them runs too. A run where nothing upstream
+    changed only checks the files' modification times, and the stages that always
+    run.
+    """
+
+    def __init__(
+        self,
+        dag_stages: List[DAGStage],
+        state_path: Path,
+        max_parallel: int = JobSettings.MAX_PARALLEL_STAGES,
+    ) -> None:
+        """
+        Args:
+            dag_stages (List[DAGStage]): the stages, see pipeline_stages.
+            state_path (Path): json file the stages' fingerprints are saved to.
+            max_parallel (int): stages running at once.
+        """
+        self.stages: Dict[str, DAGStage] = {stage.name: stage for stage in dag_stages}
+        self.state_path = state_path
+        self.max_parallel = max_parallel
+        self.dependencies: Dict[str, Set[str]] = {
+            stage.name: {
+                other.name
+                for other in dag_stages
+                if other is not stage and set(stage.inputs) & set(other.outputs)
+            }
+            for stage in dag_stages
+        }
+        # Raises graphlib.CycleError if the stages' files form a cycle.
+        TopologicalSorter(self.dependencies).prepare()
+
+        state = self._load_state()
+        self.fingerprints: Dict[str, Dict[str, Any]] = state.get("stages", {})
+        self.hashes = FileHashes(state.get("files"))
+
+    def _load_state(self) -> Dict[str, Any]:
+        try:
+            with open(self.state_path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _save_state(self) -> None:
+        """
+        Writes to a temporary file and renames it over the state, like the caches.
+        """
+        tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"stages": self.fingerprints, "files": self.hashes.cache}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.state_path)
+
+    def fingerprint(self, stage: DAGStage) -> Dict[str, Any]:
+        settings = {
+            cls.__name__: {
+                key: str(value) for key, value in vars(cls).items() if key.isupper()
+            }
+            for cls in stage.settings
+        }
+        return {
+            "inputs": {str(path): self.hashes.hash(path) for path in stage.inputs},
+            "code": {str(path): self.hashes.hash(path) for path in stage.code},
+            "settings": hashlib.sha256(
+                json.dumps(settings, sort_keys=True).encode()
+            ).hexdigest(),
+        }
+
+    def reason_to_run(self, stage: DAGStage) -> Optional[str]:
+        """
+        Why the stage has to run, None if its outputs are up to date.
+        """
+        if not stage.cacheable:
+            return "always runs"
+        previous = self.fingerprints.get(stage.name)
+        if previous is None:
+            return "never run"
+        current = self.fingerprint(stage)
+        changed = [
+            Path(path).name
+            for path, digest in current["inputs"].items()
+            if previous["inputs"].get(path) != digest
+        ]
+        if changed:
+            return f"inputs changed: {', '.join(changed)}"
+        if current["code"] != previous["code"]:
+            return "code changed"
+        if current["settings"] != previous["settings"]:
+            return "settings changed"
+        missing = [
+            path.name
+            for path in stage.outputs
+            if path not in stage.inputs and not path.exists()
+        ]
+        if missing:
+            return f"outputs missing: {', '.join(missing)}"
+        return None
+
+    def run(
+        self, params: Optional[Dict[str, Any]] = None, force: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Runs every stage that isn't up to date.
+
+        Args:
+            params (Optional[Dict[str, Any]]): passed to each stage, e.g. {"full": True}.
+            force (bool): run every stage, even if it's up to date.
+
+        Returns:
+            List[Dict[str, Any]]: each stage's status, seconds and reason, in the order they finished.
+        """
+        params = params or {}
+        sorter = TopologicalSorter(self.dependencies)
+        sorter.prepare()
+        report: Dict[str, Dict[str, Any]] = {}
+        ready: List[str] = []
+        # Stage name: its process, the end of the pipe its error is sent on and when it started.
+        running: Dict[str, Tuple[multiprocessing.Process, Connection, float]] = {}
+        start = time.perf_counter()
+
+        while sorter.is_active():
+            ready.extend(sorter.get_ready())
+            while ready and len(running) < self.max_parallel:
+                name = ready.pop(0)
+                stage = self.stages[name]
+                if any(
+                    report[dependency]["status"]
+                    in (StageResult.FAILED, StageResult.BLOCKED)
+                    for dependency in self.dependencies[name]
+                ):
+                    report[name] = self._result(name, StageResult.BLOCKED, 0.0)
+                    sorter.done(name)
+                    continue
+                reason = "forced" if force else self.reason_to_run(stage)
+                if reason is None:
+                    report[name] = self._result(name, StageResult.SKIPPED, 0.0)
+                    sorter.done(name)
+                    continue
+                running[name] = (*self._start(stage, params), time.perf_counter())
+                report[name] = self._result(name, StageResult.RAN, 0.0, reason)
+
+            if not running:
+                continue
+            finished = wait([process.sentinel for process, _, _ in running.values()])
+            for name, (process, connection, started) in list(running.items()):
+                if process.sentinel not in finished:
+                    continue
+                process.join()
+                error = self._receive_error(connection)
+                if error is None and process.exitcode != 0:
+                    error = f"Stage process exited with code {process.exitcode}"
+                del running[name]
+
+                report[name]["seconds"] = round(time.perf_counter() - started, 3)
+                if error is None:
+                    self.fingerprints[name] = self.fingerprint(self.stages[name])
+                    self._save_state()
+                else:
+                    report[name].update(status=StageResult.FAILED, error=error)
+                sorter.done(name)
+
+        results = list(report.values())
+        self._display_report(results, time.perf_counter() - start)
+        return results
+
+    @staticmethod
+    def _receive_error(connection: Connection) -> Optional[str]:
+        """
+        The error the stage's process sent, None if it sent nothing before closing the pipe.
+        """
+        try:
+            return connection.recv() if connection.poll() else None
+        except EOFError:
+            return None
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _result(
+        name: str, status: str, seconds: float, reason: Optional[str] = None
+    ) -> Dict[str, Any]:
+        return {"stage": name, "status": status, "seconds": seconds, "reason": reason}
+
+    def _start(
+        self, stage: DAGStage, params: Dict[str, Any]
+    ) -> Tuple[multiprocessing.Process, Connection]:
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(
+            target=_run_stage,
+            args=(stage.name, stage.run, params, sender),
+            name=f"stage-{stage.name}",
+        )
+        process.start()
+        # Only the stage's process writes to the pipe.
+        sender.close()
+        console.log(f"Started {stage.name}.")
+        return process, receiver
+
+    @staticmethod
+    def _display_report(results: List[Dict[str, Any]], seconds: float) -> None:
+        """
+        Prints out how long each stage took and why it ran.
+        """
+        colours = {
+            StageResult.RAN: "green",
+            StageResult.SKIPPED: "blue",
+            StageResult.FAILED: "red",
+            StageResult.BLOCKED: "yellow",
+        }
+        for result in results:
+            colour = colours[result["status"]]
+            detail = result.get("error") or result["reason"] or ""
+            console.log(
+                f"{result['stage']:<20} [bold {colour}]{result['status']:<8}[/] "
+                f"{result['seconds']:8.2f}s  {detail}"
+            )
+        console.log(f"Pipeline finished in {seconds:.2f}s.")
+
+
+def _run_stage(
+    name: str,
+    run: Callable[[Dict[str, Any]], None],
+    params: Dict[str, Any],
+    connection: Connection,
+) -> None:
+    """
+    Runs a stage in its own process, sending its error back if it fails.
+    """
+    try:
+        run(params)
+    except Exception as e:
+        logger.exception(f"Stage {name} failed")
+        connection.send("".join(traceback.format_exception_only(e)).strip())
+    finally:
+        connection.close()
+
+
+def pipeline_stages() -> List[DAGStage]:
+    """
+    The stages from scraping the site to predicting the next card, with the paths
+    in PathSettings in each stage's storage format.
+    """
+    raw_data = get_storage(StorageSettings.RAW_DATA).resolve(PathSettings.RAW_DATA_CSV)
+    clean_data = get_storage(StorageSettings.CLEAN_DATA).resolve(
+        PathSettings.CLEAN_DATA_CSV
+    )
+    training_data = get_storage(StorageSettings.TRAINING_DATA).resolve(
+        PathSettings.TRAINING_DATA_CSV
+    )
+    next_event_storage = get_storage(StorageSettings.NEXT_EVENT)
+    next_event = next_event_storage.resolve(PathSettings.NEXT_EVENT_CSV)
+    next_event_features = next_event_storage.resolve(
+        PathSettings.NEXT_EVENT_FEATURES_CSV
+    )
+    lib = PathSettings.BASE_DIR / "lib"
+
+    return [
+        DAGStage(
+            "scrape_past_events",
+            stages.scrape_past_events,
+            outputs=[
+                raw_data,
+                PathSettings.EVENT_CACHE_LOG,
+                PathSettings.FIGHTER_PROFILE_CACHE_CSV,
+            ],
+            cacheable=False,
+        ),
+        # Reuses the fighter profiles cached by scraping the past events.
+        DAGStage(
+            "scrape_next_event",
+            stages.scrape_next_event,
+            inputs=[PathSettings.FIGHTER_PROFILE_CACHE_CSV],
+            outputs=[next_event],
+            cacheable=False,
+        ),
+        DAGStage(
+            "clean",
+            stages.clean_data,
+            inputs=[raw_data],
+            outputs=[clean_data, PathSettings.CLEANING_STATE_JSON],
+            code=[
+                lib / "preprocessing" / "cleaners",
+                lib / "engines" / "data_cleaning.py",
+            ],
+            settings=[StorageSettings],
+        ),
+        # Also brings the next card's averages up to date, in a file of its own.
+        DAGStage(
+            "engineer_features",
+            stages.engineer_features,
+            inputs=[clean_data, next_event],
+            outputs=[
+                training_data,
+                PathSettings.FIGHTER_STATS_JSON,
+                next_event_features,
+            ],
+            code=[
+                lib / "preprocessing" / "feature_engineering",
+                lib / "pipelines" / "feature_engineering.py",
+            ],
+            settings=[StorageSettings],
+        ),
+        DAGStage(
+            "train",
+            stages.train_model,
+            inputs=[training_data],
+            outputs=[PathSettings.MODEL_WEIGHTS, PathSettings.MODEL_ENCODERS],
+            code=[lib / "modelling" / "training.py", lib / "modelling" / "encoders.py"],
+        ),
+        DAGStage(
+            "infer",
+            stages.predict_next_event,
+            inputs=[
+                PathSettings.MODEL_WEIGHTS,
+                PathSettings.MODEL_ENCODERS,
+                next_event_features,
+            ],
+            outputs=[PathSettings.PREDICTIONS_JSON],
+            code=[
+                lib / "modelling" / "inference.py",
+                lib / "modelling" / "encoders.py",
+            ],
+        ),
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--force", action="store_true", help="run every stage")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="clean and engineer the features of every bout again, implies --force",
+    )
+    parser.add_argument(
+        "--skip-scraping",
+        action="store_true",
+        help="only run the stages after scraping, on the data already scraped",
+    )
+    parser.add_argument(
+        "--max-parallel", type=int, default=JobSettings.MAX_PARALLEL_STAGES
+    )
+    args = parser.parse_args()
+    stages.setup_django()
+
+    dag_stages = pipeline_stages()
+    if args.skip_scraping:
+        dag_stages = [stage for stage in dag_stages if stage.cacheable]
+    report = PipelineDAG(
+        dag_stages, PathSettings.PIPELINE_STATE_JSON, max_parallel=args.max_parallel
+    ).run({"full": args.full}, force=args.force or args.full)
+    if any(result["status"] == StageResult.FAILED for result in report):
+        raise SystemExit(1)
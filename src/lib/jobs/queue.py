@@ -0,0 +1,282 @@
+"""
+Module for the queue of background jobs, kept in a SQLite file so the web server and
+the job runner share it without a broker.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing, contextmanager
+from datetime import datetime, timezone
+from enum import StrEnum
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .stages import JOB_KINDS, Stage
+
+
+class JobStatus(StrEnum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class StageStatus(StrEnum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class JobQueue:
+    """
+    Queue of background jobs, one row per job with its status and its stages' timings.
+
+    Every call opens its own connection, so the queue can be shared between the web
+    server's workers, the runner and the jobs' processes. Jobs are claimed in the
+    order they were queued inside an immediate transaction, so no job is claimed twice.
+    Queuing a job of the same kind and parameters as one still waiting returns the
+    waiting job instead, so repeated requests don't run the same pipeline again.
+    """
+
+    SCHEMA: str = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,
+            params TEXT NOT NULL,
+            status TEXT NOT NULL,
+            stages TEXT NOT NULL,
+            error TEXT,
+            pid INTEGER,
+            created_at REAL NOT NULL,
+            started_at REAL,
+            finished_at REAL
+        );
+        CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, id);
+    """
+
+    def __init__(
+        self, db_path: Path, kinds: Optional[Dict[str, List[Stage]]] = None
+    ) -> None:
+        """
+        Args:
+            db_path (Path): the database, see PathSettings.JOBS_DB.
+            kinds (Optional[Dict[str, List[Stage]]]): the stages of each kind of job. Defaults to JOB_KINDS.
+        """
+        self.db_path = db_path
+        self.kinds = kinds if kinds is not None else JOB_KINDS
+        with self._connect() as connection:
+            # Readers aren't blocked by the jobs writing their progress.
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(self.SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        A connection in autocommit mode, transactions are started explicitly.
+        """
+        connection = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        with closing(connection):
+            yield connection
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def enqueue(self, kind: str, params: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Queues a job, or returns the id of the same job if it's still waiting to run.
+
+        Args:
+            kind (str): one of the queue's kinds of job.
+            params (Optional[Dict[str, Any]]): passed to each of the job's stages.
+
+        Returns:
+            int: the job's id.
+        """
+        if kind not in self.kinds:
+            raise ValueError(f"Unknown job kind: {kind}")
+        params_json = json.dumps(params or {}, sort_keys=True)
+        stages = [
+            {
+                "name": name,
+                "status": StageStatus.PENDING,
+                "started_at": None,
+                "finished_at": None,
+            }
+            for name, _ in self.kinds[kind]
+        ]
+
+        with self._transaction() as connection:
+            waiting = connection.execute(
+                "SELECT id FROM jobs WHERE status = ? AND kind = ? AND params = ?",
+                (JobStatus.QUEUED, kind, params_json),
+            ).fetchone()
+            if waiting is not None:
+                return waiting["id"]
+            cursor = connection.execute(
+                "INSERT INTO jobs (kind, params, status, stages, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (kind, params_json, JobStatus.QUEUED, json.dumps(stages), time.time()),
+            )
+            return cursor.lastrowid
+
+    def claim(self) -> Optional[Dict[str, Any]]:
+        """
+        Marks the oldest queued job as running and returns it, None if none are waiting.
+        """
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT * FROM jobs WHERE status = ? ORDER BY id LIMIT 1",
+                (JobStatus.QUEUED,),
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE jobs SET status = ?, started_at = ? WHERE id = ?",
+                (JobStatus.RUNNING, time.time(), row["id"]),
+            )
+        return self.get(row["id"])
+
+    def set_pid(self, job_id: int, pid: int) -> None:
+        with self._connect() as connection:
+            connection.execute("UPDATE jobs SET pid = ? WHERE id = ?", (pid, job_id))
+
+    def start_stage(self, job_id: int, name: str) -> None:
+        self._update_stage(
+            job_id, name, status=StageStatus.RUNNING, started_at=time.time()
+        )
+
+    def finish_stage(self, job_id: int, name: str, failed: bool = False) -> None:
+        self._update_stage(
+            job_id,
+            name,
+            status=StageStatus.FAILED if failed else StageStatus.DONE,
+            finished_at=time.time(),
+        )
+
+    def _update_stage(self, job_id: int, name: str, **fields: Any) -> None:
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT stages FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            stages: List[Dict[str, Any]] = json.loads(row["stages"])
+            for stage in stages:
+                if stage["name"] == name:
+                    stage.update(fields)
+            connection.execute(
+                "UPDATE jobs SET stages = ? WHERE id = ?", (json.dumps(stages), job_id)
+            )
+
+    def finish(self, job_id: int, error: Optional[str] = None) -> None:
+        """
+        Marks the job as succeeded, or failed with the error.
+        """
+        with self._connect() as connection:
+            connection.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                (
+                    JobStatus.FAILED if error else JobStatus.SUCCEEDED,
+                    error,
+                    time.time(),
+                    job_id,
+                ),
+            )
+
+    def fail_interrupted(self) -> List[int]:
+        """
+        Marks the running jobs whose process has gone, e.g. after the runner was
+        restarted, as failed so they don't look like they're still running.
+
+        Returns:
+            List[int]: the ids of the jobs marked as failed.
+        """
+        with self._connect() as connection:
+            running = connection.execute(
+                "SELECT id, pid FROM jobs WHERE status = ?", (JobStatus.RUNNING,)
+            ).fetchall()
+        interrupted = [row["id"] for row in running if not _is_alive(row["pid"])]
+        for job_id in interrupted:
+            self.finish(job_id, error="Interrupted before it finished")
+        return interrupted
+
+    def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """
+        The job's status, progress and timings, None if there is no such job.
+        """
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT * FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._to_dict(row) if row is not None else None
+
+    def recent(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        The most recently queued jobs, newest first.
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT * FROM jobs ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        stages: List[Dict[str, Any]] = json.loads(row["stages"])
+        for stage in stages:
+            stage["seconds"] = _seconds(stage["started_at"], stage["finished_at"])
+            stage["started_at"] = _isoformat(stage["started_at"])
+            stage["finished_at"] = _isoformat(stage["finished_at"])
+        done = sum(stage["status"] == StageStatus.DONE for stage in stages)
+
+        return {
+            "id": row["id"],
+            "kind": row["kind"],
+            "params": json.loads(row["params"]),
+            "status": row["status"],
+            "progress": f"{done}/{len(stages)}",
+            "stages": stages,
+            "error": row["error"],
+            "created_at": _isoformat(row["created_at"]),
+            "started_at": _isoformat(row["started_at"]),
+            "finished_at": _isoformat(row["finished_at"]),
+            "queued_seconds": _seconds(row["created_at"], row["started_at"]),
+            "seconds": _seconds(row["started_at"], row["finished_at"]),
+        }
+
+
+def _isoformat(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+def _seconds(start: Optional[float], end: Optional[float]) -> Optional[float]:
+    """
+    Seconds between the two timestamps, up to now if it hasn't ended yet.
+    """
+    if start is None:
+        return None
+    return round((end if end is not None else time.time()) - start, 3)
+
+
+def _is_alive(pid: Optional[int]) -> bool:
+    if pid is None:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
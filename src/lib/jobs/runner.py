@@ -0,0 +1,127 @@
+"""
+Module to run the queued jobs, each in its own worker process.
+"""
+
+import multiprocessing
+import time
+import traceback
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+from src.config import JobSettings, console
+from .queue import JobQueue, JobStatus
+from .stages import Stage
+
+
+def run_job(
+    db_path: Path, job_id: int, kinds: Optional[Dict[str, List[Stage]]] = None
+) -> None:
+    """
+    Runs each of the job's stages in turn, recording when each starts and finishes.
+    The job stops at the first stage that fails, with the error saved on the job.
+
+    Args:
+        db_path (Path): the queue's database.
+        job_id (int): a job claimed from the queue.
+        kinds (Optional[Dict[str, List[Stage]]]): the stages of each kind of job. Defaults to JOB_KINDS.
+    """
+    queue = JobQueue(db_path, kinds)
+    job = queue.get(job_id)
+
+    for name, stage in queue.kinds[job["kind"]]:
+        queue.start_stage(job_id, name)
+        try:
+            stage(job["params"])
+        except Exception as e:
+            logger.exception(f"Job {job_id} failed in stage {name}")
+            queue.finish_stage(job_id, name, failed=True)
+            queue.finish(
+                job_id,
+                error="".join(traceback.format_exception_only(e)).strip(),
+            )
+            return
+        queue.finish_stage(job_id, name)
+    queue.finish(job_id)
+
+
+class JobRunner:
+    """
+    Claims the queued jobs in order and runs each in a new process.
+
+    Running a job in its own process keeps the pipeline off the web server's workers,
+    returns all the memory the job used when it finishes and gives every job a fresh
+    event loop for the scrapers. If a job's process dies without finishing the job,
+    e.g. it ran out of memory, the job is marked as failed with its exit code.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        max_jobs: int = JobSettings.MAX_CONCURRENT_JOBS,
+        poll_interval: float = JobSettings.POLL_INTERVAL,
+    ) -> None:
+        """
+        Args:
+            queue (JobQueue): the queue the jobs are claimed from.
+            max_jobs (int): jobs running at once.
+            poll_interval (float): seconds between checks for new jobs.
+        """
+        self.queue = queue
+        self.max_jobs = max_jobs
+        self.poll_interval = poll_interval
+        self._processes: Dict[int, BaseProcess] = {}
+
+    def run(self, until_empty: bool = False) -> None:
+        """
+        Runs jobs as they are queued, until stopped.
+
+        Args:
+            until_empty (bool): return once every queued job has run instead.
+        """
+        for job_id in self.queue.fail_interrupted():
+            console.log(f"Job {job_id} was interrupted, marked as failed.")
+
+        while True:
+            self._reap()
+            while len(self._processes) < self.max_jobs:
+                job = self.queue.claim()
+                if job is None:
+                    break
+                self._start(job["id"], job["kind"])
+
+            if until_empty and not self._processes:
+                return
+            time.sleep(self.poll_interval)
+
+    def _start(self, job_id: int, kind: str) -> None:
+        process = multiprocessing.Process(
+            target=run_job,
+            args=(self.queue.db_path, job_id, self.queue.kinds),
+            name=f"job-{job_id}",
+        )
+        process.start()
+        self.queue.set_pid(job_id, process.pid)
+        self._processes[job_id] = process
+        console.log(f"Started job {job_id} ({kind}) in process {process.pid}.")
+
+    def _reap(self) -> None:
+        """
+        Collects the finished processes, failing their jobs if they died part way through.
+        """
+        for job_id, process in list(self._processes.items()):
+            if process.is_alive():
+                continue
+            process.join()
+            del self._processes[job_id]
+
+            job = self.queue.get(job_id)
+            status = job["status"]
+            if status == JobStatus.RUNNING:
+                self.queue.finish(
+                    job_id, error=f"Worker process exited with code {process.exitcode}"
+                )
+                status = JobStatus.FAILED
+            console.log(f"Job {job_id} ({job['kind']}) {status}.")
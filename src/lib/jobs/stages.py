@@ -0,0 +1,138 @@
+"""
+Module defining the stages each kind of background job runs.
+"""
+
+import asyncio
+import json
+import os
+from typing import Any, Callable, Dict, List, Tuple
+
+import django
+
+from src.config import PathSettings, StorageSettings, console
+from src.lib.data_managers import (
+    CSVProcessingHandler,
+    CSVStorage,
+    EventLogCache,
+    ProcessingHandlerABC,
+    StreamingCSVProcessingHandler,
+    get_storage,
+)
+from src.lib.engines import ScrapingEngine
+from src.lib.modelling import Inference, Training
+from src.lib.pipelines import (
+    DataCleaningPipeline,
+    FeatureEngineeringPipeline,
+    ScrapingPipeline,
+)
+
+
+def setup_django() -> None:
+    """
+    Loads the Django apps, so the raw data can be stored in the database. Called by
+    the command line entry points, the web server has already loaded them.
+    """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "src.server.settings")
+    django.setup()
+
+
+# A stage's name and the function running it, called with the job's parameters.
+Stage = Tuple[str, Callable[[Dict[str, Any]], None]]
+
+
+def _scraping_pipeline() -> ScrapingPipeline:
+    return ScrapingPipeline(
+        ScrapingEngine(),
+        EventLogCache(
+            PathSettings.EVENT_CACHE_LOG,
+            legacy_json_path=PathSettings.EVENT_CACHE_JSON,
+        ),
+    )
+
+
+def _raw_data_processor() -> ProcessingHandlerABC:
+    """
+    Csv files and the database can be written to as each card completes, other
+    formats are written at the end.
+    """
+    raw_storage = get_storage(StorageSettings.RAW_DATA)
+    if isinstance(raw_storage, CSVStorage):
+        return StreamingCSVProcessingHandler(PathSettings.RAW_DATA_CSV)
+    if StorageSettings.RAW_DATA == "orm":
+        from src.apps.scraper.handlers import ORMProcessingHandler
+
+        return ORMProcessingHandler(PathSettings.RAW_DATA_CSV)
+    return CSVProcessingHandler(
+        PathSettings.RAW_DATA_CSV, allow_creation=True, storage=raw_storage
+    )
+
+
+def scrape_past_events(params: Dict[str, Any]) -> None:
+    asyncio.run(_scraping_pipeline().run(_raw_data_processor()))
+
+
+def scrape_next_event(params: Dict[str, Any]) -> None:
+    asyncio.run(_scraping_pipeline().scrape_next_event())
+
+
+def refresh_fighter_profiles(params: Dict[str, Any]) -> None:
+    asyncio.run(_scraping_pipeline().refresh_fighter_profiles())
+
+
+def clean_data(params: Dict[str, Any]) -> None:
+    DataCleaningPipeline().run(incremental=not params.get("full", False))
+
+
+def engineer_features(params: Dict[str, Any]) -> None:
+    FeatureEngineeringPipeline().run(incremental=not params.get("full", False))
+
+
+def train_model(params: Dict[str, Any]) -> None:
+    Training(
+        PathSettings.TRAINING_DATA_CSV,
+        storage=get_storage(StorageSettings.TRAINING_DATA),
+    ).train_model()
+
+
+def predict_next_event(params: Dict[str, Any]) -> None:
+    """
+    Predicts the next card's winners with the latest model and saves them to
+    PathSettings.PREDICTIONS_JSON, as the predictor endpoint returns them.
+    """
+    storage = get_storage(StorageSettings.NEXT_EVENT)
+    if not storage.resolve(PathSettings.NEXT_EVENT_FEATURES_CSV).exists():
+        console.log("No next event to predict.")
+        return
+    predictions = Inference(
+        PathSettings.MODEL_WEIGHTS,
+        PathSettings.NEXT_EVENT_FEATURES_CSV,
+        storage=storage,
+        encoders=PathSettings.MODEL_ENCODERS,
+    ).predict()
+
+    tmp_path = PathSettings.PREDICTIONS_JSON.with_name(
+        PathSettings.PREDICTIONS_JSON.name + ".tmp"
+    )
+    with open(tmp_path, "w") as f:
+        json.dump({"data": predictions}, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, PathSettings.PREDICTIONS_JSON)
+
+
+# Each kind of job and the stages it runs, in order.
+JOB_KINDS: Dict[str, List[Stage]] = {
+    "scrape_past_events": [("scrape", scrape_past_events)],
+    "scrape_next_event": [("scrape_next_event", scrape_next_event)],
+    "refresh_fighter_profiles": [("refresh", refresh_fighter_profiles)],
+    "clean_data": [("clean", clean_data)],
+    "engineer_features": [("engineer_features", engineer_features)],
+    "train": [("train", train_model)],
+    # From the site through to a retrained model.
+    "pipeline": [
+        ("scrape", scrape_past_events),
+        ("clean", clean_data),
+        ("engineer_features", engineer_features),
+        ("train", train_model),
+    ],
+}
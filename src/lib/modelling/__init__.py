@@ -1,2 +1,5 @@
+from .encoders import FeatureEncoders
 from .inference import Inference
+from .matchups import MatchupPredictor
+from .registry import ModelRegistry
 from .training import Training
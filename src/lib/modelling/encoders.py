@@ -0,0 +1,107 @@
+"""
+Module for the encoders turning the categorical columns into numbers for the model.
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+from joblib import dump, load
+from sklearn.preprocessing import OrdinalEncoder
+
+from src.lib.constants.columns import Columns
+from src.lib.exceptions import ModelNotTrainedException
+
+
+class FeatureEncoders:
+    """
+    The encoders fitted on the training data, saved alongside the model so that
+    inference encodes every value the same way whatever else is being predicted.
+
+    Both corners' stances share one encoder, so a stance has the same code in the red
+    and blue columns. Values not seen in training are encoded as -1.
+    """
+
+    # Encoder name: the columns it encodes.
+    COLUMNS: Dict[str, List[str]] = {
+        "weight_class": [Columns.WEIGHT_CLASS],
+        "title_bout": [Columns.TITLE_BOUT],
+        "stance": [Columns.RED_STANCE, Columns.BLUE_STANCE],
+    }
+    OUTCOME: str = "outcome"
+    # The winner column is from the red corner's point of view.
+    RED_WIN: str = "W"
+
+    def __init__(self, encoders: Dict[str, OrdinalEncoder]) -> None:
+        self.encoders = encoders
+
+    @classmethod
+    def fit(cls, df: pd.DataFrame) -> FeatureEncoders:
+        """
+        Fits an encoder for each categorical column and the winner column.
+
+        Args:
+            df (pd.DataFrame): the training data.
+        """
+        encoders: Dict[str, OrdinalEncoder] = {}
+        for name, columns in cls.COLUMNS.items():
+            encoders[name] = OrdinalEncoder(
+                handle_unknown="use_encoded_value", unknown_value=-1
+            ).fit(cls._values(df, columns))
+        encoders[cls.OUTCOME] = OrdinalEncoder().fit(cls._values(df, [Columns.WINNER]))
+        return cls(encoders)
+
+    @staticmethod
+    def _values(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+        """
+        The columns' values stacked into one column, the encoders are fitted without column names.
+        """
+        return df[columns].to_numpy().reshape(-1, 1)
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Returns a copy of the dataframe with the categorical columns encoded.
+        """
+        df = df.copy()
+        for name, columns in self.COLUMNS.items():
+            encoded: np.ndarray = self.encoders[name].transform(
+                self._values(df, columns)
+            )
+            df[columns] = encoded.reshape(-1, len(columns))
+        return df
+
+    def encode(self, name: str, values: np.ndarray) -> np.ndarray:
+        """
+        Encodes the values of one column with the named encoder.
+        """
+        return self.encoders[name].transform(
+            np.asarray(values, dtype=object).reshape(-1, 1)
+        )[:, 0]
+
+    def encode_outcome(self, winners: pd.Series) -> np.ndarray:
+        return self.encoders[self.OUTCOME].transform(winners.to_frame().to_numpy())[
+            :, 0
+        ]
+
+    @property
+    def red_win(self) -> float:
+        """
+        The encoded outcome of a red corner win, i.e. the model's class for it.
+        """
+        return float(self.encoders[self.OUTCOME].transform([[self.RED_WIN]])[0, 0])
+
+    def save(self, path: Path) -> None:
+        dump(self.encoders, path)
+
+    @classmethod
+    def load(cls, path: Path) -> FeatureEncoders:
+        """
+        Raises:
+            ModelNotTrainedException: If the model was saved without its encoders.
+        """
+        try:
+            return cls(load(path))
+        except FileNotFoundError as exc:
+            raise ModelNotTrainedException(path) from exc
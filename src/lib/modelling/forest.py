@@ -0,0 +1,75 @@
+"""
+Module to evaluate a trained random forest with numpy rather than tree by tree.
+"""
+
+from __future__ import annotations
+from typing import Any
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+
+
+class ForestArrays:
+    """
+    A random forest classifier's trees copied into padded (tree, node) arrays, so every
+    tree is walked for every row at once, one level of the trees per step.
+
+    sklearn's predict_proba goes through the trees one at a time with joblib, which
+    costs ~15ms for 300 trees whether it predicts one row or a hundred. Here the cost
+    is a few numpy operations per level of the trees, so a single prediction takes
+    well under a millisecond. The probabilities are the same as sklearn's, up to the
+    order the trees' probabilities are summed in.
+    """
+
+    def __init__(self, model: RandomForestClassifier) -> None:
+        trees = [estimator.tree_ for estimator in model.estimators_]
+        n_trees, n_nodes = len(trees), max(tree.node_count for tree in trees)
+        self.classes_ = model.classes_
+        self.n_features_in_ = model.n_features_in_
+        self.depth: int = max(tree.max_depth for tree in trees)
+
+        # Leaves point back at themselves, so rows that reach a leaf early stay there.
+        nodes = np.arange(n_nodes)
+        self.feature = np.zeros((n_trees, n_nodes), dtype=np.intp)
+        self.threshold = np.zeros((n_trees, n_nodes))
+        self.left = np.tile(nodes, (n_trees, 1))
+        self.right = np.tile(nodes, (n_trees, 1))
+        self.missing_go_to_left = np.zeros((n_trees, n_nodes), dtype=bool)
+        self.proba = np.zeros((n_trees, n_nodes, len(self.classes_)))
+
+        for i, tree in enumerate(trees):
+            n = tree.node_count
+            split = tree.children_left != -1
+            self.feature[i, :n][split] = tree.feature[split]
+            self.threshold[i, :n] = tree.threshold
+            self.left[i, :n][split] = tree.children_left[split]
+            self.right[i, :n][split] = tree.children_right[split]
+            self.missing_go_to_left[i, :n] = tree.missing_go_to_left
+            values = tree.value[:, 0, :]
+            self.proba[i, :n] = values / values.sum(axis=1, keepdims=True)
+
+    @staticmethod
+    def supports(model: Any) -> bool:
+        return isinstance(model, RandomForestClassifier)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """
+        The probability of each class for each row, like RandomForestClassifier.predict_proba.
+
+        Args:
+            X (np.ndarray): the features, one row per prediction.
+        """
+        # sklearn's trees compare the features as float32.
+        X = np.asarray(X, dtype=np.float32)
+        rows = np.arange(len(X))[:, np.newaxis]
+        trees = np.arange(self.feature.shape[0])
+        nodes = np.zeros((len(X), len(trees)), dtype=np.intp)
+
+        for _ in range(self.depth):
+            values = X[rows, self.feature[trees, nodes]]
+            go_left = (values <= self.threshold[trees, nodes]) | (
+                np.isnan(values) & self.missing_go_to_left[trees, nodes]
+            )
+            nodes = np.where(go_left, self.left[trees, nodes], self.right[trees, nodes])
+
+        return self.proba[trees, nodes].sum(axis=1) / len(trees)
@@ -1,11 +1,11 @@
 from joblib import load
 from pathlib import Path
-from typing import Any, List, Dict
+from typing import Any, List, Dict, Optional, Union
 
-from sklearn.preprocessing import OrdinalEncoder
-
-from src.lib.data_managers import CSVProcessingHandler
-from src.lib.constants.columns import INFERENCE_COLUMNS
+from src.config import PathSettings
+from src.lib.data_managers import CSVProcessingHandler, StorageBackendABC
+from src.lib.constants.columns import Columns, INFERENCE_COLUMNS
+from .encoders import FeatureEncoders
 
 
 class Inference(CSVProcessingHandler):
@@ -15,29 +15,57 @@ class Inference(CSVProcessingHandler):
 
     def __init__(
         self,
-        model_weights: Any,
+        model_weights: Union[Path, Any],
         csv_path: Path,
         allow_creation: bool = False,
+        storage: Optional[StorageBackendABC] = None,
+        encoders: Union[Path, FeatureEncoders] = PathSettings.MODEL_ENCODERS,
     ) -> None:
-        super().__init__(csv_path, allow_creation)
+        """
+        Args:
+            model_weights (Union[Path, Any]): the saved model, or a model already loaded from it.
+            csv_path (Path): the next card's features, see PathSettings.NEXT_EVENT_FEATURES_CSV.
+            allow_creation (bool, optional): create an empty dataframe if the file doesn't exist.
+            storage (Optional[StorageBackendABC], optional): format the next card is stored in.
+            encoders (Union[Path, FeatureEncoders], optional): the encoders saved with the model, or the encoders loaded from them.
+        """
+        # Only the columns the model uses (plus the fighter names) are read.
+        super().__init__(
+            csv_path,
+            allow_creation,
+            storage,
+            columns=[Columns.RED_FIGHTER, Columns.BLUE_FIGHTER, *INFERENCE_COLUMNS],
+        )
 
-        self.model = load(model_weights)
+        self.model = (
+            load(model_weights)
+            if isinstance(model_weights, (str, Path))
+            else model_weights
+        )
+        self.encoders = (
+            FeatureEncoders.load(encoders)
+            if isinstance(encoders, (str, Path))
+            else encoders
+        )
+        self._prepared = False
 
     def _prepare_data(self):
+        # The features are only built once, predicting again reuses them.
+        if self._prepared:
+            return
+        self._prepared = True
+
         self.df = self.df.dropna()
         # Store fighter names before filtering columns
         self.red_fighters = self.df["red_fighter"].tolist()
         self.blue_fighters = self.df["blue_fighter"].tolist()
 
-        self.df = self.df[INFERENCE_COLUMNS]
-
-        stance_encoder = OrdinalEncoder()
-        self.df["red_stance"] = stance_encoder.fit_transform(self.df[["red_stance"]])
-        self.df["blue_stance"] = stance_encoder.fit_transform(self.df[["blue_stance"]])
+        self.df = self.encoders.transform(self.df[INFERENCE_COLUMNS])
 
     def predict(self) -> List[Dict[str, str]]:
         self._prepare_data()
         predictions = self.model.predict(self.df)
+        red_win = self.encoders.red_win
 
         results = []
         for red_fighter, blue_fighter, pred in zip(
@@ -47,7 +75,9 @@ class Inference(CSVProcessingHandler):
                 {
                     "red_fighter": red_fighter,
                     "blue_fighter": blue_fighter,
-                    "predicted_winner": red_fighter if pred == 1 else blue_fighter,
+                    "predicted_winner": (
+                        red_fighter if pred == red_win else blue_fighter
+                    ),
                 }
             )
 
@@ -0,0 +1,241 @@
+"""
+Module to predict the winner of any matchups, not just the bouts on the next card.
+"""
+
+from __future__ import annotations
+from itertools import product
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.lib.constants.columns import Columns, INFERENCE_COLUMNS
+from src.lib.exceptions import UnknownFighterException
+from src.lib.preprocessing.cleaners import DateCleaner
+from src.lib.preprocessing.feature_engineering.fighter import FighterHistory
+from .encoders import FeatureEncoders
+from .forest import ForestArrays
+
+
+class MatchupPredictor:
+    """
+    Predicts the winner of any red and blue fighters from each fighter's latest state.
+
+    Each fighter's state is built once from the training data: their stance, DOB,
+    height, reach and record from their latest bout, the weight class it was in,
+    and their averages for the modelled stats over all their bouts (like the next
+    card's averages, see IncrementalFeatureEngineering.next_event_averages). A batch
+    of matchups is then turned into the model's features with a lookup per corner
+    and a few array operations. The states' stances and weight classes are encoded
+    up front with the encoders saved with the model, so only values given with the
+    matchups are encoded per request.
+    """
+
+    # Taken from each fighter's latest bout.
+    ATTRIBUTES: List[str] = ["stance", "dob", "height", "reach", "wins", "losses"]
+
+    # Averaged over all each fighter's bouts, as "{stat}_average".
+    AVERAGED_STATS: List[str] = [
+        "sig_str_percent",
+        "sig_strike_defence_percent",
+        "td_percent",
+        "td_defence_percent",
+    ]
+
+    # Features taken straight from each corner's state, as "{corner}_{column}".
+    CORNER_FEATURES: List[str] = ["stance", "wins", "losses"] + [
+        stat.replace("percent", "average") for stat in AVERAGED_STATS
+    ]
+
+    # Columns of the training data the fighter states are built from.
+    TRAINING_COLUMNS: List[str] = [
+        Columns.DATE,
+        Columns.WEIGHT_CLASS,
+        Columns.RED_FIGHTER,
+        Columns.BLUE_FIGHTER,
+    ] + [
+        f"{corner}_{column}"
+        # Only the first iterable of a comprehension can see the class's attributes.
+        for corner, column in product(
+            FighterHistory.CORNERS, ATTRIBUTES + AVERAGED_STATS
+        )
+    ]
+
+    def __init__(
+        self, model: Any, encoders: FeatureEncoders, fighter_states: pd.DataFrame
+    ) -> None:
+        """
+        Args:
+            model (Any): the trained model.
+            encoders (FeatureEncoders): the encoders saved with the model.
+            fighter_states (pd.DataFrame): each fighter's state, see fighter_states.
+        """
+        self.model = model
+        self.encoders = encoders
+        self.fighter_states = fighter_states
+        self.feature_names: List[str] = [
+            str(column)
+            for column in getattr(model, "feature_names_in_", INFERENCE_COLUMNS)
+        ]
+        self._forest: Optional[ForestArrays] = (
+            ForestArrays(model) if ForestArrays.supports(model) else None
+        )
+        self._red_win_class: int = list(model.classes_).index(encoders.red_win)
+
+        self._fighters: pd.Index = fighter_states.index
+        self._states: Dict[str, np.ndarray] = self._encode_states(fighter_states)
+        self._not_title_bout: float = float(
+            self.encoders.encode("title_bout", ["N"])[0]
+        )
+
+    @classmethod
+    def fighter_states(cls, training_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Builds every fighter's latest state from the training data.
+
+        Args:
+            training_df (pd.DataFrame): the training data, at least TRAINING_COLUMNS.
+
+        Returns:
+            pd.DataFrame: indexed by fighter, their weight class, ATTRIBUTES and averages.
+        """
+        history = FighterHistory(training_df, cls.ATTRIBUTES + cls.AVERAGED_STATS)
+        long_df: pd.DataFrame = history.long_df
+        # The long dataframe is sorted by fighter then date.
+        latest: pd.DataFrame = long_df.drop_duplicates("fighter", keep="last")
+
+        states = pd.DataFrame(
+            {
+                Columns.WEIGHT_CLASS: training_df.loc[
+                    latest["bout"], Columns.WEIGHT_CLASS
+                ].to_numpy(),
+                **{column: latest[column].to_numpy() for column in cls.ATTRIBUTES},
+            },
+            index=pd.Index(latest["fighter"], name="fighter"),
+        )
+        states["dob"] = pd.to_datetime(states["dob"])
+
+        averages: pd.DataFrame = long_df.groupby("fighter")[cls.AVERAGED_STATS].mean()
+        for stat in cls.AVERAGED_STATS:
+            states[stat.replace("percent", "average")] = averages[stat]
+        return states
+
+    def predict(self, matchups: pd.DataFrame) -> pd.DataFrame:
+        """
+        Predicts the winner of each matchup.
+
+        Args:
+            matchups (pd.DataFrame): "red_fighter" and "blue_fighter" columns, and
+                optionally "weight_class" (defaults to the red fighter's latest),
+                "title_bout" ("Y" or "N", defaults to "N") and "date" the fighters'
+                ages are taken at (defaults to today).
+
+        Raises:
+            UnknownFighterException: if any of the fighters aren't in the training data.
+
+        Returns:
+            pd.DataFrame: the fighters, the red fighter's win probability and the predicted winner.
+        """
+        X: np.ndarray = self._features(matchups)
+        if self._forest is not None:
+            probabilities = self._forest.predict_proba(X)
+        else:
+            probabilities = self.model.predict_proba(
+                pd.DataFrame(X, columns=self.feature_names)
+            )
+
+        red_fighters = matchups[Columns.RED_FIGHTER].to_numpy()
+        blue_fighters = matchups[Columns.BLUE_FIGHTER].to_numpy()
+        red_wins: np.ndarray = probabilities.argmax(axis=1) == self._red_win_class
+        return pd.DataFrame(
+            {
+                "red_fighter": red_fighters,
+                "blue_fighter": blue_fighters,
+                "red_win_probability": probabilities[:, self._red_win_class],
+                "predicted_winner": np.where(red_wins, red_fighters, blue_fighters),
+            }
+        )
+
+    def _encode_states(self, fighter_states: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Each column of the fighters' states as an array, with the stances and weight
+        classes already encoded.
+        """
+        states: Dict[str, np.ndarray] = {
+            column: fighter_states[column].to_numpy()
+            for column in fighter_states.columns
+        }
+        states["stance"] = self.encoders.encode("stance", states["stance"])
+        states[Columns.WEIGHT_CLASS] = self.encoders.encode(
+            "weight_class", states[Columns.WEIGHT_CLASS]
+        )
+        states["dob"] = fighter_states["dob"].to_numpy(dtype="datetime64[ns]")
+        return states
+
+    def _features(self, matchups: pd.DataFrame) -> np.ndarray:
+        """
+        Builds the model's encoded features, one row per matchup, by looking up both
+        corners' states.
+        """
+        rows: Dict[str, np.ndarray] = {
+            corner: self._fighters.get_indexer(matchups[f"{corner}_fighter"])
+            for corner in FighterHistory.CORNERS
+        }
+        unknown = [
+            fighter
+            for corner, positions in rows.items()
+            for fighter in matchups[f"{corner}_fighter"].to_numpy()[positions == -1]
+        ]
+        if unknown:
+            raise UnknownFighterException(list(dict.fromkeys(unknown)))
+
+        red, blue = rows["red"], rows["blue"]
+        dates = (
+            pd.to_datetime(matchups["date"]).to_numpy(dtype="datetime64[ns]")
+            if "date" in matchups
+            else np.datetime64(pd.Timestamp.today().normalize())
+        )
+        features: Dict[str, np.ndarray] = {
+            Columns.WEIGHT_CLASS: self._categorical(
+                matchups,
+                Columns.WEIGHT_CLASS,
+                "weight_class",
+                self._states[Columns.WEIGHT_CLASS][red],
+            ),
+            Columns.TITLE_BOUT: self._categorical(
+                matchups,
+                Columns.TITLE_BOUT,
+                "title_bout",
+                np.full(len(matchups), self._not_title_bout),
+            ),
+            Columns.HEIGHT_DIFF: self._states["height"][red]
+            - self._states["height"][blue],
+            Columns.REACH_DIFF: self._states["reach"][red]
+            - self._states["reach"][blue],
+        }
+        for corner, positions in rows.items():
+            features[f"{corner}_age"] = DateCleaner.ages(
+                dates, self._states["dob"][positions]
+            )
+            for column in self.CORNER_FEATURES:
+                features[f"{corner}_{column}"] = self._states[column][positions]
+
+        return np.column_stack(
+            [features[column] for column in self.feature_names]
+        ).astype(float)
+
+    def _categorical(
+        self, matchups: pd.DataFrame, column: str, encoder: str, defaults: np.ndarray
+    ) -> np.ndarray:
+        """
+        The matchups' column encoded, where it was given, otherwise the defaults.
+        """
+        if column not in matchups:
+            return defaults
+        given: np.ndarray = matchups[column].notna().to_numpy()
+        codes = defaults.astype(float)
+        if given.any():
+            codes[given] = self.encoders.encode(
+                encoder, matchups[column].to_numpy()[given]
+            )
+        return codes
@@ -0,0 +1,170 @@
+"""
+Module to keep the model, the next card's predictions and the fighters' states loaded between requests.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+from joblib import load
+
+from src.config import PathSettings
+from src.lib.data_managers import CSVStorage, StorageBackendABC
+from src.lib.exceptions import ModelNotTrainedException, NoNextEventException
+from .encoders import FeatureEncoders
+from .inference import Inference
+from .matchups import MatchupPredictor
+
+# Modification time and size of a file, a new version of it changes at least one.
+FileVersion = Tuple[int, int]
+
+
+class ModelRegistry:
+    """
+    Keeps the model and the next card's predictions in memory for the life of the process.
+
+    The model and its encoders are loaded on first use and again only when their
+    files change. Likewise the next card is read, its features built and the
+    predictions made once, and kept until the model or the card changes. The fighters' states
+    for predicting any matchup are built from the training data the same way. Each
+    request after the first only checks the files' modification times and sizes.
+
+    Safe to share between the threads of a worker.
+    """
+
+    def __init__(
+        self,
+        model_path: Path,
+        next_event_path: Path,
+        storage: Optional[StorageBackendABC] = None,
+        mmap_mode: Optional[str] = None,
+        encoders_path: Path = PathSettings.MODEL_ENCODERS,
+        training_path: Path = PathSettings.TRAINING_DATA_CSV,
+        training_storage: Optional[StorageBackendABC] = None,
+    ) -> None:
+        """
+        Args:
+            model_path (Path): the saved model, see PathSettings.MODEL_WEIGHTS.
+            next_event_path (Path): the next card's features, see PathSettings.NEXT_EVENT_FEATURES_CSV.
+            storage (Optional[StorageBackendABC]): format the next card is stored in. Defaults to csv.
+            mmap_mode (Optional[str]): joblib mmap_mode to load the model with, see InferenceSettings.
+            encoders_path (Path): the encoders saved with the model.
+            training_path (Path): the training data the fighters' states are built from.
+            training_storage (Optional[StorageBackendABC]): format the training data is stored in. Defaults to csv.
+        """
+        self.model_path = model_path
+        self.encoders_path = encoders_path
+        self.storage = storage if storage is not None else CSVStorage()
+        self.next_event_path = self.storage.resolve(next_event_path)
+        self.training_storage = (
+            training_storage if training_storage is not None else CSVStorage()
+        )
+        self.training_path = self.training_storage.resolve(training_path)
+        self.mmap_mode = mmap_mode
+
+        self._lock = threading.Lock()
+        self._model: Any = None
+        self._encoders: Optional[FeatureEncoders] = None
+        self._model_version: Optional[Tuple[FileVersion, FileVersion]] = None
+        self._predictions: Optional[List[Dict[str, str]]] = None
+        self._predictions_version: Optional[Tuple[Any, FileVersion]] = None
+        self._fighter_states: Optional[pd.DataFrame] = None
+        self._training_version: Optional[FileVersion] = None
+        self._matchup_predictor: Optional[MatchupPredictor] = None
+        self._matchup_predictor_version: Optional[Tuple[Any, FileVersion]] = None
+
+    @staticmethod
+    def _file_version(path: Path) -> FileVersion:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _model_file_versions(self) -> Tuple[FileVersion, FileVersion]:
+        """
+        Raises:
+            ModelNotTrainedException: If the model or its encoders haven't been saved.
+        """
+        versions = []
+        for path in (self.model_path, self.encoders_path):
+            try:
+                versions.append(self._file_version(path))
+            except FileNotFoundError as exc:
+                raise ModelNotTrainedException(path) from exc
+        return versions[0], versions[1]
+
+    def model(self) -> Any:
+        """
+        Returns the model, loading it if the weights file has changed since it was last loaded.
+        """
+        model_version = self._model_file_versions()
+        with self._lock:
+            return self._load_model(model_version)
+
+    def predictions(self) -> List[Dict[str, str]]:
+        """
+        Returns the predicted winner of each bout on the next card, see Inference.predict.
+        The same list is returned until the model or the next card changes, so it
+        mustn't be modified.
+
+        Raises:
+            ModelNotTrainedException: If the model or its encoders haven't been saved.
+            NoNextEventException: If the next card's features haven't been saved.
+        """
+        model_version = self._model_file_versions()
+        try:
+            versions = (model_version, self._file_version(self.next_event_path))
+        except FileNotFoundError as exc:
+            raise NoNextEventException(self.next_event_path) from exc
+        with self._lock:
+            if versions == self._predictions_version:
+                return self._predictions
+
+            model = self._load_model(versions[0])
+            # The card's features depend on the encoders, so are built again with the model.
+            inference = Inference(
+                model,
+                self.next_event_path,
+                storage=self.storage,
+                encoders=self._encoders,
+            )
+            self._predictions = inference.predict()
+            self._predictions_version = versions
+            return self._predictions
+
+    def matchup_predictor(self) -> MatchupPredictor:
+        """
+        Returns the predictor for any matchups, rebuilt if the model or the training data has changed.
+        """
+        versions = (
+            self._model_file_versions(),
+            self._file_version(self.training_path),
+        )
+        with self._lock:
+            if versions == self._matchup_predictor_version:
+                return self._matchup_predictor
+
+            model_version, training_version = versions
+            model = self._load_model(model_version)
+            if training_version != self._training_version:
+                training_df = self.training_storage.read(
+                    self.training_path, columns=MatchupPredictor.TRAINING_COLUMNS
+                )
+                self._fighter_states = MatchupPredictor.fighter_states(training_df)
+                self._training_version = training_version
+
+            self._matchup_predictor = MatchupPredictor(
+                model, self._encoders, self._fighter_states
+            )
+            self._matchup_predictor_version = versions
+            return self._matchup_predictor
+
+    def _load_model(self, model_version: Tuple[FileVersion, FileVersion]) -> Any:
+        """
+        Loads the model and its encoders if either has changed. Must be called holding the lock.
+        """
+        if model_version != self._model_version:
+            self._model = load(self.model_path, mmap_mode=self.mmap_mode)
+            self._encoders = FeatureEncoders.load(self.encoders_path)
+            self._model_version = model_version
+        return self._model
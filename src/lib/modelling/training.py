@@ -12,20 +12,27 @@ from loguru import logger
 
 import mlflow
 from sklearn.metrics import accuracy_score
-from sklearn.preprocessing import OrdinalEncoder
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier
 
 
-from src.lib.data_managers import CSVProcessingHandler
+from typing import Optional
+
+from src.lib.data_managers import CSVProcessingHandler, StorageBackendABC
 from src.config import PathSettings
 from src.lib.constants.columns import TRAINING_COLUMNS
+from .encoders import FeatureEncoders
 
 
 class Training(CSVProcessingHandler):
 
-    def __init__(self, csv_path: Path, allow_creation: bool = False) -> None:
-        super().__init__(csv_path, allow_creation)
+    def __init__(
+        self,
+        csv_path: Path,
+        allow_creation: bool = False,
+        storage: Optional[StorageBackendABC] = None,
+    ) -> None:
+        super().__init__(csv_path, allow_creation, storage)
         self.experiment = self._setup_experiment()
 
     def _setup_experiment(self):
@@ -42,29 +49,15 @@ class Training(CSVProcessingHandler):
         self.df = self.df.dropna()
         self.df = self.df[TRAINING_COLUMNS]
 
-        # one hot encode winner column
-        winner_encoder = OrdinalEncoder()
-        self.df["outcome"] = winner_encoder.fit_transform(self.df[["winner"]])
+        # The encoders are saved with the model, so inference encodes values the same way.
+        self.encoders = FeatureEncoders.fit(self.df)
+        self.df["outcome"] = self.encoders.encode_outcome(self.df["winner"])
 
         # Drop winner column
         self.df = self.df.drop(columns=["winner"])
 
-        # one hot encode stance columns
-        stance_encoder = OrdinalEncoder()
-        self.df["red_stance"] = stance_encoder.fit_transform(self.df[["red_stance"]])
-        self.df["blue_stance"] = stance_encoder.fit_transform(self.df[["blue_stance"]])
-
-        # one hot encode title bout column
-        title_bout_encoder = OrdinalEncoder()
-        self.df["title_bout"] = title_bout_encoder.fit_transform(
-            self.df[["title_bout"]]
-        )
-
-        # one hot encode weight class column
-        weight_class_encoder = OrdinalEncoder()
-        self.df["weight_class"] = weight_class_encoder.fit_transform(
-            self.df[["weight_class"]]
-        )
+        # Encode the stance, title bout and weight class columns
+        self.df = self.encoders.transform(self.df)
 
     def train_model(self):
         self._prepare_data()
@@ -94,6 +87,7 @@ class Training(CSVProcessingHandler):
             logger.info(f"Accuracy: {accuracy}")
 
             dump(random_forest, PathSettings.MODEL_WEIGHTS)
+            self.encoders.save(PathSettings.MODEL_ENCODERS)
 
 
 # def setup_mlflow(func, experiment_name: str):
@@ -0,0 +1,3 @@
+from .rate_limiting import AdaptiveRateLimiter, RequestMetrics, TokenBucket
+from .session import SessionManager
+from .snapshots import SnapshotStore
@@ -0,0 +1,165 @@
+"""
+Module to shape the rate requests are sent to each host.
+"""
+
+import asyncio
+import time
+from typing import Dict
+from urllib.parse import urlsplit
+
+from src.config import ScraperSettings
+
+
+class TokenBucket:
+    """
+    Token bucket allowing `rate` requests per second on average, with bursts of up to `capacity`.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        # Waiters queue on the lock so tokens are handed out in arrival order.
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """
+        Waits until a token is available and takes it.
+        """
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def drain(self) -> None:
+        """
+        Empties the bucket so no burst is sent straight after being throttled.
+        """
+        self._refill()
+        self._tokens = min(self._tokens, 0)
+
+
+class AdaptiveRateLimiter:
+    """
+    Keeps a token bucket per host and adapts its rate to how the host responds.
+    The rate is cut multiplicatively when the host throttles us (429, 5xx or timeouts)
+    and recovers additively with every successful request.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float = ScraperSettings.REQUESTS_PER_SECOND,
+        min_requests_per_second: float = ScraperSettings.MIN_REQUESTS_PER_SECOND,
+        max_requests_per_second: float = ScraperSettings.MAX_REQUESTS_PER_SECOND,
+        burst: float = ScraperSettings.RATE_LIMIT_BURST,
+        backoff_factor: float = ScraperSettings.RATE_LIMIT_BACKOFF_FACTOR,
+        recovery_step: float = ScraperSettings.RATE_LIMIT_RECOVERY_STEP,
+        throttle_cooldown: float = ScraperSettings.RATE_LIMIT_THROTTLE_COOLDOWN,
+    ) -> None:
+        """
+        Args:
+            requests_per_second (float): starting rate for each host.
+            min_requests_per_second (float): rate is never cut below this.
+            max_requests_per_second (float): rate never recovers above this.
+            burst (float): number of requests that can be sent back to back.
+            backoff_factor (float): multiplier applied to the rate when throttled.
+            recovery_step (float): requests per second added back after each success.
+            throttle_cooldown (float): seconds after a cut in which further throttles are ignored,
+                so a batch of requests failing together only cuts the rate once.
+        """
+        self.requests_per_second = requests_per_second
+        self.min_requests_per_second = min_requests_per_second
+        self.max_requests_per_second = max_requests_per_second
+        self.burst = burst
+        self.backoff_factor = backoff_factor
+        self.recovery_step = recovery_step
+        self.throttle_cooldown = throttle_cooldown
+
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._last_cut: Dict[str, float] = {}
+
+    def _bucket(self, url: str) -> TokenBucket:
+        host = urlsplit(url).netloc
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.requests_per_second, self.burst)
+        return self._buckets[host]
+
+    def rate(self, url: str) -> float:
+        """
+        Returns the current requests per second allowed for the url's host.
+        """
+        return self._bucket(url).rate
+
+    async def acquire(self, url: str) -> None:
+        await self._bucket(url).acquire()
+
+    def record_success(self, url: str) -> None:
+        bucket = self._bucket(url)
+        bucket.rate = min(
+            self.max_requests_per_second, bucket.rate + self.recovery_step
+        )
+
+    def record_throttle(self, url: str) -> None:
+        bucket = self._bucket(url)
+        host = urlsplit(url).netloc
+        now = time.monotonic()
+        if now - self._last_cut.get(host, float("-inf")) < self.throttle_cooldown:
+            return
+
+        self._last_cut[host] = now
+        bucket.rate = max(
+            self.min_requests_per_second, bucket.rate * self.backoff_factor
+        )
+        bucket.drain()
+
+
+class RequestMetrics:
+    """
+    Counts the requests made through a session to report the throughput achieved.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self.succeeded = 0
+        self.throttled = 0
+        self.failed = 0
+        self.retries = 0
+        self.replayed = 0
+        self.not_modified = 0
+        self.bytes_received = 0
+
+    def record_success(self, n_bytes: int) -> None:
+        self.succeeded += 1
+        self.bytes_received += n_bytes
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.succeeded / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def summary(self) -> Dict[str, float]:
+        return {
+            "succeeded": self.succeeded,
+            "throttled": self.throttled,
+            "failed": self.failed,
+            "retries": self.retries,
+            "replayed": self.replayed,
+            "not_modified": self.not_modified,
+            "megabytes": self.bytes_received / 1_000_000,
+            "elapsed": self.elapsed,
+            "requests_per_second": self.requests_per_second,
+        }
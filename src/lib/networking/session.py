@@ -0,0 +1,293 @@
+"""
+Module to manage the HTTP session shared by all scrapers during a run.
+"""
+
+from __future__ import annotations
+import asyncio
+from typing import Dict, Optional, Tuple, Union
+
+import aiohttp
+from loguru import logger
+
+from src.config import PathSettings, ScraperSettings
+from src.lib.exceptions import ScrapingException
+from .rate_limiting import AdaptiveRateLimiter, RequestMetrics
+from .snapshots import SnapshotStore
+
+
+class SessionManager:
+    """
+    Owns a single pooled aiohttp session so that every page scraped in a run
+    reuses the same connections instead of opening a new one per request.
+
+    Used as an async context manager:
+
+        async with SessionManager() as session:
+            html = await session.get_text(url)
+    """
+
+    SNAPSHOT_MODES = ("off", "record", "replay")
+
+    # Keys of the validators returned by get_text_if_modified.
+    ETAG = "etag"
+    LAST_MODIFIED = "last_modified"
+
+    def __init__(
+        self,
+        limit: int = ScraperSettings.CONNECTION_LIMIT,
+        limit_per_host: int = ScraperSettings.CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout: float = ScraperSettings.KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: int = ScraperSettings.DNS_CACHE_TTL,
+        request_timeout: float = ScraperSettings.REQUEST_TIMEOUT,
+        max_concurrent_requests: int = ScraperSettings.MAX_CONCURRENT_REQUESTS,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        max_retries: int = ScraperSettings.MAX_RETRIES,
+        snapshot_mode: str = ScraperSettings.SNAPSHOT_MODE,
+        snapshot_store: Optional[SnapshotStore] = None,
+    ) -> None:
+        """
+        Initialises the SessionManager class. The session itself is only opened on entry.
+
+        Args:
+            limit (int): Total number of pooled connections.
+            limit_per_host (int): Maximum number of pooled connections to a single host.
+            keepalive_timeout (float): Seconds an idle connection is kept open for reuse.
+            dns_cache_ttl (int): Seconds a resolved hostname is cached for.
+            request_timeout (float): Total seconds allowed for a single request.
+            max_concurrent_requests (int): Requests allowed in flight at once across all scrapers.
+            rate_limiter (Optional[AdaptiveRateLimiter]): Shapes the requests sent to each host.
+                Defaults to one built from ScraperSettings.
+            max_retries (int): Retries for a throttled or failed request before giving up.
+            snapshot_mode (str): "off", "record" to save every page fetched to the snapshot store,
+                or "replay" to serve every page from it without making any requests.
+            snapshot_store (Optional[SnapshotStore]): Store used when snapshot_mode isn't "off".
+                Defaults to one in PathSettings.SNAPSHOT_DIR.
+
+        Raises:
+            ValueError: If snapshot_mode is not one of the options above.
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.request_timeout = request_timeout
+        self.max_concurrent_requests = max_concurrent_requests
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Global budget - cards, bouts and corners all fan out, this keeps the total bounded.
+        self._request_slots = asyncio.Semaphore(max_concurrent_requests)
+        self.rate_limiter = (
+            rate_limiter if rate_limiter is not None else AdaptiveRateLimiter()
+        )
+        self.max_retries = max_retries
+        self.metrics = RequestMetrics()
+
+        if snapshot_mode not in self.SNAPSHOT_MODES:
+            raise ValueError(
+                f"Unknown snapshot mode '{snapshot_mode}', choose from {self.SNAPSHOT_MODES}"
+            )
+        self.snapshot_mode = snapshot_mode
+        self.snapshot_store = (
+            snapshot_store
+            if snapshot_store is not None or snapshot_mode == "off"
+            else SnapshotStore(PathSettings.SNAPSHOT_DIR)
+        )
+
+    async def __aenter__(self) -> SessionManager:
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def open(self) -> None:
+        """
+        Creates the connection pool and the session that uses it.
+        Nothing is opened when replaying snapshots as no requests are made.
+        """
+        if self._session is not None or self.snapshot_mode == "replay":
+            return
+
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+        )
+
+    async def close(self) -> None:
+        """
+        Closes the session and every pooled connection.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            raise RuntimeError(
+                "Session has not been opened, use SessionManager as an async context manager."
+            )
+        return self._session
+
+    async def get_text(
+        self, url: str, params: Optional[Dict[str, Union[str, int]]] = None
+    ) -> str:
+        """
+        Requests a page using the pooled session and returns its body.
+        Waits on the host's rate limiter before each attempt and retries
+        throttled (429, 5xx) or timed out requests with exponential backoff.
+        When recording, the page is saved to the snapshot store; when replaying
+        it is read from the store instead.
+
+        Args:
+            url (str): URL to request.
+            params (Optional[Dict[str, Union[str, int]]], optional): params dict for the request. Defaults to None.
+
+        Raises:
+            ScrapingException: if the page could not be fetched after all retries,
+                or is not in the snapshot store when replaying.
+
+        Returns:
+            str: the html of the page.
+        """
+        if self.snapshot_mode == "replay":
+            return self._replay(url, params)
+
+        html, _ = await self._get(url, params=params)
+        return html  # type: ignore
+
+    async def get_text_if_modified(
+        self, url: str, validators: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[str], Dict[str, str]]:
+        """
+        Conditionally requests a page, sending the validators from the last time it was fetched
+        as If-None-Match / If-Modified-Since so the host can answer 304 without a body.
+
+        Args:
+            url (str): URL to request.
+            validators (Optional[Dict[str, str]], optional): "etag" and/or "last_modified"
+                returned by the previous fetch. Defaults to None, an unconditional request.
+
+        Raises:
+            ScrapingException: if the page could not be fetched after all retries.
+
+        Returns:
+            Tuple[Optional[str], Dict[str, str]]: the html of the page, or None if it is unchanged,
+                and the validators to send next time.
+        """
+        validators = validators or {}
+        if self.snapshot_mode == "replay":
+            return self._replay(url), {}
+
+        headers: Dict[str, str] = {}
+        if validators.get(self.ETAG):
+            headers["If-None-Match"] = validators[self.ETAG]
+        if validators.get(self.LAST_MODIFIED):
+            headers["If-Modified-Since"] = validators[self.LAST_MODIFIED]
+
+        html, new_validators = await self._get(url, headers=headers)
+        # A 304 doesn't have to repeat the validators, keep the ones that were sent.
+        if html is None:
+            return None, {**validators, **new_validators}
+        return html, new_validators
+
+    async def _get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Union[str, int]]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Optional[str], Dict[str, str]]:
+        """
+        Requests a page with retries, returning its body (None for a 304) and its validators.
+        """
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                self.metrics.retries += 1
+
+            await self.rate_limiter.acquire(url)
+            async with self._request_slots:
+                logger.info(f"Scraping URL: {url}")
+                try:
+                    async with self.session.get(
+                        url, params=params, headers=headers
+                    ) as response:
+                        if response.status == 304:
+                            self.rate_limiter.record_success(url)
+                            self.metrics.not_modified += 1
+                            return None, self._parse_validators(response)
+                        if not self._is_throttled(response.status):
+                            html: str = await response.text()
+                            self.rate_limiter.record_success(url)
+                            self.metrics.record_success(len(html))
+                            if self.snapshot_mode == "record":
+                                self.snapshot_store.put(url, html, params=params)
+                            return html, self._parse_validators(response)
+                        retry_after = self._parse_retry_after(response)
+                        reason = f"status {response.status}"
+                except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                    retry_after = None
+                    reason = repr(e)
+
+            self.rate_limiter.record_throttle(url)
+            self.metrics.throttled += 1
+            if attempt == self.max_retries:
+                break
+
+            delay = self._backoff_delay(attempt, retry_after)
+            logger.warning(
+                f"Throttled on {url} ({reason}), retrying in {delay:.1f}s. "
+                f"Rate now {self.rate_limiter.rate(url):.2f} req/s."
+            )
+            await asyncio.sleep(delay)
+
+        self.metrics.failed += 1
+        raise ScrapingException(
+            f"Failed to fetch {url} after {self.max_retries + 1} attempts"
+        )
+
+    def _replay(
+        self, url: str, params: Optional[Dict[str, Union[str, int]]] = None
+    ) -> str:
+        html = self.snapshot_store.get(url, params=params)
+        if html is None:
+            self.metrics.failed += 1
+            raise ScrapingException(
+                f"No snapshot of {SnapshotStore.request_key(url, params)} to replay"
+            )
+        self.metrics.replayed += 1
+        self.metrics.record_success(len(html))
+        return html
+
+    @staticmethod
+    def _is_throttled(status: int) -> bool:
+        return status == 429 or status >= 500
+
+    @classmethod
+    def _parse_validators(cls, response: aiohttp.ClientResponse) -> Dict[str, str]:
+        validators = {
+            cls.ETAG: response.headers.get("ETag"),
+            cls.LAST_MODIFIED: response.headers.get("Last-Modified"),
+        }
+        return {key: value for key, value in validators.items() if value}
+
+    @staticmethod
+    def _parse_retry_after(response: aiohttp.ClientResponse) -> Optional[float]:
+        try:
+            return float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            return None
+
+    @staticmethod
+    def _backoff_delay(attempt: int, retry_after: Optional[float]) -> float:
+        if retry_after is not None:
+            return min(retry_after, ScraperSettings.RETRY_BACKOFF_MAX)
+        return min(
+            ScraperSettings.RETRY_BACKOFF_BASE * 2**attempt,
+            ScraperSettings.RETRY_BACKOFF_MAX,
+        )
@@ -0,0 +1,124 @@
+"""
+Module to keep a copy of every page fetched so scrapers can be re-run offline.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+from urllib.parse import urlencode
+
+
+class SnapshotStore:
+    """
+    Content addressed store of compressed html pages.
+
+    Each page body is gzipped and saved once under the sha256 of its content,
+    so pages that are identical (e.g. unchanged listings fetched on different runs)
+    share a single file. An append-only json lines index maps each requested url
+    (including its params) to the content hash of the last body fetched for it.
+
+        snapshots/
+            index.jsonl
+            objects/3f/3fa1...c2.html.gz
+    """
+
+    INDEX_FILE: str = "index.jsonl"
+    OBJECTS_DIR: str = "objects"
+
+    def __init__(self, root: Path) -> None:
+        """
+        Initialises the store, creating the directory and loading the index if it exists.
+
+        Args:
+            root (Path): directory the snapshots are kept in.
+        """
+        self.root = root
+        self.index_path = root / self.INDEX_FILE
+        self.objects_dir = root / self.OBJECTS_DIR
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+
+        self._index: Dict[str, str] = {}
+        self.instantiate()
+
+    def instantiate(self) -> None:
+        if not self.index_path.exists():
+            return
+
+        with open(self.index_path, "r") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-append can only leave the last line incomplete.
+                    continue
+                self._index[entry["url"]] = entry["sha256"]
+
+    @staticmethod
+    def request_key(
+        url: str, params: Optional[Dict[str, Union[str, int]]] = None
+    ) -> str:
+        """
+        Returns the key a request is stored under, params are sorted so their order doesn't matter.
+        """
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()))}"
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.html.gz"
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    @property
+    def urls(self) -> List[str]:
+        return list(self._index)
+
+    def get(
+        self, url: str, params: Optional[Dict[str, Union[str, int]]] = None
+    ) -> Optional[str]:
+        """
+        Returns the stored html for the request, or None if it was never fetched.
+        """
+        digest = self._index.get(self.request_key(url, params))
+        if digest is None:
+            return None
+        with gzip.open(self._object_path(digest), "rt", encoding="utf-8") as f:
+            return f.read()
+
+    def put(
+        self, url: str, html: str, params: Optional[Dict[str, Union[str, int]]] = None
+    ) -> str:
+        """
+        Stores the html fetched for the request.
+
+        Returns:
+            str: sha256 of the html, the name it is stored under.
+        """
+        content = html.encode("utf-8")
+        digest = hashlib.sha256(content).hexdigest()
+
+        object_path = self._object_path(digest)
+        if not object_path.exists():
+            object_path.parent.mkdir(exist_ok=True)
+            # Written to a temporary file first so a partial object is never read back.
+            tmp_path = object_path.with_name(object_path.name + ".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(gzip.compress(content, mtime=0))
+            os.replace(tmp_path, object_path)
+
+        key = self.request_key(url, params)
+        if self._index.get(key) != digest:
+            self._index[key] = digest
+            entry = {"url": key, "sha256": digest, "fetched_at": time.time()}
+            with open(self.index_path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+
+        return digest
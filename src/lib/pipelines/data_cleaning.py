@@ -2,8 +2,12 @@
 This script is respoonsible for taking in the scraped data and ceaning it for use in the model.
 """
 
-from src.lib.engines.data_cleaning import DataCleaningEngine
-from src.config import PathSettings
+from src.lib.engines.data_cleaning import (
+    DataCleaningEngine,
+    IncrementalDataCleaningEngine,
+)
+from src.lib.data_managers import get_storage
+from src.config import PathSettings, StorageSettings
 from src.lib.preprocessing.cleaners import (
     CoreCleaner,
     DateCleaner,
@@ -14,10 +18,25 @@ from src.lib.preprocessing.cleaners import (
 
 
 class DataCleaningPipeline:
-    def run(self):
-        data_cleaner = DataCleaningEngine(
-            csv_path=PathSettings.RAW_DATA_CSV, allow_creation=False
-        )
+    def run(self, incremental: bool = True):
+        """
+        Cleans the raw data and writes the clean dataset.
+
+        Args:
+            incremental (bool): only clean the bouts scraped since the last run and merge
+                them into the existing clean data. Otherwise every bout is cleaned again.
+        """
+        if incremental:
+            data_cleaner = IncrementalDataCleaningEngine(
+                csv_path=PathSettings.RAW_DATA_CSV,
+                storage=get_storage(StorageSettings.RAW_DATA),
+            )
+        else:
+            data_cleaner = DataCleaningEngine(
+                csv_path=PathSettings.RAW_DATA_CSV,
+                allow_creation=False,
+                storage=get_storage(StorageSettings.RAW_DATA),
+            )
         cleaners = [
             CoreCleaner,
             FighterCleaner,
@@ -1,11 +1,59 @@
-from src.config import PathSettings
-from src.lib.preprocessing.feature_engineering import FeatureEngineering
+from typing import Callable
+
+import pandas as pd
+
+from src.config import PathSettings, StorageSettings
+from src.lib.data_managers import get_storage
+from src.lib.preprocessing.feature_engineering import (
+    FeatureEngineering,
+    IncrementalFeatureEngineering,
+)
 
 
 class FeatureEngineeringPipeline:
-    def run(self):
-        feature_engineering = FeatureEngineering(
-            csv_path=PathSettings.CLEAN_DATA_CSV, allow_creation=False
-        )
+    def run(self, incremental: bool = True):
+        """
+        Builds the training data from the clean data, and the next card's features
+        for inference.
+
+        Args:
+            incremental (bool): only add the bouts cleaned since the last run to the
+                training data, and update the next card's averages to match. Otherwise
+                every bout is used again and the card is used as scraped.
+        """
+        if not incremental:
+            feature_engineering = FeatureEngineering(
+                csv_path=PathSettings.CLEAN_DATA_CSV,
+                allow_creation=False,
+                storage=get_storage(StorageSettings.CLEAN_DATA),
+            )
+            feature_engineering.run()
+            self._write_next_event(lambda next_event_df: next_event_df)
+            return
 
+        feature_engineering = IncrementalFeatureEngineering(
+            csv_path=PathSettings.CLEAN_DATA_CSV,
+            storage=get_storage(StorageSettings.CLEAN_DATA),
+        )
         feature_engineering.run()
+        self._write_next_event(feature_engineering.next_event_averages)
+
+    def _write_next_event(
+        self, build_features: Callable[[pd.DataFrame], pd.DataFrame]
+    ) -> None:
+        """
+        Writes the next card's features to their own file. The scraped card is left as
+        it is, so scraping the same card again doesn't look like a change to it.
+        """
+        next_event_storage = get_storage(StorageSettings.NEXT_EVENT)
+        try:
+            next_event_df = next_event_storage.read(PathSettings.NEXT_EVENT_CSV)
+        except FileNotFoundError:
+            # No card to predict, don't leave the last one's features behind.
+            next_event_storage.resolve(PathSettings.NEXT_EVENT_FEATURES_CSV).unlink(
+                missing_ok=True
+            )
+            return
+        next_event_storage.write(
+            build_features(next_event_df), PathSettings.NEXT_EVENT_FEATURES_CSV
+        )
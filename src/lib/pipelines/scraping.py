@@ -5,9 +5,15 @@ from pathlib import Path
 import pandas as pd
 
 from src.lib.engines import ScrapingEngine, DataCleaningEngine
-from src.lib.exceptions import ScrapingException
-from src.lib.data_managers import ProcessingHandlerABC
-from src.lib.data_managers.cache import CacheABC
+from src.lib.exceptions import PartialCardException, ScrapingException
+from src.lib.data_managers import (
+    EventLogCache,
+    EventStatus,
+    ProcessingHandlerABC,
+    ProfileRefresh,
+    get_storage,
+)
+from src.lib.networking import SessionManager
 from src.lib.scrapers import (
     HomepageScraper,
     BoutScraper,
@@ -16,10 +22,11 @@ from src.lib.scrapers import (
 from src.lib.preprocessing.cleaners import (
     CoreCleaner,
     DateCleaner,
+    FighterCleaner,
     HeightReachCleaner,
     StatsCleaner,
 )
-from src.config import PathSettings, console
+from src.config import PathSettings, StorageSettings, console
 
 from .constants import UFC_HOMEPAGE_URL
 
@@ -29,10 +36,10 @@ class ScrapingPipeline:
     Runs the pipeline to scrape the UFC stats data
     """
 
-    # Limit the number of concurrent tasks
+    # Limit the number of cards scraped at once. Requests in flight are bounded by the session.
     sem = asyncio.Semaphore(10)
 
-    def __init__(self, scraping_engine: ScrapingEngine, cache: CacheABC) -> None:
+    def __init__(self, scraping_engine: ScrapingEngine, cache: EventLogCache) -> None:
         self.scraping_engine = scraping_engine
         self.cache = cache
 
@@ -41,64 +48,105 @@ class ScrapingPipeline:
         Executes all the logic from the scrapers and writes the data to the chosen data store.
         """
 
-        cached_event_links: List[str] = self.cache.get()
+        # One pooled session is shared by every scraper for the whole run,
+        # and the worker processes pages are parsed in are shut down at the end of it.
+        with self.scraping_engine.parsing_pool:
+            async with SessionManager() as session:
+                # Instantiate the homepage scraper and get all the links to each event.
+                homepage = HomepageScraper(
+                    url=UFC_HOMEPAGE_URL,
+                    cache=self.cache,
+                    session=session,
+                    history_complete=self.cache.history_complete,
+                    to_retry=self.cache.to_retry,
+                )
 
-        # Instantiate the homepage scraper and get all the links to each event.
-        homepage = HomepageScraper(
-            url=UFC_HOMEPAGE_URL,
-            cache=cached_event_links,
-        )
+                # Scrape only events that are not in the cache.
+                filtered_event_links: List[str] = await homepage.scrape_url()
 
-        # Scrape only events that are not in the cache.
-        filtered_event_links: List[str] = await homepage.scrape_url()
+                results = await self._scrape_events(
+                    filtered_event_links,
+                    raw_data_processor,
+                    session,
+                )
 
-        results = await self._scrape_events(
-            filtered_event_links,
-            homepage,
-            raw_data_processor,
-        )
+        self._display_request_metrics(session)
 
         for result in results:
             if isinstance(result, ScrapingException):
                 console.log(result)
 
-        self.cache.write(homepage.cache)
+        # Every event on the site has been attempted, later runs only need the newest pages.
+        if homepage.listed_every_page and all(
+            self.cache.status(link) is not None for link in filtered_event_links
+        ):
+            self.cache.mark_history_complete()
+
+        # Each event was logged as it finished, compact the log down to one line per event.
+        self.cache.write()
         raw_data_processor.write()
+        self._display_event_cache_stats()
+
+        self.scraping_engine.fighter_cache.write()
+        self._display_fighter_cache_stats()
+
+    def _display_request_metrics(self, session: SessionManager) -> None:
+        """
+        Prints out the throughput achieved against the site for the run.
+        """
+        metrics = session.metrics.summary
+        console.log(
+            f"Requests: [bold green]{metrics['succeeded']}[/] succeeded, "
+            f"[bold yellow]{metrics['throttled']}[/] throttled, "
+            f"[bold red]{metrics['failed']}[/] failed, {metrics['retries']} retries, "
+            f"{metrics['replayed']} replayed from snapshots. "
+            f"{metrics['megabytes']:.1f} MB in {metrics['elapsed']:.1f}s "
+            f"([bold blue]{metrics['requests_per_second']:.1f}[/] req/s)."
+        )
+
+    def _display_event_cache_stats(self) -> None:
+        """
+        Prints out how many events have been scraped and which need retrying.
+        """
+        stats = self.cache.stats
+        console.log(
+            f"Event cache: [bold green]{stats[EventStatus.SCRAPED]}[/] scraped, "
+            f"[bold yellow]{stats[EventStatus.PARTIAL]}[/] partial, "
+            f"[bold red]{stats[EventStatus.FAILED]}[/] failed."
+        )
+        for status in (EventStatus.PARTIAL, EventStatus.FAILED):
+            for event_link in self.cache.get(status):
+                console.log(f"To retry ({status}): {event_link}")
+
+    def _display_fighter_cache_stats(self) -> None:
+        """
+        Prints out how effective the fighter profile cache was for the run.
+        """
+        stats = self.scraping_engine.fighter_cache.stats
+        console.log(
+            f"Fighter profile cache: [bold green]{stats['hits']}[/] hits, "
+            f"[bold red]{stats['misses']}[/] misses, "
+            f"[bold blue]{stats['coalesced']}[/] coalesced, "
+            f"{stats['size']} profiles cached."
+        )
 
     async def _scrape_events(
         self,
         filtered_event_links: List[str],
-        homepage: HomepageScraper,
         raw_data_processor: ProcessingHandlerABC,
+        session: SessionManager,
     ) -> List[Any]:
         """
-        Asynchronously scrapes the events in batches of 10.
-        Creates a task for each event and adds it to the list of tasks.
+        Asynchronously scrapes the events.
+        Creates a task for each event, the number of cards scraped at once is bounded by the semaphore
+        and the rate requests are sent is shaped by the session's rate limiter.
         """
-        tasks = []
-        batch = []
-        batch_size = 10
-        for link_to_event in filtered_event_links:
-            batch.append(link_to_event)
-            if len(batch) == batch_size:
-                for link in batch:
-                    tasks.append(
-                        asyncio.create_task(
-                            self.scrape_card_task(link, homepage, raw_data_processor)
-                        )
-                    )
-                # Sleep for 1 second to avoid rate limiting
-                await asyncio.sleep(1)
-                batch = []
-
-        # Scrape any remaining events.
-        if batch:
-            for link in batch:
-                tasks.append(
-                    asyncio.create_task(
-                        self.scrape_card_task(link, homepage, raw_data_processor)
-                    )
-                )
+        tasks = [
+            asyncio.create_task(
+                self.scrape_card_task(link, raw_data_processor, session)
+            )
+            for link in filtered_event_links
+        ]
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -107,57 +155,105 @@ class ScrapingPipeline:
     async def scrape_card_task(
         self,
         link_to_event: str,
-        homepage: HomepageScraper,
         raw_data_processor: ProcessingHandlerABC,
+        session: SessionManager,
     ) -> None:
         async with self.sem:
             try:
                 await self.scraping_engine.scrape_card(
-                    link_to_event, homepage, raw_data_processor
+                    link_to_event, raw_data_processor, session
                 )
             except Exception as e:
                 console.log(f"Failed to scrape {link_to_event}")
                 console.log(e)
+                status = (
+                    EventStatus.PARTIAL
+                    if isinstance(e, PartialCardException)
+                    else EventStatus.FAILED
+                )
+                self.cache.mark(link_to_event, status)
                 raise ScrapingException(f"Failed to scrape {link_to_event}")
 
+            # Checkpoint after every card so a restart resumes from here.
+            # Rows are persisted before the cache so a card is never marked done without its data.
+            raw_data_processor.flush()
+            self.cache.mark(link_to_event, EventStatus.SCRAPED)
+
+    async def refresh_fighter_profiles(self) -> None:
+        """
+        Revalidates every cached fighter profile and writes back the ones that changed.
+        """
+        fighter_cache = self.scraping_engine.fighter_cache
+        console.log(f"Refreshing {len(fighter_cache)} cached fighter profiles.")
+
+        with self.scraping_engine.parsing_pool:
+            async with SessionManager() as session:
+                counts = await self.scraping_engine.refresh_fighter_profiles(session)
+
+        self._display_request_metrics(session)
+        console.log(
+            f"Fighter profiles: [bold green]{counts[ProfileRefresh.UPDATED]}[/] updated, "
+            f"{counts[ProfileRefresh.NOT_MODIFIED]} not modified, "
+            f"{counts[ProfileRefresh.UNCHANGED]} unchanged, "
+            f"[bold red]{counts[ProfileRefresh.FAILED]}[/] failed."
+        )
+        fighter_cache.write()
+
     async def scrape_next_event(self) -> None:
+        next_event_storage = get_storage(StorageSettings.NEXT_EVENT)
+
         # Removes the existing next event (if it exists)
-        existing_future_event = Path(PathSettings.NEXT_EVENT_CSV)
+        existing_future_event = next_event_storage.resolve(PathSettings.NEXT_EVENT_CSV)
         existing_future_event.unlink(missing_ok=True)
 
-        # Creates the next event object for cleaning and writing the csv
+        # Creates the next event object for cleaning and writing the data
         next_event_processor = DataCleaningEngine(
-            csv_path=PathSettings.NEXT_EVENT_CSV, allow_creation=True
+            csv_path=PathSettings.NEXT_EVENT_CSV,
+            allow_creation=True,
+            storage=next_event_storage,
         )
 
-        cache = self.cache.get()
-        homepage = HomepageScraper(
-            url=UFC_HOMEPAGE_URL,
-            cache=cache,
-        )
-        # Returns the link to the next event - different tag to previous events.
-        next_event_link = await homepage._get_next_event()
+        with self.scraping_engine.parsing_pool:
+            async with SessionManager() as session:
+                homepage = HomepageScraper(
+                    url=UFC_HOMEPAGE_URL,
+                    cache=self.cache,
+                    session=session,
+                )
+                # Returns the link to the next event - different tag to previous events.
+                next_event_link = await homepage._get_next_event()
 
-        fight_card = CardScraper(next_event_link)
-        event_name, date, location, fight_links = await fight_card.scrape_url()
+                fight_card = CardScraper(next_event_link, session=session)
+                event_name, date, location, fight_links = await fight_card.scrape_url()
 
-        fight_links = list(set(fight_links))
-        self.scraping_engine._display_event_details(
-            event_name, date, location, fight_links
-        )
+                # Dedupes in the card's order, so the same card is always written the same.
+                fight_links = list(dict.fromkeys(fight_links))
+                self.scraping_engine._display_event_details(
+                    event_name, date, location, fight_links
+                )
 
-        for fight in fight_links:
-            bout = BoutScraper(url=fight, date=date, location=location)
-            fight_ = await bout._aget_soup()
-            fighter_links = bout.get_fighter_links(fight=fight_)
-            fighter_profiles = await self.scraping_engine.scrape_fighter(fighter_links)
+                for fight in fight_links:
+                    bout = BoutScraper(
+                        url=fight, date=date, location=location, session=session
+                    )
+                    fight_ = await bout._aget_soup()
+                    fighter_links = bout.get_fighter_links(fight=fight_)
+                    fighter_profiles = await self.scraping_engine.scrape_fighter(
+                        fighter_links, session
+                    )
 
-            all_info = await bout.extract_future_bout_stats()
+                    all_info = await bout.extract_future_bout_stats()
 
-            full_fight_details = {**all_info, **fighter_profiles}
+                    full_fight_details = {**all_info, **fighter_profiles}
 
-            next_event_processor.add_row(full_fight_details)
+                    next_event_processor.add_row(full_fight_details)
 
-        cleaners = [CoreCleaner, DateCleaner, HeightReachCleaner, StatsCleaner]
+        cleaners = [
+            CoreCleaner,
+            FighterCleaner,
+            DateCleaner,
+            HeightReachCleaner,
+            StatsCleaner,
+        ]
         next_event_processor.clean_next_event(cleaners)
         next_event_processor.write()
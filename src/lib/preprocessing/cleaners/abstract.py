@@ -1,11 +1,15 @@
 from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
 
 import pandas as pd
 
 
 class CleanerABC(ABC):
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, state: Optional[Dict[str, Any]] = None):
         self.df = df
+        # Anything the cleaner derives from every row it has seen (e.g. running averages),
+        # carried between incremental runs. Must be json serialisable.
+        self.state: Dict[str, Any] = state if state is not None else {}
 
     @abstractmethod
     def clean(self) -> pd.DataFrame:
@@ -14,3 +18,10 @@ class CleanerABC(ABC):
     @abstractmethod
     def clean_next_event(self) -> pd.DataFrame:
         pass
+
+    def refresh(self) -> pd.DataFrame:
+        """
+        Updates rows cleaned on earlier runs after new rows have changed the state.
+        Cleaners that only look at one row at a time have nothing to update.
+        """
+        return self.df
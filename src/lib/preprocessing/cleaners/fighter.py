@@ -14,15 +14,21 @@ class FighterCleaner(CleanerABC):
         return self.df
 
     def clean_next_event(self):
-        raise NotImplementedError("FighterCleaner does not support next event cleaning")
+        """
+        Fills in missing stances and splits the fighters' records into wins and losses,
+        as for the training data. The weight class is already cleaned by the scraper.
+        """
+        self.clean_stance()
+        self.clean_record()
+        return self.df
 
     def clean_stance(self) -> None:
         """
         Fill missing stance values with 'Orthodox' for both blue and red corners.
         Orthodox is the most common stance.
         """
-        self.df[Columns.BLUE_STANCE].replace(np.nan, "Orthodox", inplace=True)
-        self.df[Columns.RED_STANCE].replace(np.nan, "Orthodox", inplace=True)
+        for column in (Columns.BLUE_STANCE, Columns.RED_STANCE):
+            self.df[column] = self.df[column].replace(np.nan, "Orthodox")
 
     def clean_weight_class(self) -> None:
         """
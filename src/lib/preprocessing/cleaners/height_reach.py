@@ -1,13 +1,22 @@
-from typing import List
+from typing import Dict, List
 import pandas as pd
 import numpy as np
 from .abstract import CleanerABC
+from ..keys import bout_keys
 
 
 class HeightReachCleaner(CleanerABC):
     # Class constants
     INCHES_TO_CM: float = 2.54
     FEET_TO_INCHES: int = 12
+    # e.g. 5' 11" or 6'0, anything else (like "--") has no height.
+    HEIGHT_PATTERN: str = r"^\s*(?P<feet>\d+)\s*'\s*(?P<inches>\d+)\s*\"?\s*$"
+    # State kept between incremental runs.
+    TOTALS: str = "totals"
+    IMPUTED: str = "imputed"
+    COUNT: str = "count"
+    HEIGHT_DIFF: str = "height_diff"
+    REACH_DIFF: str = "reach_diff"
 
     def clean(self) -> pd.DataFrame:
         """
@@ -16,19 +25,46 @@ class HeightReachCleaner(CleanerABC):
 
         This method:
         1. Converts all height/reach measurements to centimeters
-        2. Fills missing values using weight class averages
-        3. Creates columns for height and reach differences between fighters
+        2. Adds the complete rows to the running weight class totals
+        3. Fills missing values using weight class averages, recording which were filled
+        4. Creates columns for height and reach differences between fighters
         """
         height_reach_cols: List[str] = self._get_height_reach_cols()
 
         self.convert_to_cm(height_reach_cols)
+        self._update_measurement_totals(height_reach_cols)
+        missing: pd.DataFrame = self.df[height_reach_cols].isna()
         self._fill_missing_measurements(height_reach_cols)
+        self._record_imputed_measurements(missing)
+        self.create_measurement_differences(height_reach_cols)
+        return self.df
+
+    def refresh(self) -> pd.DataFrame:
+        """
+        Re-fills the measurements imputed on earlier runs with the current weight class
+        averages, so previously cleaned rows match what a full clean would give.
+        """
+        imputed_keys: Dict[str, List[str]] = self.state.get(self.IMPUTED, {})
+        if not any(imputed_keys.values()):
+            return self.df
+
+        height_reach_cols: List[str] = self._get_height_reach_cols()
+        avg_measurements: pd.DataFrame = self._create_height_reach_avgs()
+        keys: pd.Series = bout_keys(self.df)
+
+        for col in height_reach_cols:
+            imputed: pd.Series = keys.isin(imputed_keys.get(col, []))
+            self.df.loc[imputed, col] = self.df.loc[imputed, "weight_class"].map(
+                avg_measurements[col]
+            )
+
         self.create_measurement_differences(height_reach_cols)
         return self.df
 
     def clean_next_event(self):
-        self.convert_to_cm()
-        self.create_measurement_differences()
+        height_reach_cols: List[str] = self._get_height_reach_cols()
+        self.convert_to_cm(height_reach_cols)
+        self.create_measurement_differences(height_reach_cols)
         return self.df
 
     def _get_height_reach_cols(self) -> List[str]:
@@ -39,17 +75,48 @@ class HeightReachCleaner(CleanerABC):
             List[str]: A list of column names containing height and reach measurements
         """
 
+        # Already cleaned data also has the difference columns, which aren't measurements.
+        measurement_cols: List[str] = [
+            col
+            for col in self.df.columns
+            if col not in (self.HEIGHT_DIFF, self.REACH_DIFF)
+        ]
         height_cols: List[str] = [
-            col for col in self.df.columns if "height" in col.lower()
+            col for col in measurement_cols if "height" in col.lower()
         ]
         reach_cols: List[str] = [
-            col for col in self.df.columns if "reach" in col.lower()
+            col for col in measurement_cols if "reach" in col.lower()
         ]
         return height_cols + reach_cols
 
+    def _update_measurement_totals(self, height_reach_cols: List[str]) -> None:
+        """
+        Adds the measurements of rows with no missing values to the running sums and
+        counts per weight class kept in the state. Averages are derived from these,
+        so they cover every row cleaned so far and not just the rows in this run.
+
+        Args:
+            height_reach_cols (List[str]): List of column names containing
+                height and reach measurements
+        """
+        complete_rows: pd.DataFrame = self.df.dropna(subset=height_reach_cols)
+        grouped = complete_rows.groupby("weight_class")[height_reach_cols]
+        sums: pd.DataFrame = grouped.sum()
+        counts: pd.Series = grouped.size()
+
+        totals: Dict[str, Dict[str, float]] = self.state.setdefault(self.TOTALS, {})
+        for weight_class, measurement_sums in sums.iterrows():
+            weight_class_totals = totals.setdefault(
+                weight_class, dict.fromkeys([*height_reach_cols, self.COUNT], 0)
+            )
+            for col, total in measurement_sums.items():
+                weight_class_totals[col] += float(total)
+            weight_class_totals[self.COUNT] += int(counts[weight_class])
+
     def _create_height_reach_avgs(self) -> pd.DataFrame:
         """
-        Calculates average height and reach measurements grouped by weight class.
+        Calculates average height and reach measurements grouped by weight class
+        from the running totals.
 
         Returns:
             pd.DataFrame: DataFrame containing mean height and reach measurements
@@ -58,11 +125,25 @@ class HeightReachCleaner(CleanerABC):
         """
         height_reach_cols: List[str] = self._get_height_reach_cols()
 
-        clean_df: pd.DataFrame = self.df.copy()
-        clean_df.dropna(subset=height_reach_cols, inplace=True)
-        self.convert_to_cm(height_reach_cols)
+        totals = pd.DataFrame.from_dict(self.state[self.TOTALS], orient="index")
+        return totals[height_reach_cols].div(totals[self.COUNT], axis=0)
+
+    def _record_imputed_measurements(self, missing: pd.DataFrame) -> None:
+        """
+        Records the bouts whose measurements were filled with an average, by column,
+        so they can be re-filled when later rows change the averages.
+
+        Args:
+            missing (pd.DataFrame): mask of the measurements that were missing before filling.
+        """
+        imputed: Dict[str, List[str]] = self.state.setdefault(self.IMPUTED, {})
+        missing = missing[missing.any(axis=1)]
+        if missing.empty:
+            return
 
-        return clean_df.groupby("weight_class")[height_reach_cols].mean()
+        keys: pd.Series = bout_keys(self.df.loc[missing.index])
+        for col in missing.columns:
+            imputed.setdefault(col, []).extend(keys[missing[col]].tolist())
 
     def _fill_missing_measurements(self, height_reach_cols: List[str]) -> None:
         """
@@ -72,15 +153,16 @@ class HeightReachCleaner(CleanerABC):
             height_reach_cols (List[str]): List of column names containing
                 height and reach measurements to be filled
         """
+        if not self.df[height_reach_cols].isna().to_numpy().any():
+            return
+
         avg_measurements: pd.DataFrame = self._create_height_reach_avgs()
-        missing_mask: pd.Series = self.df[height_reach_cols].isna().any(axis=1)
-        missing_indices: pd.Index = self.df.index[missing_mask]
+        weight_classes: pd.Series = self.df["weight_class"]
 
         for col in height_reach_cols:
-            for idx in missing_indices:
-                if np.isnan(self.df.loc[idx, col]):
-                    weight_class: str = self.df.loc[idx, "weight_class"]
-                    self.df.loc[idx, col] = avg_measurements.loc[weight_class, col]
+            self.df[col] = self.df[col].fillna(
+                weight_classes.map(avg_measurements[col])
+            )
 
     def create_measurement_differences(self, height_reach_cols: List[str]) -> None:
         """
@@ -93,61 +175,64 @@ class HeightReachCleaner(CleanerABC):
             height_reach_cols (List[str]): List of column names containing
                 height and reach measurements
         """
-        self.df["height_diff"] = (
+        self.df[self.HEIGHT_DIFF] = (
             self.df[height_reach_cols[0]] - self.df[height_reach_cols[1]]
         )
-        self.df["reach_diff"] = (
+        self.df[self.REACH_DIFF] = (
             self.df[height_reach_cols[2]] - self.df[height_reach_cols[3]]
         )
 
-    def _convert_reach(self, reach: str) -> float:
+    def _convert_reach(self, reach: pd.Series) -> pd.Series:
         """
-        Converts reach measurement from inches to centimeters.
+        Converts reach measurements from inches to centimeters.
 
         Args:
-            reach (str): Reach measurement in inches (e.g., '72"')
+            reach (pd.Series): Reach measurements in inches (e.g., '72"')
 
         Returns:
-            float: Reach measurement in centimeters, or np.nan if conversion fails
+            pd.Series: Reach measurements in centimeters, NaN where conversion fails
         """
-        try:
-            inches: float = float(reach.replace('"', ""))
-            return inches * self.INCHES_TO_CM
-        except (ValueError, AttributeError):
-            return np.nan
+        inches: pd.Series = pd.to_numeric(
+            reach.astype("string").str.replace('"', "", regex=False),
+            errors="coerce",
+        ).astype(float)
+        return inches * self.INCHES_TO_CM
 
-    def _convert_height(self, height: str) -> float:
+    def _convert_height(self, height: pd.Series) -> pd.Series:
         """
-        Converts height from feet'inches format to centimeters.
+        Converts heights from feet'inches format to centimeters.
 
         Args:
-            height (str): Height in feet'inches format (e.g., "5'11")
+            height (pd.Series): Heights in feet'inches format (e.g., "5' 11\"")
 
         Returns:
-            float: Height in centimeters, rounded to nearest integer,
-                or np.nan if conversion fails
-        """
-        try:
-            feet_str: str
-            inches_str: str
-            feet_str, inches_str = height.split("'")
-            feet: int = int(feet_str)
-            inches: int = int(inches_str.replace('"', ""))
-            total_cm: float = (feet * self.FEET_TO_INCHES + inches) * self.INCHES_TO_CM
-            return round(total_cm, 0)
-        except (ValueError, AttributeError):
-            return np.nan
+            pd.Series: Heights in centimeters, rounded to nearest integer,
+                NaN where conversion fails
+        """
+        feet_inches: pd.DataFrame = (
+            height.astype("string").str.extract(self.HEIGHT_PATTERN).astype(float)
+        )
+        total_cm: pd.Series = (
+            feet_inches["feet"] * self.FEET_TO_INCHES + feet_inches["inches"]
+        ) * self.INCHES_TO_CM
+        return total_cm.round(0)
 
     def convert_to_cm(self, height_reach_cols: List[str]) -> None:
         """
         Converts all height and reach measurements to centimeters.
 
+        There are only a few dozen distinct measurements, so each column is factorized
+        and only the distinct values are parsed before being mapped back to every row.
+
         Args:
             height_reach_cols (List[str]): List of column names containing
                 height and reach measurements to be converted
         """
         for column in height_reach_cols:
+            codes, measurements = pd.factorize(self.df[column])
             if "height" in column.lower():
-                self.df[column] = self.df[column].apply(self._convert_height)
+                converted = self._convert_height(pd.Series(measurements))
             else:
-                self.df[column] = self.df[column].apply(self._convert_reach)
+                converted = self._convert_reach(pd.Series(measurements))
+            # Missing values are given the code -1, which picks the appended NaN.
+            self.df[column] = np.append(converted.to_numpy(), np.nan)[codes]
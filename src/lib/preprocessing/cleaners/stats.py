@@ -1,10 +1,30 @@
-from typing import List, Tuple, Dict
+from typing import Callable, Dict, List
+import numpy as np
 import pandas as pd
 
 from .abstract import CleanerABC
+from src.lib.constants.columns import (
+    ATTEMPT_LANDED_COLUMNS,
+    DEFENCE_PERCENT_SOURCES,
+    PERCENT_STRING_COLUMNS,
+)
 
 
 class StatsCleaner(CleanerABC):
+    """
+    Cleans the bout stats listed in src.lib.constants.columns.
+
+    Counts are stored as int16 and percentages as float32. If any "x of y" value is
+    missing the counts are float32 instead, with the missing counts left as NaN.
+    Parsing is done once per distinct value across all the columns, values like
+    "3 of 7" repeat a lot.
+    """
+
+    # "landed of attempted"
+    ATTEMPT_LANDED_PATTERN: str = r"^(?P<landed>\d+) of (?P<attempted>\d+)$"
+    COUNT_DTYPE: str = "int16"
+    PERCENT_DTYPE: str = "float32"
+
     def clean(self) -> pd.DataFrame:
         self._handle_attempt_landed_columns()
         self._handle_percent_columns()
@@ -18,43 +38,51 @@ class StatsCleaner(CleanerABC):
 
     def _handle_attempt_landed_columns(self) -> None:
         """
-        Breaks up the columns where the values are strings like "x of y".
+        Breaks up the columns where the values are strings like "x of y" into
+        attempted, landed and percentage columns, parsing every column in one pass.
         """
-        attempt_landed_columns: List[str] = self._get_attempt_landed_columns()
-
-        for column in attempt_landed_columns:
-            attempted, landed = self._split_attempt_landed_column(column)
-            self._create_stat_columns(column, attempted, landed)
-            self.df.drop(columns=column, inplace=True)
-
-    def _split_attempt_landed_column(self, column: str) -> Tuple[pd.Series, pd.Series]:
-        """Split a 'x of y' column into attempted and landed series."""
-        splitting_column: pd.DataFrame = self.df[column].str.split(" of ", expand=True)
-        attempted: pd.Series = splitting_column[1].astype(float)
-        landed: pd.Series = splitting_column[0].astype(float)
-        return attempted, landed
-
-    def _create_stat_columns(
-        self, original_column: str, attempted: pd.Series, landed: pd.Series
-    ) -> None:
-        """Create attempted, landed, and percentage columns from the supplied column name and data."""
-        column_suffixes: Dict[str, str] = {
-            "attempted": f"{original_column}_attempted",
-            "landed": f"{original_column}_landed",
-            "percent": f"{original_column}_percent",
-        }
-
-        self.df[column_suffixes["attempted"]] = attempted
-        self.df[column_suffixes["landed"]] = landed
-        self.df[column_suffixes["percent"]] = self._calculate_percentage(
-            landed, attempted
+        columns: List[str] = [
+            column for column in ATTEMPT_LANDED_COLUMNS if column in self.df.columns
+        ]
+        if not columns:
+            return
+
+        parsed: pd.DataFrame = self._parse_distinct(
+            self.df[columns], self._split_attempt_landed
+        )
+        landed: np.ndarray = parsed["landed"].to_numpy().reshape(-1, len(columns))
+        attempted: np.ndarray = parsed["attempted"].to_numpy().reshape(-1, len(columns))
+
+        stat_columns: Dict[str, np.ndarray] = {}
+        for i, column in enumerate(columns):
+            stat_columns[f"{column}_attempted"] = attempted[:, i]
+            stat_columns[f"{column}_landed"] = landed[:, i]
+            stat_columns[f"{column}_percent"] = self._calculate_percentage(
+                landed[:, i], attempted[:, i]
+            )
+
+        self.df = pd.concat(
+            [
+                self.df.drop(columns=columns),
+                pd.DataFrame(stat_columns, index=self.df.index),
+            ],
+            axis=1,
         )
 
+    def _split_attempt_landed(self, values: pd.Series) -> pd.DataFrame:
+        """Split "x of y" values into landed and attempted counts."""
+        counts: pd.DataFrame = values.str.extract(self.ATTEMPT_LANDED_PATTERN)
+        if counts.isna().any(axis=None):
+            return counts.astype(self.PERCENT_DTYPE)
+        return counts.astype(self.COUNT_DTYPE)
+
     def _calculate_percentage(
-        self, numerator: pd.Series, denominator: pd.Series
-    ) -> pd.Series:
+        self, numerator: np.ndarray, denominator: np.ndarray
+    ) -> np.ndarray:
         """Calculate percentage and handle division by zero."""
-        return (numerator / denominator).fillna(0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            percentage: np.ndarray = numerator / denominator
+        return np.where(np.isnan(percentage), 0, percentage).astype(self.PERCENT_DTYPE)
 
     """-----------------------------------Percentage columns-----------------------------------"""
 
@@ -70,42 +98,45 @@ class StatsCleaner(CleanerABC):
 
     def _convert_percent_strings_to_float(self) -> None:
         """Convert percentage strings (e.g., '75%') to float values (0.75)."""
-        percent_cols: List[str] = [col for col in self.df.columns if "%" in col]
-        for column in percent_cols:
-            self.df[column] = self.df[column].str.strip("%").astype("float") / 100
+        columns: List[str] = [
+            column for column in PERCENT_STRING_COLUMNS if column in self.df.columns
+        ]
+        if not columns:
+            return
+
+        parsed: pd.DataFrame = self._parse_distinct(
+            self.df[columns], self._split_percent
+        )
+        self.df[columns] = parsed["percent"].to_numpy().reshape(-1, len(columns))
+
+    def _split_percent(self, values: pd.Series) -> pd.DataFrame:
+        """Convert "75%" values to 0.75."""
+        percent: pd.Series = values.str.strip("%").astype("float") / 100
+        return percent.astype(self.PERCENT_DTYPE).to_frame("percent")
 
     def _calculate_defense_percentages(self) -> None:
         """Calculate strike and takedown defense percentages for both fighters."""
-        defense_calculations: Dict[str, str] = {
-            "red_sig_strike_defence_percent": "blue_sig_str_%",
-            "blue_sig_strike_defence_percent": "red_sig_str_%",
-            "red_td_defence_percent": "blue_td_%",
-            "blue_td_defence_percent": "red_td_%",
-        }
+        for new_col, source_col in DEFENCE_PERCENT_SOURCES.items():
+            if source_col in self.df.columns:
+                self.df[str(new_col)] = 1 - self.df[source_col]
 
-        for new_col, source_col in defense_calculations.items():
-            self.df[new_col] = 1 - self.df[source_col]
+    """-----------------------------------Parsing-----------------------------------"""
 
-    def _get_attempt_landed_columns(self) -> List[str]:
+    @staticmethod
+    def _parse_distinct(
+        df: pd.DataFrame, parse: Callable[[pd.Series], pd.DataFrame]
+    ) -> pd.DataFrame:
         """
-        Finds all columns where the values look like "x of y"
-        """
-        attempt_landed_columns: List[str] = []
-
-        # Separated out conditions for clarity.
-        for column in self.df.columns:
-            # Ensure the column is a string column.
-            type_condition: bool = self.df[column].dtype == object
+        Parses every value of the columns with a single call on their distinct values.
 
-            # Ensure at least one of the values contains "of".
-            of_condition: bool = (
-                sum(self.df[column].apply(lambda x: "of" in str(x))) > 0
-            )
-
-            # Some fighters can have "of" in their name. Don't want that
-            name_condition: bool = "fighter" not in column.lower()
+        Args:
+            df (pd.DataFrame): the string columns to parse.
+            parse (Callable[[pd.Series], pd.DataFrame]): parses a series of distinct values
+                into a dataframe with a row per value.
 
-            if type_condition and of_condition and name_condition:
-                attempt_landed_columns.append(column)
-
-        return attempt_landed_columns
+        Returns:
+            pd.DataFrame: the parsed row for each value, the columns' values stacked row by row.
+        """
+        # Missing values are parsed too rather than being left out of the distinct values.
+        codes, distinct = pd.factorize(df.to_numpy().ravel(), use_na_sentinel=False)
+        return parse(pd.Series(distinct, dtype=object)).iloc[codes]
@@ -1 +1,2 @@
-from .feature_engineering import FeatureEngineering
+from .feature_engineering import FeatureEngineering, IncrementalFeatureEngineering
+from .stats_store import FighterStatsStore
@@ -1,22 +1,55 @@
-from typing import List, DefaultDict, Dict
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
 import numpy as np
 import pandas as pd
+from rich.console import Console
 
-from src.lib.data_managers import CSVProcessingHandler
-from src.config import PathSettings
-from .regression import RegressionModel
-from .fighter import Fighter
+from src.lib.data_managers import CSVProcessingHandler, StorageBackendABC, get_storage
+from src.config import PathSettings, StorageSettings
+from src.lib.preprocessing.keys import bout_keys, drop_duplicate_bouts
+from .regression import RegressionModel, RegressionModelStore
+from .fighter import FighterHistory
+from .stats_store import FighterStatsStore
+
+console = Console()
 
 
 class FeatureEngineering(CSVProcessingHandler):
-    def __init__(self, csv_path, allow_creation) -> None:
-        super().__init__(csv_path, allow_creation)
-        # Returns a list of all unique fighters in the dataframe
-        self.fighters = np.unique(
-            np.concatenate(
-                [self.df["red_fighter"], self.df["blue_fighter"]],
-                axis=None,
-            )
+    # Models that fill in a fighter's first bout average, by the average column they fill.
+    STAT_MODELS = {
+        "sig_str_average": "sig_strike",
+        "td_average": "takedowns",
+        "sig_strike_defence_average": "sig_strike_defence",
+        "td_defence_average": "takedowns_defence",
+    }
+
+    # The X and Y columns of FighterHistory.regression_df each model is fitted on.
+    MODEL_CONFIGS = {
+        "sig_strike": ("X_sig_str_percent", "Y_sig_str_percent"),
+        "takedowns": ("X_td_percent", "Y_td_percent"),
+        "sig_strike_defence": (
+            "X_sig_strike_defence_percent",
+            "Y_sig_strike_defence_percent",
+        ),
+        "takedowns_defence": ("X_td_defence_percent", "Y_td_defence_percent"),
+    }
+
+    def __init__(
+        self,
+        csv_path,
+        allow_creation,
+        storage: Optional[StorageBackendABC] = None,
+        model_store: Optional[RegressionModelStore] = None,
+        training_path: Path = PathSettings.TRAINING_DATA_CSV,
+        training_storage: Optional[StorageBackendABC] = None,
+    ) -> None:
+        super().__init__(csv_path, allow_creation, storage)
+        self.model_store = model_store or RegressionModelStore(
+            PathSettings.REGRESSION_MODELS_JSON
+        )
+        self.training_path = training_path
+        self.training_storage = training_storage or get_storage(
+            StorageSettings.TRAINING_DATA
         )
         self.percent_stats = self._get_percent_stats()
 
@@ -36,138 +69,321 @@ class FeatureEngineering(CSVProcessingHandler):
             for column in self.df.columns
             if "percent" in column
         ]
-        # Quick way to drop the duplicates - changes the order tho but not important here
-        return list(set(percent_stats))
+        # Drop the duplicates, keeping the order of the columns
+        return list(dict.fromkeys(percent_stats))
 
     def run(self) -> None:
         """
         Executes the feature engineering process by filling missing values and updating the main DataFrame.
         """
-        models: Dict[str, RegressionModel] = self._fit_models()
-
-        # Define stat columns and their corresponding models
-        stat_model_mapping = {
-            "sig_str_average": "sig_strike",
-            "td_average": "takedowns",
-            "sig_strike_defence_average": "sig_strike_defence",
-            "td_defence_average": "takedowns_defence",
-        }
-
-        for fighter_name in self.fighters:
-            fighter = Fighter(self.df, fighter_name)
-
-            if len(fighter.fighter_df) <= 1:
-                continue
+        self.df = drop_duplicate_bouts(self.df)
+        self._engineer_features()
+        self.training_storage.write(self.df, self.training_path)
 
-            all_stats = fighter.order_fighter_stats(self.percent_stats)
-            fighter_stats_df = fighter.setup_missing_val_df(all_stats)
-
-            # Fill missing values for each stat using corresponding model
-            for stat_col, model_name in stat_model_mapping.items():
-                fighter_stats_df = self.fill_missing_value(
-                    fighter_stats_df, stat_col, models[model_name]
-                )
-
-            fighter_stats_df = fighter_stats_df.drop(columns=self.percent_stats, axis=1)
-            self._populate_averages_cols(fighter_stats_df, fighter_name)
-
-        self.df.to_csv(PathSettings.TRAINING_DATA_CSV, index=False)
-
-    def _build_regression_df(self) -> pd.DataFrame:
+    def _engineer_features(self) -> FighterHistory:
         """
-        Builds a dataframe that will be used to create the regression models.
-        Using the relevant stats, each stat will contain an X and Y column variant.
-        The X column will correspond to the average for that stat *before* a given fight.
-        The Y column will correspond to the average for that stat *after* a given fight.
-        So uses the overall average of the first x fights to predict the average of the first x+1 fights.
+        Adds every fighter's average stats going into each bout to the main dataframe.
 
         Returns:
-            pd.DataFrame: DF containing the X & Y columns for each stat.
+            FighterHistory: the fighter history the averages were calculated from.
         """
-        # DF to hold all the X and Y columns for each stat
-        regression_df = pd.DataFrame()
-        for fighter_name in self.fighters:
-            # Fighter object creates a version of the final dataframe for a single fighter.
-            fighter: Fighter = Fighter(self.df, fighter_name)
-
-            # Can only create a fighters regression df if they have had at least 3 fights.
-            if len(fighter.fighter_df) >= 3:
-                # Gets the fighters stats in chronological order (as a fighter can be in both the red and blue corner)
-                ordered_stats: DefaultDict[str, List[float]] = (
-                    fighter.order_fighter_stats(self.percent_stats)
-                )
+        fighter_history = FighterHistory(self.df, self.percent_stats)
+        models: Dict[str, RegressionModel] = self._fit_models(fighter_history)
 
-                # Manipulate the ordered stats to create the X and Y columns for each stat.
-                fighter_lin_reg_df = fighter.create_fighter_reg_df(ordered_stats)
-
-                # Add the fighters X and Y columns to the overall regression df.
-                regression_df = pd.concat([regression_df, fighter_lin_reg_df], axis=0)
+        averages: pd.DataFrame = fighter_history.pre_fight_averages()
+        averages.columns = [
+            column.replace("percent", "average") for column in averages.columns
+        ]
+        averages = self.fill_missing_values(fighter_history, averages, models)
 
-        # return the final dataframe with reset index (so index 1 corresponds to row 1, not the row index of input df)
-        return regression_df.reset_index(drop=True)
+        self._populate_averages_cols(fighter_history, averages)
+        return fighter_history
 
-    def _fit_models(self) -> Dict[str, RegressionModel]:
+    def _fit_models(
+        self, fighter_history: FighterHistory
+    ) -> Dict[str, RegressionModel]:
         """
         Method to create the linear regression models that will predict missing values.
+        Uses the average for each stat going into a bout to predict the average going into the previous bout,
+        see FighterHistory.regression_df.
+
         Returns:
             Dict[str, RegressionModel]: Dictionary of trained regression models for each stat type.
         """
-        XYs_only = self._build_regression_df()
-
-        # Define model configurations
-        model_configs = {
-            "sig_strike": ("X_sig_str_percent", "Y_sig_str_percent"),
-            "takedowns": ("X_td_percent", "Y_td_percent"),
-            "sig_strike_defence": (
-                "X_sig_strike_defence_percent",
-                "Y_sig_strike_defence_percent",
-            ),
-            "takedowns_defence": ("X_td_defence_percent", "Y_td_defence_percent"),
-        }
+        XYs_only = fighter_history.regression_df()
 
-        # Create models using configuration
-        return {
+        # The models only change when the data they're fitted on does.
+        fingerprint: str = self.model_store.fingerprint(XYs_only)
+        models: Optional[Dict[str, RegressionModel]] = self.model_store.load(
+            fingerprint
+        )
+        if models is not None:
+            return models
+
+        models = {
             name: RegressionModel(XYs_only, x_col, y_col)
-            for name, (x_col, y_col) in model_configs.items()
+            for name, (x_col, y_col) in self.MODEL_CONFIGS.items()
         }
+        self.model_store.save(fingerprint, models)
+        return models
 
     def _populate_averages_cols(
-        self, fighter_stats_df: pd.DataFrame, fighter_name: str
+        self, fighter_history: FighterHistory, averages: pd.DataFrame
     ) -> None:
         """
-        Takes the dataframe containing the average stats for a given fighter
+        Takes the average stats for every fighter going into each of their bouts
         and populates the main dataframe with the values.
-        This in effect adds a new column for each stat to the main dataframe,
-        where the values are the average stats for a given fighter *before* the bout in that row.
+        This in effect adds a red and blue column for each stat to the main dataframe,
+        where the values are each fighter's average stats *before* the bout in that row.
+
+        Args:
+            fighter_history (FighterHistory): every fighter's bouts, one row per fighter per bout.
+            averages (pd.DataFrame): the average stats, aligned to the fighter history.
+        """
+        corner_averages: pd.DataFrame = fighter_history.to_corners(averages)
+        self.df = self.df.drop(columns=corner_averages.columns, errors="ignore").join(
+            corner_averages
+        )
+
+    def fill_missing_values(
+        self,
+        fighter_history: FighterHistory,
+        averages: pd.DataFrame,
+        models: Dict[str, RegressionModel],
+    ) -> pd.DataFrame:
+        """
+        A fighter has no average going into their first bout, so it is predicted from
+        the stat they recorded in that bout (their average going into the second) using the trained models.
+        Every fighter's first bout is filled for all the modelled stats at once.
+        Fighters with only one bout are left missing.
 
         Args:
-            fighter_stats_df (pd.DataFrame): the dataframe containing the average stats for a given fighter
-            fighter_name (str): The name of the fighter.
+            fighter_history: every fighter's bouts, one row per fighter per bout
+            averages: DataFrame containing each fighter's average stats going into each bout
+            models: Trained regression models for prediction, by name
+
+        Returns:
+            DataFrame with the missing values filled
         """
+        average_cols: List[str] = list(self.STAT_MODELS)
+        intercepts, slopes = self._model_coefficients(models)
+
+        first_bouts: pd.Series = fighter_history.first_bouts()
+        first_valid_stats: np.ndarray = fighter_history.long_df.loc[
+            first_bouts, [col.replace("average", "percent") for col in average_cols]
+        ].to_numpy()
+        averages.loc[first_bouts, average_cols] = (
+            intercepts + slopes * first_valid_stats
+        )
+        return averages
+
+    def _model_coefficients(
+        self, models: Dict[str, RegressionModel]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The intercepts and slopes of the models, ordered like STAT_MODELS.
+        """
+        stat_models: List[RegressionModel] = [
+            models[name] for name in self.STAT_MODELS.values()
+        ]
+        intercepts = np.array([model.intercept for model in stat_models])
+        slopes = np.array([model.slope for model in stat_models])
+        return intercepts, slopes
+
+
+class IncrementalFeatureEngineering(FeatureEngineering):
+    """
+    Adds only the bouts that weren't in the clean data on a previous run to the
+    training data, looking up each fighter's average going into them from a
+    FighterStatsStore rather than recalculating it from their whole history.
+
+    The new bouts are added to the store a date at a time, so a fighter with several
+    new bouts gets the right average going into each. The store also updates the
+    imputation models, and every fighter's first bout is filled in again with them,
+    including fighters whose second bout is one of the new ones.
 
-        for column in fighter_stats_df.columns:
-            # Because the fighter_stats_df is a subset of the main dataframe, the index is shared.
-            for i in fighter_stats_df.index:
-                if fighter_name in self.df.loc[i, "red_fighter"]:
-                    self.df.loc[i, "red_" + column] = fighter_stats_df.loc[i, column]
-                elif fighter_name in self.df.loc[i, "blue_fighter"]:
-                    self.df.loc[i, "blue_" + column] = fighter_stats_df.loc[i, column]
+    Falls back to a full run when there is no usable store or training data, when
+    bouts have been removed from the clean data, when the stats or columns of the
+    clean data have changed, or when a new bout is on or before the date of one of
+    its fighters' last bouts in the store.
+    """
 
-    def fill_missing_value(
-        self, fighter_stats_df: pd.DataFrame, col_name: str, model: RegressionModel
+    def __init__(
+        self,
+        csv_path: Path,
+        storage: Optional[StorageBackendABC] = None,
+        model_store: Optional[RegressionModelStore] = None,
+        training_path: Path = PathSettings.TRAINING_DATA_CSV,
+        training_storage: Optional[StorageBackendABC] = None,
+        stats_store_path: Path = PathSettings.FIGHTER_STATS_JSON,
+    ) -> None:
+        """
+        Args:
+            csv_path (Path): the clean data.
+            storage (Optional[StorageBackendABC]): storage backend of the clean data.
+            model_store (Optional[RegressionModelStore]): coefficients of the models on a full run.
+            training_path (Path): the training data to add the new bouts to.
+            training_storage (Optional[StorageBackendABC]): storage backend of the training data.
+            stats_store_path (Path): json file holding every fighter's running totals.
+        """
+        super().__init__(
+            csv_path,
+            allow_creation=False,
+            storage=storage,
+            model_store=model_store,
+            training_path=training_path,
+            training_storage=training_storage,
+        )
+        self.stats_store_path = stats_store_path
+        self.stats_store: Optional[FighterStatsStore] = None
+
+    def run(self) -> None:
+        # A bout in the clean data twice would otherwise be merged twice.
+        self.df = drop_duplicate_bouts(self.df)
+        keys: pd.Series = bout_keys(self.df)
+        stats_store = FighterStatsStore.load(self.stats_store_path)
+        training_df: Optional[pd.DataFrame] = self._load_training_data()
+
+        if stats_store is None or training_df is None:
+            console.log("No previous training data found, using all bouts")
+            self._run_all(keys)
+            return
+        if stats_store.stat_cols != self.percent_stats:
+            console.log("Stats have changed since the last run, using all bouts")
+            self._run_all(keys)
+            return
+
+        processed: pd.Series = stats_store.is_processed(keys)
+        if processed.sum() != len(stats_store.processed):
+            console.log("Bouts were removed from the clean data, using all bouts")
+            self._run_all(keys)
+            return
+        if processed.all():
+            self.stats_store = stats_store
+            console.log("No new bouts to add to the training data")
+            return
+
+        new_df: pd.DataFrame = self.df[~processed]
+        fighter_history = FighterHistory(new_df, self.percent_stats)
+        long_df: pd.DataFrame = fighter_history.long_df
+        dates = pd.to_datetime(long_df["date"])
+        if (
+            dates <= stats_store.last_bout_dates(long_df["fighter"])
+        ).any() or long_df.duplicated(["fighter", "date"]).any():
+            console.log("New bouts are older than existing ones, using all bouts")
+            self._run_all(keys)
+            return
+
+        averages = pd.DataFrame(
+            np.nan, index=long_df.index, columns=self.percent_stats, dtype=float
+        )
+        for _, bouts in long_df.groupby(dates, sort=True):
+            averages.loc[bouts.index] = stats_store.pre_fight_averages(
+                bouts["fighter"]
+            ).to_numpy()
+            stats_store.add_bouts(bouts, keys)
+        averages.columns = [
+            column.replace("percent", "average") for column in averages.columns
+        ]
+
+        new_df = new_df.join(fighter_history.to_corners(averages))
+        if set(new_df.columns) != set(training_df.columns):
+            console.log("Clean data has different columns, using all bouts")
+            self._run_all(keys)
+            return
+
+        self.df = self._merge(training_df, new_df, keys)
+        self._fill_first_bouts(stats_store, keys)
+
+        self.stats_store = stats_store
+        self._save(n_new=len(new_df))
+
+    def _run_all(self, keys: pd.Series) -> None:
+        fighter_history = self._engineer_features()
+        self.stats_store = FighterStatsStore.from_history(
+            self.stats_store_path, fighter_history, keys
+        )
+        self._save(n_new=len(keys))
+
+    def _merge(
+        self, training_df: pd.DataFrame, new_df: pd.DataFrame, keys: pd.Series
     ) -> pd.DataFrame:
         """
-        Generates and adds a prediction for a missing value using the trained model.
+        Appends the new bouts to the training data, ordered as they are in the clean data.
+        """
+        merged: pd.DataFrame = pd.concat(
+            [training_df, new_df[training_df.columns]], ignore_index=True
+        )
+        positions: np.ndarray = pd.Index(keys).get_indexer(bout_keys(merged))
+        return merged.iloc[np.argsort(positions, kind="stable")].reset_index(drop=True)
+
+    def _fill_first_bouts(
+        self, stats_store: FighterStatsStore, keys: pd.Series
+    ) -> None:
+        """
+        Fills in the first bout of every fighter who has fought more than once with
+        the models from the store, see fill_missing_values.
+        The training data must be ordered like the keys.
+        """
+        models: Dict[str, RegressionModel] = {
+            name: RegressionModel.from_coefficients(
+                x_col, y_col, *stats_store.regression_coefficients(x_col)
+            )
+            for name, (x_col, y_col) in self.MODEL_CONFIGS.items()
+        }
+        intercepts, slopes = self._model_coefficients(models)
+
+        first_bouts: pd.DataFrame = stats_store.first_bouts()
+        rows: np.ndarray = pd.Index(keys).get_indexer(first_bouts["first_bout"])
+        first_valid_stats: np.ndarray = first_bouts[
+            [f"{col.replace('average', 'percent')}_first" for col in self.STAT_MODELS]
+        ].to_numpy(dtype=float)
+        for corner in FighterHistory.CORNERS:
+            in_corner: np.ndarray = (first_bouts["first_corner"] == corner).to_numpy()
+            columns: np.ndarray = self.df.columns.get_indexer(
+                [f"{corner}_{col}" for col in self.STAT_MODELS]
+            )
+            self.df.iloc[rows[in_corner], columns] = (
+                intercepts + slopes * first_valid_stats[in_corner]
+            )
+
+    def next_event_averages(self, next_event_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replaces the average stats of the fighters on the next card with their
+        averages over their bouts in the store, calculated like the training data's.
+        Fighters without any bouts keep the career stats from their profile.
 
         Args:
-            fighter_stats_df: DataFrame containing fighter's average stats
-            col_name: Name of the column to fill
-            model: Trained regression model for prediction
+            next_event_df (pd.DataFrame): the next card, see PathSettings.NEXT_EVENT_CSV.
 
         Returns:
-            DataFrame with the missing value filled
+            pd.DataFrame: the next card with the averages updated.
+        """
+        if self.stats_store is None:
+            raise ValueError("Run the feature engineering before the next event.")
+
+        next_event_df = next_event_df.copy()
+        for corner in FighterHistory.CORNERS:
+            averages: pd.DataFrame = self.stats_store.pre_fight_averages(
+                next_event_df[f"{corner}_fighter"]
+            )
+            for stat in self.percent_stats:
+                column = f"{corner}_{stat.replace('percent', 'average')}"
+                if column in next_event_df.columns:
+                    next_event_df[column] = averages[stat].fillna(next_event_df[column])
+        return next_event_df
+
+    def _load_training_data(self) -> Optional[pd.DataFrame]:
+        try:
+            return self.training_storage.read(self.training_path)
+        except FileNotFoundError:
+            return None
+
+    def _save(self, n_new: int) -> None:
+        """
+        Writes the training data, then the store. The store is written last so that if
+        writing the data fails the next run adds these bouts again.
         """
-        first_valid_stat = fighter_stats_df.at[fighter_stats_df.index[1], col_name]
-        prediction = model.predict(first_valid_stat)
-        fighter_stats_df.at[fighter_stats_df.index[0], col_name] = prediction
-        return fighter_stats_df
+        self.training_storage.write(self.df, self.training_path)
+        self.stats_store.save()
+        console.log(f"Added {n_new} bouts, {len(self.df)} bouts in the training data")
@@ -1,126 +1,131 @@
-from typing import List, DefaultDict, Dict
-from collections import defaultdict
+from typing import List
+
 import pandas as pd
 
 
-class Fighter:
+class FighterHistory:
     """
-    Class responsible for working with a single fighter and the stats associated with them.
-    Used to create a dataframe containing data which will be used to create a regression model to fill in missing data.
+    Class responsible for every fighter's bouts and the stats they recorded in them.
+
+    The bouts are reshaped into long format, one row per fighter per bout, sorted by
+    fighter and then date. A fighter's stats are in the red or blue columns depending
+    on their corner, here they are always in the same column, so every fighter's
+    running averages are calculated at once with a single groupby.
+
+    Columns of the long dataframe:
+        bout: index of the bout in the full dataframe.
+        corner: "red" or "blue".
+        fighter, date: who fought and when.
+        position: how many bouts the fighter had before this one.
+        n_bouts: how many bouts the fighter has in total.
+        one column per stat, e.g. "sig_str_percent".
     """
 
-    def __init__(self, full_ufc_df: pd.DataFrame, fighter_name: str) -> None:
-        self.full_ufc_df = full_ufc_df
-        self.fighter_name = fighter_name
-        self.fighter_df = self._get_fighter_df()
+    CORNERS = ("red", "blue")
 
-    def _get_fighter_df(self) -> pd.DataFrame:
-        """
-        Returns a dataframe of all fights that the fighter has been in.
-        """
-        return self.full_ufc_df[
-            (self.full_ufc_df["red_fighter"] == self.fighter_name)
-            | (self.full_ufc_df["blue_fighter"] == self.fighter_name)
-        ].sort_values(by="date", ascending=True)
+    def __init__(self, full_ufc_df: pd.DataFrame, stat_cols: List[str]) -> None:
+        self.stat_cols = stat_cols
+        self.long_df = self._to_long(full_ufc_df)
 
-    def populate_fighter_df(self): ...
+        self._by_fighter = self.long_df.groupby("fighter", sort=False)
 
-    def order_fighter_stats(
-        self, stat_cols: List[str]
-    ) -> DefaultDict[str, List[float]]:
+    def _to_long(self, full_ufc_df: pd.DataFrame) -> pd.DataFrame:
         """
-        For a given fighter, all specified stats are extracted in chronological order.
-        The stats are then stored in a dictionary where the key is the stat name
-        and the value is a list of the stats in chronological order.
-
-        Args:
-            stat_cols (List[str]): List of stats to extract.
+        Stacks the red and blue corners of every bout into one row per fighter per bout.
+        """
+        corners = []
+        for corner in self.CORNERS:
+            corner_df = pd.DataFrame(
+                {
+                    "bout": full_ufc_df.index,
+                    "corner": corner,
+                    "fighter": full_ufc_df[f"{corner}_fighter"].to_numpy(),
+                    "date": full_ufc_df["date"].to_numpy(),
+                }
+            )
+            for stat in self.stat_cols:
+                corner_df[stat] = full_ufc_df[f"{corner}_{stat}"].to_numpy()
+            corners.append(corner_df)
+
+        # Sorting on both columns is stable, so bouts on the same date stay in data order.
+        long_df = (
+            pd.concat(corners, ignore_index=True)
+            .sort_values(["fighter", "date"])
+            .reset_index(drop=True)
+        )
+        by_fighter = long_df.groupby("fighter", sort=False)
+        long_df["position"] = by_fighter.cumcount()
+        long_df["n_bouts"] = by_fighter["fighter"].transform("size")
+        return long_df
+
+    def pre_fight_averages(self) -> pd.DataFrame:
+        """
+        Calculates each fighter's average for every stat going into each of their bouts,
+        i.e. the mean over all their previous bouts. The first bout has no previous bouts
+        so is left missing.
 
         Returns:
-            DefaultDict[str, List[float]]: Dictionary of stats in chronological order.
+            pd.DataFrame: one column per stat, aligned to the long dataframe.
         """
-        # Default dict is used to avoid having to explicitly specify the initial dictionary
-        ordered_fighter_stats: DefaultDict[str, List[float]] = defaultdict(list)
-
-        # DF is ordered by date, so stats are already in chronological order
-        # But for the fighter, the stats are in different columns depending on whether they are red or blue corner.
-        for _, row in self.fighter_df.iterrows():
-            if row["red_fighter"] == self.fighter_name:
-                for stat in stat_cols:
-                    ordered_fighter_stats[stat].append(row[f"red_{stat}"])
-            elif row["blue_fighter"] == self.fighter_name:
-                for stat in stat_cols:
-                    ordered_fighter_stats[stat].append(row[f"blue_{stat}"])
-
-        # Sanity check on the off chance a fighter df is missing a stat.
-        assert len(ordered_fighter_stats) == len(
-            stat_cols
-        ), "There should be the same number of extracted stats as specified stats."
-        return ordered_fighter_stats
-
-    def _create_x_column(
-        self, df: pd.DataFrame, new_col: str, input_col: str
-    ) -> pd.DataFrame:
-        # See docstring for explanation of what this does. Creates the X column
-        df[new_col] = df[input_col].expanding(2).mean().shift(1)
-
-        #! Return to this as unsure what mypy is moaning about
-        df.loc[df.index[1], new_col] = df.loc[df.index[0], input_col]  # type: ignore
-
-        return df
-
-    def create_fighter_reg_df(
-        self, ordered_stats: DefaultDict[str, List[float]]
-    ) -> pd.DataFrame:
+        running_averages: pd.DataFrame = (
+            self._by_fighter[self.stat_cols]
+            .expanding()
+            .mean()
+            .reset_index(level=0, drop=True)
+        )
+        return running_averages.groupby(self.long_df["fighter"], sort=False).shift(1)
+
+    def regression_df(self) -> pd.DataFrame:
         """
-        Calculates the x and y columns for each stat and returns a dataframe
-        The X column calculates the cumulative average of the stat.
-        expanding(2).mean() starts from the second row and calculates the average of the preceeding rows.
-        This in effect calculates the average of that stat for the fighter at the point they were going into their next fight.
-        so if a fighter had 10 fights, the 10th row will be the average of the previous 9 fights.
-        This aspect is handled by the shift(1) method which shifts the column down by 1 row.
-        The Y column is in effect the average *after* the fight.
-        So that we are predicting what the average will be after the fight using the average going into the fight.
-        Args:
-            ordered_stats (DefaultDict[str, List[float]]): A dictionary holding all the available stats for a fighter.
+        Builds the X and Y columns for each stat, used to fit the models that fill in
+        a fighter's missing first bout averages.
+        The X column is the average for the stat going into a bout. The Y column is
+        the X column shifted down one bout, so the average going into the previous bout.
+        Only fighters with at least 3 bouts are used, from their third bout onwards.
 
         Returns:
-            pd.DataFrame: a dataframe with the x and y columns for each stat for that fighter.
+            pd.DataFrame: the X and Y columns for each stat, by fighter then date.
         """
-        lin_reg_df = pd.DataFrame()
-        for column, stats in ordered_stats.items():
-            # Easier to manipulate stats using pandas
-            lin_reg_df[column] = stats
-
-            # Create lagged columns for each stat - easier to use
-            x_col, y_col = f"X_{column}", f"Y_{column}"
+        averages: pd.DataFrame = self.pre_fight_averages()
+        previous_averages: pd.DataFrame = averages.groupby(
+            self.long_df["fighter"], sort=False
+        ).shift(1)
 
-            lin_reg_df = self._create_x_column(lin_reg_df, x_col, column)
+        regression_df = pd.DataFrame(index=self.long_df.index)
+        for stat in self.stat_cols:
+            regression_df[f"X_{stat}"] = averages[stat]
+            regression_df[f"Y_{stat}"] = previous_averages[stat]
 
-            # Shifts again to create the stat after the fight in question
-            lin_reg_df[y_col] = lin_reg_df[x_col].shift(1)
+        return regression_df.dropna().reset_index(drop=True)
 
-            # Could be more efficient to do this at the end but this is easier to read
-            lin_reg_df = lin_reg_df.drop(columns=[column], axis=1)
-
-        # Drop the first row as there will be no Y value for it
-        lin_reg_df = lin_reg_df.dropna()
-        return lin_reg_df
-
-    def setup_missing_val_df(
-        self, ordered_stats: DefaultDict[str, List[float]]
-    ) -> pd.DataFrame:
-        df: pd.DataFrame = pd.DataFrame(ordered_stats, index=self.fighter_df.index)
-        col_mapper: Dict[str, str] = {
-            column: column.replace("percent", "average") for column in df.columns
-        }
+    def first_bouts(self) -> pd.Series:
+        """
+        Returns a mask of the first bout of every fighter who has fought more than once.
+        These are the bouts whose averages are filled in by the regression models.
+        """
+        return (self.long_df["position"] == 0) & (self.long_df["n_bouts"] > 1)
 
-        for old_column, new_column in col_mapper.items():
-            df = self._create_x_column(df, new_column, old_column)
+    def to_corners(self, long_values: pd.DataFrame) -> pd.DataFrame:
+        """
+        Scatters values calculated per fighter per bout back into red and blue columns.
 
-        return df
+        Args:
+            long_values (pd.DataFrame): columns aligned to the long dataframe.
 
-        # # See docstring for explanation of what this does. Creates the X column
-        # lin_reg_df[x_col] = lin_reg_df[column].expanding(2).mean().shift(1)
-        # #! Return to this as unsure what mypy is moaning about
-        # lin_reg_df.loc[1, x_col] = lin_reg_df.loc[0, column]  # type: ignore
+        Returns:
+            pd.DataFrame: indexed by bout, a red_ and blue_ column for each input column.
+        """
+        wide: pd.DataFrame = (
+            long_values.set_index(
+                [self.long_df["bout"].to_numpy(), self.long_df["corner"].to_numpy()]
+            )
+            .unstack()
+            .sort_index()
+        )
+        return pd.DataFrame(
+            {
+                f"{corner}_{column}": wide[(column, corner)]
+                for column in long_values.columns
+                for corner in self.CORNERS
+            }
+        )
@@ -1,3 +1,10 @@
+from __future__ import annotations
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
 import pandas as pd
 import numpy as np
 import statsmodels.api as sm
@@ -9,6 +16,24 @@ class RegressionModel:
         self.x_col = x_col
         self.y_col = y_col
         self.model = self._fit_model()
+        self.intercept, self.slope = (float(param) for param in self.model.params)
+
+    @classmethod
+    def from_coefficients(
+        cls, x_col: str, y_col: str, intercept: float, slope: float
+    ) -> RegressionModel:
+        """
+        Recreates a model fitted on an earlier run from its coefficients, without refitting.
+        The statsmodels results (and so check_assumptions) aren't available.
+        """
+        regression_model = cls.__new__(cls)
+        regression_model.df = None
+        regression_model.x_col = x_col
+        regression_model.y_col = y_col
+        regression_model.model = None
+        regression_model.intercept = intercept
+        regression_model.slope = slope
+        return regression_model
 
     def _fit_model(self):
         fitted_model = sm.OLS(
@@ -18,6 +43,8 @@ class RegressionModel:
         return fitted_model
 
     def check_assumptions(self):
+        if self.model is None:
+            raise ValueError("Model was loaded from its coefficients, refit to check.")
         if r_squared_adj := self.model.rsquaredadj < 0.3:
             print(
                 f"R-squared adjusted is {r_squared_adj} which is less than 0.3. This means that the model does not explain the data well."
@@ -35,5 +62,75 @@ class RegressionModel:
         Returns:
             float: The predicted value
         """
-        x_test = np.array([1, input_stat])  # 1 is the constant term for statsmodels
-        return self.model.get_prediction(x_test).predicted[0]
+        return float(self.predict_batch(np.array([input_stat]))[0])
+
+    def predict_batch(self, input_stats: np.ndarray) -> np.ndarray:
+        """
+        Predicts the target value for every input at once using the fitted coefficients.
+
+        Args:
+            input_stats: The input statistics to predict from
+
+        Returns:
+            np.ndarray: The predicted values
+        """
+        return self.intercept + self.slope * input_stats
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "x_col": self.x_col,
+            "y_col": self.y_col,
+            "intercept": self.intercept,
+            "slope": self.slope,
+        }
+
+
+class RegressionModelStore:
+    """
+    Saves the coefficients of the fitted imputation models along with a fingerprint
+    of the data they were fitted on, so a later run on the same data can load them
+    instead of refitting.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    @staticmethod
+    def fingerprint(regression_df: pd.DataFrame) -> str:
+        """
+        Returns a hash of the data the models are fitted on, column names included.
+        """
+        digest = hashlib.sha256()
+        digest.update(json.dumps(regression_df.columns.tolist()).encode())
+        digest.update(pd.util.hash_pandas_object(regression_df, index=False).to_numpy())
+        return digest.hexdigest()
+
+    def load(self, fingerprint: str) -> Optional[Dict[str, RegressionModel]]:
+        """
+        Returns the saved models if they were fitted on data with this fingerprint, otherwise None.
+        """
+        try:
+            with open(self.path, "r") as f:
+                saved = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        if saved.get("fingerprint") != fingerprint:
+            return None
+        return {
+            name: RegressionModel.from_coefficients(**coefficients)
+            for name, coefficients in saved["models"].items()
+        }
+
+    def save(self, fingerprint: str, models: Dict[str, RegressionModel]) -> None:
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {
+                    "fingerprint": fingerprint,
+                    "models": {name: model.to_dict() for name, model in models.items()},
+                },
+                f,
+                indent=4,
+            )
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,297 @@
+from __future__ import annotations
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .fighter import FighterHistory
+
+
+class FighterStatsStore:
+    """
+    Running totals of every fighter's stats over the bouts they've had, saved to a json file.
+
+    Per fighter it holds the number of bouts, the count and sum of each stat, the stats
+    from their last bout and its date, and their first bout (its key, corner and
+    stats), which the regression models fill in once they've fought again. A fighter's
+    average going into their next bout is their sum over their count, so looking it up
+    or adding a bout only touches the fighters in it.
+
+    It also holds the sums the imputation models are fitted from (the X and Y columns
+    of FighterHistory.regression_df), so new bouts update the models rather than
+    every fighter's history being refitted.
+    """
+
+    STATS: str = "stats"
+    PROCESSED: str = "processed"
+    FIGHTERS: str = "fighters"
+    REGRESSION: str = "regression"
+
+    # Sums of the regression rows for each stat: their count, X, Y, X * X and X * Y.
+    REGRESSION_SUMS: List[str] = ["n", "x", "y", "xx", "xy"]
+
+    def __init__(
+        self,
+        path: Path,
+        stat_cols: List[str],
+        fighters: pd.DataFrame,
+        regression: pd.DataFrame,
+        processed: List[str],
+    ) -> None:
+        """
+        Args:
+            path (Path): json file the store is saved to.
+            stat_cols (List[str]): the stats kept for every fighter, e.g. "sig_str_percent".
+            fighters (pd.DataFrame): the running totals, indexed by fighter.
+            regression (pd.DataFrame): the regression sums, indexed by stat.
+            processed (List[str]): keys of the bouts already added, see bout_keys.
+        """
+        self.path = path
+        self.stat_cols = stat_cols
+        self.fighters = fighters
+        self.regression = regression
+        self.processed = processed
+        self._processed_set: Set[str] = set(processed)
+
+    @classmethod
+    def from_history(
+        cls, path: Path, fighter_history: FighterHistory, keys: pd.Series
+    ) -> FighterStatsStore:
+        """
+        Builds the store from every fighter's full history.
+
+        Args:
+            path (Path): json file the store is saved to.
+            fighter_history (FighterHistory): every bout, one row per fighter per bout.
+            keys (pd.Series): the key of each bout, indexed like the bouts.
+        """
+        stat_cols = fighter_history.stat_cols
+        long_df = fighter_history.long_df
+        by_fighter = long_df.groupby("fighter", sort=False)
+        # The long dataframe is sorted by fighter then date.
+        first = long_df.drop_duplicates("fighter", keep="first").set_index("fighter")
+        last = long_df.drop_duplicates("fighter", keep="last").set_index("fighter")
+
+        fighters = pd.DataFrame(
+            {
+                "n_bouts": by_fighter.size(),
+                "last_date": pd.to_datetime(last["date"]),
+                "first_bout": keys.loc[first["bout"]].to_numpy(),
+                "first_corner": first["corner"],
+            }
+        )
+        counts = by_fighter[stat_cols].count()
+        sums = by_fighter[stat_cols].sum()
+        for stat in stat_cols:
+            fighters[f"{stat}_count"] = counts[stat]
+            fighters[f"{stat}_sum"] = sums[stat]
+            fighters[f"{stat}_last"] = last[stat]
+            fighters[f"{stat}_first"] = first[stat]
+
+        regression_df = fighter_history.regression_df()
+        regression = pd.DataFrame(
+            [
+                cls._regression_sums(
+                    regression_df[f"X_{stat}"].to_numpy(),
+                    regression_df[f"Y_{stat}"].to_numpy(),
+                )
+                for stat in stat_cols
+            ],
+            index=stat_cols,
+            columns=cls.REGRESSION_SUMS,
+        )
+        return cls(path, stat_cols, fighters, regression, keys.tolist())
+
+    @staticmethod
+    def _regression_sums(x: np.ndarray, y: np.ndarray) -> List[float]:
+        return [float(len(x)), x.sum(), y.sum(), (x * x).sum(), (x * y).sum()]
+
+    @classmethod
+    def load(cls, path: Path) -> Optional[FighterStatsStore]:
+        """
+        Returns the saved store, or None if there isn't a usable one.
+        """
+        try:
+            with open(path, "r") as f:
+                saved: Dict[str, Any] = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if any(
+            key not in saved
+            for key in (cls.STATS, cls.PROCESSED, cls.FIGHTERS, cls.REGRESSION)
+        ):
+            return None
+
+        fighters = pd.DataFrame(
+            saved[cls.FIGHTERS]["columns"], index=saved[cls.FIGHTERS]["index"]
+        )
+        fighters["last_date"] = pd.to_datetime(fighters["last_date"])
+        regression = pd.DataFrame.from_dict(
+            saved[cls.REGRESSION], orient="index", columns=cls.REGRESSION_SUMS
+        )
+        return cls(path, saved[cls.STATS], fighters, regression, saved[cls.PROCESSED])
+
+    def save(self) -> None:
+        fighters = self.fighters.assign(
+            last_date=self.fighters["last_date"].dt.strftime("%Y-%m-%d")
+        )
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {
+                    self.STATS: self.stat_cols,
+                    self.PROCESSED: self.processed,
+                    # Lists of python floats, which json writes without losing precision.
+                    self.FIGHTERS: {
+                        "index": fighters.index.tolist(),
+                        "columns": {
+                            column: fighters[column].tolist()
+                            for column in fighters.columns
+                        },
+                    },
+                    self.REGRESSION: self.regression.to_dict(orient="index"),
+                },
+                f,
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def is_processed(self, keys: pd.Series) -> pd.Series:
+        """
+        Returns a mask of the bouts already added to the store.
+        """
+        return keys.isin(self._processed_set)
+
+    def pre_fight_averages(self, fighters: pd.Series) -> pd.DataFrame:
+        """
+        Each fighter's average for every stat over all the bouts in the store. Fighters
+        without any bouts in the store are left missing.
+
+        Args:
+            fighters (pd.Series): fighter names.
+
+        Returns:
+            pd.DataFrame: one column per stat, aligned to the fighters.
+        """
+        totals: pd.DataFrame = self.fighters.reindex(fighters.to_numpy())
+        with np.errstate(invalid="ignore", divide="ignore"):
+            averages = (
+                totals[[f"{stat}_sum" for stat in self.stat_cols]].to_numpy()
+                / totals[[f"{stat}_count" for stat in self.stat_cols]].to_numpy()
+            )
+        return pd.DataFrame(averages, index=fighters.index, columns=self.stat_cols)
+
+    def last_bout_dates(self, fighters: pd.Series) -> pd.Series:
+        """
+        The date of each fighter's last bout in the store, missing for fighters without one.
+        """
+        return pd.Series(
+            self.fighters["last_date"].reindex(fighters.to_numpy()).to_numpy(),
+            index=fighters.index,
+        )
+
+    def add_bouts(self, bouts: pd.DataFrame, keys: pd.Series) -> None:
+        """
+        Adds one date's bouts to the store, updating the regression sums with the
+        averages going into them first. Each fighter can only appear once.
+
+        Args:
+            bouts (pd.DataFrame): rows of FighterHistory.long_df from the same date.
+            keys (pd.Series): the key of each bout, indexed like the bouts in the long dataframe's "bout" column.
+        """
+        totals: pd.DataFrame = self.fighters.reindex(bouts["fighter"].to_numpy())
+        stats: np.ndarray = bouts[self.stat_cols].to_numpy(dtype=float)
+        counts = totals[[f"{stat}_count" for stat in self.stat_cols]].to_numpy()
+        sums = totals[[f"{stat}_sum" for stat in self.stat_cols]].to_numpy()
+        last = totals[[f"{stat}_last" for stat in self.stat_cols]].to_numpy()
+        counts, sums = np.nan_to_num(counts), np.nan_to_num(sums)
+
+        self._update_regression(counts, sums, last)
+
+        is_new: np.ndarray = totals["n_bouts"].isna().to_numpy()
+        seen = ~np.isnan(stats)
+        columns: Dict[str, Any] = {
+            "n_bouts": np.nan_to_num(totals["n_bouts"].to_numpy()) + 1,
+            "last_date": pd.to_datetime(bouts["date"]).to_numpy(),
+            "first_bout": np.where(
+                is_new,
+                keys.loc[bouts["bout"]].to_numpy(),
+                totals["first_bout"].to_numpy(),
+            ),
+            "first_corner": np.where(
+                is_new, bouts["corner"].to_numpy(), totals["first_corner"]
+            ),
+        }
+        for i, stat in enumerate(self.stat_cols):
+            columns[f"{stat}_count"] = counts[:, i] + seen[:, i]
+            columns[f"{stat}_sum"] = sums[:, i] + np.where(seen[:, i], stats[:, i], 0)
+            columns[f"{stat}_last"] = stats[:, i]
+            columns[f"{stat}_first"] = np.where(
+                is_new, stats[:, i], totals[f"{stat}_first"]
+            )
+        updated = pd.DataFrame(columns, index=totals.index)
+        # Replacing the fighters' rows in one go, setting rows of mixed dtypes with .loc is slow.
+        self.fighters = pd.concat(
+            [
+                self.fighters[~self.fighters.index.isin(updated.index)],
+                updated[self.fighters.columns].astype(self.fighters.dtypes),
+            ]
+        )
+
+        new_keys: List[str] = keys.loc[bouts["bout"].unique()].tolist()
+        self.processed.extend(new_keys)
+        self._processed_set.update(new_keys)
+
+    def _update_regression(
+        self, counts: np.ndarray, sums: np.ndarray, last: np.ndarray
+    ) -> None:
+        """
+        Adds the regression rows of the bouts being added. X is a fighter's average
+        going into the bout, Y their average going into their previous bout, which is
+        their totals without their last bout. Like FighterHistory.regression_df, only
+        rows where every stat has both are used.
+        """
+        seen_last = ~np.isnan(last)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            x = sums / counts
+            y = (sums - np.where(seen_last, last, 0)) / (counts - seen_last)
+        complete = np.isfinite(x).all(axis=1) & np.isfinite(y).all(axis=1)
+        if not complete.any():
+            return
+
+        self.regression += np.array(
+            [
+                self._regression_sums(x[complete, i], y[complete, i])
+                for i in range(len(self.stat_cols))
+            ]
+        )
+
+    def regression_coefficients(self, x_col: str) -> Tuple[float, float]:
+        """
+        The intercept and slope of the least squares fit of Y on X for a stat.
+
+        Args:
+            x_col (str): the X column of the stat, e.g. "X_sig_str_percent".
+        """
+        n, x, y, xx, xy = self.regression.loc[x_col.removeprefix("X_")]
+        slope = (xy - x * y / n) / (xx - x * x / n)
+        return float((y - slope * x) / n), float(slope)
+
+    def first_bouts(self) -> pd.DataFrame:
+        """
+        The first bout of every fighter who has fought more than once, which the
+        regression models fill in.
+
+        Returns:
+            pd.DataFrame: indexed by fighter, the bout's key ("first_bout"), the
+                fighter's corner ("first_corner") and their stats in it ("{stat}_first").
+        """
+        return self.fighters.loc[
+            self.fighters["n_bouts"] > 1,
+            ["first_bout", "first_corner"]
+            + [f"{stat}_first" for stat in self.stat_cols],
+        ]
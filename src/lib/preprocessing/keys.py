@@ -0,0 +1,56 @@
+"""
+Module to identify bouts across the raw and clean datasets.
+"""
+
+import pandas as pd
+
+RAW_DATE_FORMAT: str = "%B %d, %Y"
+
+
+def bout_keys(df: pd.DataFrame) -> pd.Series:
+    """
+    Builds a stable key for each bout from its date and the two fighters, e.g.
+    "2024-03-09|Sean O'Malley|Marlon Vera".
+
+    Works on raw rows (dates like "March 09, 2024", "red_Fighter" columns) and on
+    cleaned rows (datetime or "2024-03-09" dates, "red_fighter" columns), so a raw
+    row and the row it was cleaned into share the same key.
+
+    Args:
+        df (pd.DataFrame): raw or clean bouts.
+
+    Returns:
+        pd.Series: the key of each row, aligned to the dataframe's index.
+    """
+    columns = {column.lower(): column for column in df.columns}
+    dates = df[columns["date"]]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        try:
+            dates = pd.to_datetime(dates, format=RAW_DATE_FORMAT)
+        except ValueError:
+            # Clean data read back from a csv file, e.g. "2024-03-09".
+            dates = pd.to_datetime(dates, format="ISO8601")
+
+    return (
+        dates.dt.strftime("%Y-%m-%d")
+        + "|"
+        + df[columns["red_fighter"]].astype(str)
+        + "|"
+        + df[columns["blue_fighter"]].astype(str)
+    )
+
+
+def drop_duplicate_bouts(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Keeps the last row of each bout, e.g. when a card was scraped and appended again.
+
+    Args:
+        df (pd.DataFrame): raw or clean bouts.
+
+    Returns:
+        pd.DataFrame: the bouts with unique keys, in their original order.
+    """
+    duplicated = bout_keys(df).duplicated(keep="last")
+    if not duplicated.any():
+        return df
+    return df[~duplicated].reset_index(drop=True)
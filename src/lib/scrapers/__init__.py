@@ -2,3 +2,4 @@ from .bouts import BoutScraper
 from .cards import CardScraper
 from .fighters import FighterScraper
 from .homepage import HomepageScraper
+from .parsing import ParsingPool
@@ -4,7 +4,7 @@ Each page type has its own scraper class, which inherits from this class.
 the ABC contains all methods that are common to all scrapers.
 """
 
-from typing import Dict, Union, List, Optional
+from typing import Any, Callable, Dict, Union, List, Optional, Tuple
 from abc import ABC, abstractmethod
 
 import requests  # type: ignore
@@ -14,20 +14,37 @@ import aiohttp
 from bs4 import BeautifulSoup
 from loguru import logger
 
+from src.config import ScraperSettings
+from src.lib.networking import SessionManager
+from .parsing import ParsingPool
+
 
 class ScraperABC(ABC):
     """
     Abstract base class for all scrapers.
     """
 
-    def __init__(self, url: str) -> None:
+    PARSER_BACKENDS = ("bs4", "lxml")
+
+    def __init__(
+        self,
+        url: str,
+        session: Optional[SessionManager] = None,
+        parsing_pool: Optional[ParsingPool] = None,
+    ) -> None:
         """
         Initialises the ScraperABC class.
 
         Args:
             url (str): URL to scrape.
+            session (Optional[SessionManager], optional): shared session to make requests with.
+                Defaults to None, in which case a one-off session is opened per request.
+            parsing_pool (Optional[ParsingPool], optional): worker processes to parse pages in.
+                Defaults to None, in which case pages are parsed on the event loop.
         """
         self.url = url
+        self.session = session
+        self.parsing_pool = parsing_pool
         self.red_prefix = "red_"
         self.blue_prefix = "blue_"
 
@@ -59,12 +76,81 @@ class ScraperABC(ABC):
         Returns:
             BeautifulSoup: Soup object for the given URL.
         """
+        html = await self._aget_html(params=params)
+        soup = BeautifulSoup(html, "lxml")
+        return soup
+
+    async def _aget_html(
+        self, params: Optional[Dict[str, Union[str, int]]] = None
+    ) -> str:
+        """
+        Method to get the raw html for a given URL asynchronously.
+        Uses the shared session when one was injected.
+
+        Args:
+            params (Optional[Dict[str, Union[str, int]]], optional): params dict for making a reques. Defaults to None.
+
+        Returns:
+            str: the html of the page.
+        """
+        if self.session is not None:
+            return await self.session.get_text(self.url, params=params)
+
         async with aiohttp.ClientSession() as session:
             logger.info(f"Scraping URL: {self.url}")
             async with session.get(self.url, params=params) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, "lxml")
-                return soup
+                html: str = await response.text()
+                return html
+
+    async def _aget_html_if_modified(
+        self, validators: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[str], Dict[str, str]]:
+        """
+        Method to get the raw html for a given URL only if it changed since it was last fetched.
+        Without a shared session the page is always fetched.
+
+        Args:
+            validators (Optional[Dict[str, str]], optional): validators from the last fetch,
+                see SessionManager.get_text_if_modified. Defaults to None.
+
+        Returns:
+            Tuple[Optional[str], Dict[str, str]]: the html of the page, or None if it is unchanged,
+                and the validators to send next time.
+        """
+        if self.session is not None:
+            return await self.session.get_text_if_modified(self.url, validators)
+        return await self._aget_html(), {}
+
+    async def _aparse(self, parse: Callable[..., Any], *args: Any) -> Any:
+        """
+        Parses a fetched page, in the parsing pool when one was injected.
+
+        Args:
+            parse (Callable[..., Any]): picklable function to parse the page with, usually parse_html.
+            *args (Any): arguments for the parse function.
+
+        Returns:
+            Any: whatever the parse function returns.
+        """
+        if self.parsing_pool is not None:
+            return await self.parsing_pool.run(parse, *args)
+        return parse(*args)
+
+    @classmethod
+    def _check_parser_backend(cls, backend: Optional[str]) -> str:
+        """
+        Returns:
+            str: the backend, ScraperSettings.PARSER_BACKEND as it is now if None.
+
+        Raises:
+            ValueError: If the backend is not one of PARSER_BACKENDS.
+        """
+        backend = backend or ScraperSettings.PARSER_BACKEND
+        if backend not in cls.PARSER_BACKENDS:
+            raise ValueError(
+                f"Unknown parser backend '{backend}', choose from {cls.PARSER_BACKENDS}"
+            )
+        return backend
 
     def _clean_text(self, text: str) -> str:
         """
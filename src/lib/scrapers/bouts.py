@@ -3,9 +3,21 @@ Module to get the information for each bout on a card.
 """
 
 import re
-from typing import List, Dict, Tuple
+from typing import Iterable, List, Dict, Optional, Tuple
 
+from bs4 import BeautifulSoup
+
+from src.config import ScraperSettings
+from src.lib.networking import SessionManager
 from .abstract import ScraperABC
+from .parsing import ParsingPool
+from .xpath import (
+    all_with_class,
+    first_with_class,
+    get_text,
+    iter_children_text,
+    parse_html,
+)
 
 
 class BoutScraper(ScraperABC):
@@ -13,7 +25,27 @@ class BoutScraper(ScraperABC):
     Class to scrape the information for each bout on a card.
     """
 
-    def __init__(self, url: str, date: str, location: str) -> None:
+    # Compiled once, used by the lxml parser backend.
+    _STATS = all_with_class("b-fight-details__table-text", limit=20)
+    _STATS_HEADER = first_with_class("b-fight-details__table-head")
+    _FIGHT_TITLE = first_with_class("b-fight-details__fight-title")
+    _RED_CORNER = first_with_class("b-fight-details__person")
+    _LOSS_OR_DRAW = first_with_class(
+        "b-fight-details__person-status b-fight-details__person-status_style_gray",
+        context=".//",
+    )
+    _FIGHTER_LINKS = all_with_class(
+        "b-link b-fight-details__person-link", limit=2, tag="a"
+    )
+
+    def __init__(
+        self,
+        url: str,
+        date: str,
+        location: str,
+        session: Optional[SessionManager] = None,
+        parsing_pool: Optional[ParsingPool] = None,
+    ) -> None:
         """
         Instantiates the class and calls the parent class to get the soup object.
 
@@ -21,17 +53,98 @@ class BoutScraper(ScraperABC):
             url (str): URL to a specific bout on a card.
             date (str): The date the bout took place
             location (str): The location the bout took place.
+            session (Optional[SessionManager], optional): shared session to make requests with.
+            parsing_pool (Optional[ParsingPool], optional): worker processes to parse the page in.
         """
-        super().__init__(url)
+        super().__init__(url, session, parsing_pool)
+        self.date = date
+        self.location = location
         self.card_info = {"date": date, "location": location}
 
-    async def scrape_url(self):
-        fight = await self._aget_soup()
-        full_bout_details = self._extract_bout_stats(fight=fight)
-        fighter_links = self.get_fighter_links(fight=fight)
+    async def scrape_url(self) -> Tuple[Dict[str, str], List[str]]:
+        html = await self._aget_html()
+        return await self._aparse(
+            BoutScraper.parse_html,
+            self.url,
+            html,
+            self.date,
+            self.location,
+            ScraperSettings.PARSER_BACKEND,
+        )
+
+    @classmethod
+    def parse_html(
+        cls,
+        url: str,
+        html: str,
+        date: str,
+        location: str,
+        backend: Optional[str] = None,
+    ) -> Tuple[Dict[str, str], List[str]]:
+        """
+        Parses the html of a bout page. Runs in the parsing pool's worker processes.
+
+        Args:
+            url (str): URL of the bout.
+            html (str): html of the bout page.
+            date (str): The date the bout took place.
+            location (str): The location the bout took place.
+            backend (Optional[str], optional): parser to use, one of PARSER_BACKENDS.
+                Defaults to ScraperSettings.PARSER_BACKEND.
+
+        Returns:
+            Tuple[Dict[str, str], List[str]]: the bout stats and the links to both fighters' profiles.
+        """
+        backend = cls._check_parser_backend(backend)
+        bout = cls(url, date, location)
+        if backend == "lxml":
+            fight = parse_html(html)
+            return bout._extract_bout_stats_lxml(fight), bout._get_fighter_links_lxml(
+                fight
+            )
+
+        fight = BeautifulSoup(html, "lxml")
+        full_bout_details = bout._extract_bout_stats(fight=fight)
+        fighter_links = bout.get_fighter_links(fight=fight)
 
         return full_bout_details, fighter_links
 
+    def _get_fighter_links_lxml(self, fight) -> List[str]:
+        """
+        Same as get_fighter_links, using compiled XPath expressions on an lxml tree.
+        """
+        return [link.get("href") for link in self._FIGHTER_LINKS(fight)]
+
+    def _extract_bout_stats_lxml(self, fight) -> Dict[str, str]:
+        """
+        Same as _extract_bout_stats, using compiled XPath expressions on an lxml tree.
+        """
+        bout_stats: List[str] = [
+            self._clean_text(get_text(stat)) for stat in self._STATS(fight)
+        ]
+        bout_header: List[str] = self._split_fight_stats_header(
+            iter_children_text(self._STATS_HEADER(fight)[0])
+        )
+        bout_details: Dict[str, str] = dict(zip(bout_header, bout_stats))
+
+        weight_class, title_bout = self._clean_weight(
+            get_text(self._FIGHT_TITLE(fight)[0])
+        )
+        outcome = self._LOSS_OR_DRAW(self._RED_CORNER(fight)[0])
+        fight_info: Dict[str, str] = {
+            "weight_class": weight_class,
+            "title_bout": title_bout,
+            "winner": self._clean_text(get_text(outcome[0])) if outcome else "W",
+        }
+
+        full_bout_details: Dict[str, str] = {
+            **self.card_info,
+            **fight_info,
+            **bout_details,
+        }
+
+        return full_bout_details
+
     async def extract_future_bout_stats(self):
         fight = await self._aget_soup()
         names = [
@@ -89,7 +202,12 @@ class BoutScraper(ScraperABC):
             Tuple[str, str]: the weight class and whether it was a title bout.
         """
         weight: str = fight.find(class_="b-fight-details__fight-title").text  # type: ignore
+        return self._clean_weight(weight)
 
+    def _clean_weight(self, weight: str) -> Tuple[str, str]:
+        """
+        Splits the text of the fight title into the weight class and whether it was a title bout.
+        """
         if "Title" in weight:
             title_bout: str = "Y"
         else:
@@ -143,10 +261,18 @@ class BoutScraper(ScraperABC):
         Returns:
             List[str]: List of prefixed stat names. (red/blue corner prefix)
         """
+        return self._split_fight_stats_header(
+            link.text for link in fight.find(class_="b-fight-details__table-head")  # type: ignore
+        )
+
+    def _split_fight_stats_header(self, header_text: Iterable[str]) -> List[str]:
+        """
+        Splits the text of each child of the stats table head into the prefixed stat names.
+        """
         header: List[str] = []
-        for link in fight.find(class_="b-fight-details__table-head"):  # type: ignore
+        for link_text in header_text:
             # Cleans the header such that it splits entries if there has been one new line followed by 3 or more non-word characters.
-            text: List[str] = re.split(r"\n\W{3,}", link.text)  # type: ignore
+            text: List[str] = re.split(r"\n\W{3,}", link_text)  # type: ignore
             filtered_text: List[str] = [
                 self._clean_text(entry)
                 for entry in text
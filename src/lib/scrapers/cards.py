@@ -2,9 +2,16 @@
 Class to scrape a single event.
 """
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
+from bs4 import BeautifulSoup
+from lxml import etree
+
+from src.config import ScraperSettings
+from src.lib.networking import SessionManager
 from .abstract import ScraperABC
+from .parsing import ParsingPool
+from .xpath import first_with_class, get_text, parse_html
 from loguru import logger
 
 
@@ -13,15 +20,66 @@ class CardScraper(ScraperABC):
     Class to scrape a single event.
     """
 
-    def __init__(self, url: str) -> None:
-        super().__init__(url)
+    # Compiled once, used by the lxml parser backend.
+    _EVENT_NAME = first_with_class("b-content__title-highlight")
+    _EVENT_DETAILS = first_with_class("b-list__box-list")
+    _DATA_LINKS = etree.XPath("//*/@data-link")
+
+    def __init__(
+        self,
+        url: str,
+        session: Optional[SessionManager] = None,
+        parsing_pool: Optional[ParsingPool] = None,
+    ) -> None:
+        super().__init__(url, session, parsing_pool)
         # self.ufc_card = self._get_soup()
 
     async def scrape_url(self) -> Tuple[str, str, str, List[str]]:
         """
         Executes all the logic to get the information about a single event.
         """
-        ufc_card = await self._aget_soup()
+        html = await self._aget_html()
+        # Passed explicitly so worker processes use the setting as it is now.
+        return await self._aparse(
+            CardScraper.parse_html, self.url, html, ScraperSettings.PARSER_BACKEND
+        )
+
+    @classmethod
+    def parse_html(
+        cls, url: str, html: str, backend: Optional[str] = None
+    ) -> Tuple[str, str, str, List[str]]:
+        """
+        Parses the html of an event page. Runs in the parsing pool's worker processes.
+
+        Args:
+            url (str): URL of the event.
+            html (str): html of the event page.
+            backend (Optional[str], optional): parser to use, one of PARSER_BACKENDS.
+                Defaults to ScraperSettings.PARSER_BACKEND.
+
+        Returns:
+            Tuple[str, str, str, List[str]]: the event name, date, location and links to each fight.
+        """
+        backend = cls._check_parser_backend(backend)
+        if backend == "lxml":
+            return cls(url)._parse_card_lxml(parse_html(html))
+        return cls(url)._parse_card(BeautifulSoup(html, "lxml"))
+
+    def _parse_card_lxml(self, ufc_card) -> Tuple[str, str, str, List[str]]:
+        """
+        Same as _parse_card, using compiled XPath expressions on an lxml tree.
+        """
+        event_name: str = get_text(self._EVENT_NAME(ufc_card)[0]).strip()
+        date, location = self._split_event_details(
+            get_text(self._EVENT_DETAILS(ufc_card)[0])
+        )
+        fight_links: List[str] = [
+            str(link) for link in self._DATA_LINKS(ufc_card) if "fight-details" in link
+        ]
+
+        return event_name, date, location, fight_links
+
+    def _parse_card(self, ufc_card) -> Tuple[str, str, str, List[str]]:
         logger.info("Getting Event Name")
         event_name: str = self._extract_event_name(ufc_card)
         logger.info("Getting Event Details")
@@ -48,11 +106,14 @@ class CardScraper(ScraperABC):
         Returns:
             Tuple[str,str]: the date and location of the event.
         """
-        event_info = (
-            ufc_card.find(class_="b-list__box-list")  # type: ignore
-            .text.replace("\n", "")
-            .split("      ")
-        )  # type: ignore
+        event_details: str = ufc_card.find(class_="b-list__box-list").text  # type: ignore
+        return self._split_event_details(event_details)
+
+    def _split_event_details(self, event_details: str) -> Tuple[str, str]:
+        """
+        Splits the text of the event details box into the date and location.
+        """
+        event_info = event_details.replace("\n", "").split("      ")
 
         # Gets the Date and Location.
         date: str = event_info[3].strip()
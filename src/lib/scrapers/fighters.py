@@ -2,8 +2,15 @@
 Module for scraping the information for each fighter from their stats page.
 """
 
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+from src.config import ScraperSettings
+from src.lib.networking import SessionManager
 from .abstract import ScraperABC
+from .parsing import ParsingPool
+from .xpath import all_with_class, first_with_class, get_text, parse_html
 
 
 class FighterScraper(ScraperABC):
@@ -11,23 +18,105 @@ class FighterScraper(ScraperABC):
     Class to scrape the information for each fighter from their stats page.
     """
 
-    def __init__(self, url: str, red_corner: bool):
+    # Compiled once, used by the lxml parser backend.
+    _RECORD = first_with_class("b-content__title-record")
+    _CAREER_INFO = all_with_class(
+        "b-list__box-list-item b-list__box-list-item_type_block"
+    )
+
+    def __init__(
+        self,
+        url: str,
+        red_corner: bool,
+        session: Optional[SessionManager] = None,
+        parsing_pool: Optional[ParsingPool] = None,
+    ):
         """
         Instantiates the class and calls the parent class to get the soup object.
 
         Args:
             url (str): URL for a single fighters profile.
+            red_corner (bool): whether the fighter is in the red corner for the bout.
+            session (Optional[SessionManager], optional): shared session to make requests with.
+            parsing_pool (Optional[ParsingPool], optional): worker processes to parse the page in.
         """
-        super().__init__(url)
+        super().__init__(url, session, parsing_pool)
         # self.fighter = self._get_soup()
+        self.red_corner = red_corner
         self.prefix = self.red_prefix if red_corner else self.blue_prefix
 
     async def scrape_url(self) -> Dict[str, str]:
-        fighter = await self._aget_soup()
-        fighter_profile: Dict[str, str] = self._extract_fighter_details(fighter)
+        html = await self._aget_html()
+        fighter_profile: Dict[str, str] = await self.parse_page(html)
 
         return fighter_profile
 
+    async def fetch_if_modified(
+        self, validators: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[str], Dict[str, str]]:
+        """
+        Fetches the profile page with a conditional request.
+
+        Args:
+            validators (Optional[Dict[str, str]], optional): validators from the last time
+                the page was fetched. Defaults to None, which always fetches the page.
+
+        Returns:
+            Tuple[Optional[str], Dict[str, str]]: the html of the page, or None if it hasn't changed,
+                and the validators to send next time.
+        """
+        return await self._aget_html_if_modified(validators)
+
+    async def parse_page(self, html: str) -> Dict[str, str]:
+        """
+        Parses a fetched profile page, in the parsing pool when one was injected.
+        """
+        return await self._aparse(
+            FighterScraper.parse_html,
+            self.url,
+            html,
+            self.red_corner,
+            ScraperSettings.PARSER_BACKEND,
+        )
+
+    @classmethod
+    def parse_html(
+        cls,
+        url: str,
+        html: str,
+        red_corner: bool,
+        backend: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """
+        Parses the html of a fighter's profile. Runs in the parsing pool's worker processes.
+
+        Args:
+            url (str): URL for a single fighters profile.
+            html (str): html of the profile page.
+            red_corner (bool): whether the fighter is in the red corner for the bout.
+            backend (Optional[str], optional): parser to use, one of PARSER_BACKENDS.
+                Defaults to ScraperSettings.PARSER_BACKEND.
+
+        Returns:
+            Dict[str, str]: fighter information, keys prefixed by their corner.
+        """
+        backend = cls._check_parser_backend(backend)
+        if backend == "lxml":
+            return cls(url, red_corner)._extract_fighter_details_lxml(parse_html(html))
+
+        fighter = BeautifulSoup(html, "lxml")
+        return cls(url, red_corner)._extract_fighter_details(fighter)
+
+    def _extract_fighter_details_lxml(self, fighter) -> Dict[str, str]:
+        """
+        Same as _extract_fighter_details, using compiled XPath expressions on an lxml tree.
+        """
+        cleaned_record: List[str] = self._clean_text(
+            get_text(self._RECORD(fighter)[0])
+        ).split(":")
+        career_info = (get_text(each) for each in self._CAREER_INFO(fighter))
+        return self._build_fighter_profile(cleaned_record, career_info)
+
     def _extract_fighter_record(self, fighter) -> List[str]:
         # First find their record.
         record = fighter.find(class_="b-content__title-record")
@@ -54,13 +143,23 @@ class FighterScraper(ScraperABC):
             class_="b-list__box-list-item b-list__box-list-item_type_block"
         )
 
+        return self._build_fighter_profile(
+            cleaned_record, (each.text for each in career_info)
+        )
+
+    def _build_fighter_profile(
+        self, cleaned_record: List[str], career_info: Iterable[str]
+    ) -> Dict[str, str]:
+        """
+        Builds the fighter's profile from their record and the text of each career stat.
+        """
         # Create a list to store all of the info for each fighter.
         all_info: List[List[str]] = []
 
         for each in career_info:
             # Each entry is a 2 element list containing the name of the stat and the stat itself.
             # clean text then split on the colon.
-            output: List[str] = self._clean_text(each.text).split(":")
+            output: List[str] = self._clean_text(each).split(":")
 
             # Add the info for each fighter to the list.
             all_info.append(output)
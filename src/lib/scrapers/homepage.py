@@ -3,8 +3,11 @@ Module responsible for scraping the details for each event.
 """
 
 from __future__ import annotations
-from typing import List
+import asyncio
+from typing import Collection, List, Optional, Set
 
+from src.config import ScraperSettings
+from src.lib.networking import SessionManager
 from .abstract import ScraperABC
 
 
@@ -13,9 +16,29 @@ class HomepageScraper(ScraperABC):
     Class to scrape the homepage. Will get all the links for each event.
     """
 
-    def __init__(self, url: str, cache: List[str]) -> None:
-        super().__init__(url)
-        self.cache: List[str] = cache
+    def __init__(
+        self,
+        url: str,
+        cache: Collection[str],
+        session: Optional[SessionManager] = None,
+        history_complete: bool = False,
+        to_retry: Collection[str] = (),
+    ) -> None:
+        """
+        Args:
+            url (str): the homepage listing the events.
+            cache (Collection[str]): the events already scraped.
+            session (Optional[SessionManager]): shared session for the run.
+            history_complete (bool): every past event has been scraped once, so the listing can stop at the first page of cached events. See EventLogCache.history_complete.
+            to_retry (Collection[str]): events to scrape again, every page is listed until they have all been found.
+        """
+        super().__init__(url, session)
+        # Only membership is checked, pass a set-backed cache (e.g. EventLogCache) for O(1) lookups.
+        self.cache: Collection[str] = cache
+        self.history_complete = history_complete
+        self.to_retry = to_retry
+        # Set once the links are listed, whether the listing went through to the last page.
+        self.listed_every_page: bool = False
 
     async def scrape_url(self) -> List[str]:
         links = await self._get_links()
@@ -38,16 +61,45 @@ class HomepageScraper(ScraperABC):
             List[str]: List of event links that have not been scraped yet.
         """
 
-        # Slightly slower than using sets, but this way it keeps the events in order.
+        # Iterates the page links rather than the cache so the events stay in order.
         filtered_event_links: List[str] = [
             event_link for event_link in event_links if event_link not in self.cache
         ]
 
         return filtered_event_links
 
+    def _extract_event_links(self, landing_page) -> List[str]:
+        """
+        Extracts the links to each event listed on a single page.
+        """
+        return [
+            link["href"]
+            for link in landing_page.find_all(
+                "a", class_="b-link b-link_style_black", href=True
+            )
+        ]
+
+    def _is_fully_cached(self, event_links: List[str]) -> bool:
+        return all(event_link in self.cache for event_link in event_links)
+
+    def _can_stop(self, event_links: List[str], unseen_retries: Set[str]) -> bool:
+        """
+        Events are listed newest first, so once every past event has been scraped a
+        page of cached events means every page after it is cached too. Until then,
+        e.g. after an interrupted backfill, there may be gaps on any page.
+        """
+        return (
+            self.history_complete
+            and not unseen_retries
+            and self._is_fully_cached(event_links)
+        )
+
     async def _get_links(self) -> List[str]:
         """
-        Method to get all the links from the homepage across all pages
+        Method to get all the links from the homepage across all pages.
+        Pages are requested until the first page of cached events once every past
+        event has been scraped and every event to retry has been found, otherwise
+        every page is requested.
         """
 
         home_page = await self._aget_soup()
@@ -57,22 +109,41 @@ class HomepageScraper(ScraperABC):
             "a", class_="b-statistics__paginate-link", href=True
         )
         # use -2 as -1 is 'All' and we want the last page number
-        final_page = page_numbers[-2].text
-        sequence: List[int] = list(range(1, int(final_page) + 1))
-
-        links: List[str] = []
-
-        # For each page, get the links
-        for i in sequence:
-            landing_page = await self._aget_soup(params={"page": i})
-            # For each link in each page, go through them
-            for link in landing_page.find_all(
-                "a", class_="b-link b-link_style_black", href=True
-            ):
-                links.append(link["href"])
+        final_page = int(page_numbers[-2].text)
+
+        # The homepage is the first page of events so it doesn't need requesting again.
+        page_links: List[str] = self._extract_event_links(home_page)
+        links: List[str] = list(page_links)
+        unseen_retries: Set[str] = set(self.to_retry).difference(page_links)
+        stopped = self._can_stop(page_links, unseen_retries)
+
+        # Until the history is complete every page is needed, so request them all at once.
+        pages_per_batch = (
+            ScraperSettings.HOMEPAGE_PAGES_PER_BATCH
+            if self.history_complete
+            else final_page
+        )
 
+        next_page = 2
+        while next_page <= final_page and not stopped:
+            batch = range(next_page, min(next_page + pages_per_batch, final_page + 1))
+            landing_pages = await asyncio.gather(
+                *(self._aget_soup(params={"page": i}) for i in batch)
+            )
+            next_page = batch[-1] + 1
+
+            # Pages come back in order, stop at the first one that has been fully scraped.
+            for landing_page in landing_pages:
+                page_links = self._extract_event_links(landing_page)
+                links.extend(page_links)
+                unseen_retries.difference_update(page_links)
+                if self._can_stop(page_links, unseen_retries):
+                    stopped = True
+                    break
+        self.listed_every_page = not stopped
+
+        # Events are only added to the cache once their card has been scraped.
         filtered_links = self._filter_event_links(links)
-        self.cache.extend(filtered_links)
         return filtered_links
 
     async def _get_next_event(self) -> str:
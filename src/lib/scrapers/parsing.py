@@ -0,0 +1,69 @@
+"""
+Module to parse fetched pages in worker processes, off the event loop.
+"""
+
+from __future__ import annotations
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+from src.config import ScraperSettings
+
+
+class ParsingPool:
+    """
+    Parses html into plain python objects using a pool of worker processes.
+
+    Coroutines only fetch pages, the CPU bound BeautifulSoup parsing is sent to
+    the pool so it doesn't block network I/O and can use more than one core.
+    Parse functions and their arguments are pickled, so they must be importable
+    module level functions or classmethods taking and returning plain data.
+    With no workers pages are parsed inline on the event loop.
+
+        with ParsingPool(max_workers=4) as parsing_pool:
+            profile = await parsing_pool.run(FighterScraper.parse_html, url, html, True)
+    """
+
+    def __init__(self, max_workers: int = ScraperSettings.PARSER_WORKERS) -> None:
+        """
+        Initialises the ParsingPool class. Worker processes are only started when first used.
+
+        Args:
+            max_workers (int): number of worker processes, 0 parses inline.
+        """
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> ParsingPool:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    async def run(self, parse: Callable[..., Any], *args: Any) -> Any:
+        """
+        Runs the parse function on a worker process and waits for its result.
+
+        Args:
+            parse (Callable[..., Any]): picklable function to parse the page with.
+            *args (Any): picklable arguments for the parse function, usually the url and its html.
+
+        Returns:
+            Any: whatever the parse function returns.
+        """
+        if self.max_workers == 0:
+            return parse(*args)
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, parse, *args)
+
+    def close(self) -> None:
+        """
+        Shuts down the worker processes.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -0,0 +1,99 @@
+"""
+Helpers for the lxml parser backend.
+
+The scrapers' lxml extractors use compiled XPath expressions instead of walking
+BeautifulSoup trees. These helpers match classes and collect text the same way
+BeautifulSoup does, so both backends produce identical output.
+"""
+
+from typing import Iterator
+
+import lxml.html
+from lxml import etree
+
+# BeautifulSoup's get_text skips comments and the contents of script, style and template tags.
+_TEXT = etree.XPath(
+    ".//text()[not(ancestor::script or ancestor::style or ancestor::template)]"
+)
+
+# BeautifulSoup collapses whitespace only strings unless they are inside one of these tags.
+_PRESERVES_WHITESPACE = etree.XPath(
+    "ancestor-or-self::pre or ancestor-or-self::textarea"
+)
+_ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+
+
+def parse_html(html: str) -> etree._Element:
+    """
+    Parses a page into an lxml tree, using the same libxml2 parser as BeautifulSoup's "lxml".
+    """
+    return lxml.html.document_fromstring(html)
+
+
+def has_class(class_name: str) -> str:
+    """
+    Returns an XPath predicate matching elements the way BeautifulSoup's class_ argument does.
+    A single class matches any element with that class, several classes must match the attribute exactly.
+    """
+    if " " in class_name:
+        return f"normalize-space(@class) = '{class_name}'"
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+def first_with_class(class_name: str, context: str = "//") -> etree.XPath:
+    """
+    Compiles an XPath returning the first element with the class, like BeautifulSoup's find(class_=...).
+    """
+    return etree.XPath(f"({context}*[{has_class(class_name)}])[1]")
+
+
+def all_with_class(
+    class_name: str, limit: int = 0, tag: str = "*", context: str = "//"
+) -> etree.XPath:
+    """
+    Compiles an XPath returning every element with the class in document order,
+    like BeautifulSoup's find_all(tag, class_=..., limit=...).
+    """
+    expression = f"{context}{tag}[{has_class(class_name)}]"
+    if limit:
+        expression = f"({expression})[position() <= {limit}]"
+    return etree.XPath(expression)
+
+
+def get_text(element: etree._Element) -> str:
+    """
+    Returns the text of the element and its descendants, like BeautifulSoup's .text.
+    """
+    if not isinstance(element.tag, str):
+        # Comments and processing instructions have no text in BeautifulSoup.
+        return ""
+    return "".join(
+        _as_bs4_string(text, text.getparent(), text.is_tail) for text in _TEXT(element)
+    )
+
+
+def _as_bs4_string(text: str, parent: etree._Element, is_tail: bool) -> str:
+    """
+    Returns a text node as BeautifulSoup stores it. Whitespace only strings
+    are collapsed to a single newline (if they contain one) or space.
+    """
+    if text.strip(_ASCII_SPACES):
+        return text
+    # A tail belongs to the element before it, the string itself sits in that element's parent.
+    container = parent.getparent() if is_tail else parent
+    if container is not None and _PRESERVES_WHITESPACE(container):
+        return text
+    return "\n" if "\n" in text else " "
+
+
+def iter_children_text(element: etree._Element) -> Iterator[str]:
+    """
+    Yields the text of each child node, strings included, like iterating a BeautifulSoup tag
+    and taking each child's .text.
+    """
+    if element.text:
+        yield _as_bs4_string(element.text, element, is_tail=False)
+    for child in element:
+        yield get_text(child)
+        if child.tail:
+            yield _as_bs4_string(child.tail, child, is_tail=True)
@@ -34,6 +34,7 @@ INSTALLED_APPS: list[str] = [
     "src.apps.scraper",
     "src.apps.preprocessing",
     "src.apps.predictor",
+    "src.apps.jobs",
     "django.contrib.admin",
     "django.contrib.auth",
     "django.contrib.contenttypes",
@@ -23,4 +23,5 @@ urlpatterns = [
     path("scraper/", include("src.apps.scraper.urls")),
     path("preprocessing/", include("src.apps.preprocessing.urls")),
     path("predictor/", include("src.apps.predictor.urls")),
+    path("jobs/", include("src.apps.jobs.urls")),
 ]
@@ -0,0 +1,20 @@
+import tempfile
+from pathlib import Path
+
+import django
+from django.conf import settings
+
+# The apps are tested against a database of their own rather than the server's.
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=["src.apps.scraper", "src.apps.jobs"],
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                # A file rather than memory, the raw data handler writes from its own thread.
+                "NAME": Path(tempfile.mkdtemp()) / "db.sqlite3",
+            }
+        },
+        USE_TZ=True,
+    )
+    django.setup()
@@ -0,0 +1,34 @@
+import json
+
+import pytest
+from django.test import RequestFactory
+
+from src.apps.jobs import views
+from src.lib.jobs import JobQueue
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    queue = JobQueue(tmp_path / "jobs.sqlite3")
+    monkeypatch.setattr(views, "get_job_queue", lambda: queue)
+    return queue
+
+
+@pytest.mark.parametrize("limit", ["abc", "1.5", "0", "-1"])
+def test_recent_jobs_rejects_a_bad_limit(queue, limit):
+    response = views.recent_jobs(RequestFactory().get("/jobs/", {"limit": limit}))
+
+    assert response.status_code == 400
+    assert json.loads(response.content) == {"error": "limit must be a positive integer"}
+
+
+def test_recent_jobs_are_limited(queue):
+    for kind in ("clean_data", "train", "pipeline"):
+        queue.enqueue(kind)
+
+    response = views.recent_jobs(RequestFactory().get("/jobs/", {"limit": "2"}))
+
+    assert [job["kind"] for job in json.loads(response.content)["data"]] == [
+        "pipeline",
+        "train",
+    ]
@@ -0,0 +1,121 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+from django.core.management import call_command
+from django.db import connection
+
+from src.apps.scraper.handlers import ORMProcessingHandler
+from src.apps.scraper.models import RawUFCData
+from src.config import PathSettings
+from src.lib.constants.columns import RAW_COLUMNS
+from src.lib.data_managers import get_storage
+
+
+@pytest.fixture(autouse=True)
+def database():
+    call_command("migrate", "scraper", verbosity=0)
+    yield
+    RawUFCData.objects.all().delete()
+
+
+@pytest.fixture
+def raw_path(tmp_path):
+    return tmp_path / "raw_ufc_data.csv"
+
+
+def _raw_df(n_rows: int = 30) -> pd.DataFrame:
+    return pd.read_csv(PathSettings.RAW_DATA_CSV, nrows=n_rows)
+
+
+def _flush(rows_df: pd.DataFrame, path, **kwargs) -> None:
+    handler = ORMProcessingHandler(path, **kwargs)
+    for row in rows_df.to_dict("records"):
+        handler.add_row(row)
+    handler.write()
+
+
+def test_scraping_a_card_again_updates_its_bouts(raw_path):
+    raw_df = _raw_df()
+    _flush(raw_df, raw_path, batch_size=7)
+    assert RawUFCData.objects.count() == len(raw_df)
+
+    rescraped = raw_df.head(5).copy()
+    rescraped["winner"] = "Draw"
+    _flush(rescraped, raw_path)
+
+    assert RawUFCData.objects.count() == len(raw_df)
+    first = RawUFCData.objects.order_by("id").first()
+    assert first.winner == "Draw"
+    assert first.bout_key == (
+        f"{first.bout_date:%Y-%m-%d}|{first.red_Fighter}|{first.blue_Fighter}"
+    )
+
+
+def test_storage_reads_as_the_csv_file(raw_path):
+    raw_df = _raw_df()
+    _flush(raw_df, raw_path)
+
+    read_df = get_storage("orm").read(raw_path)
+
+    assert read_df.columns.tolist() == RAW_COLUMNS
+    pd.testing.assert_frame_equal(read_df, raw_df)
+
+
+def test_query_only_the_bouts_needed(raw_path):
+    raw_df = _raw_df(200)
+    _flush(raw_df, raw_path)
+    dates = pd.to_datetime(raw_df["date"], format="%B %d, %Y").dt.date
+    since = sorted(dates.unique())[-2]
+
+    after_df = get_storage("orm").read_after(since, columns=["date", "red_Fighter"])
+    fighter = raw_df["red_Fighter"].iloc[-1]
+    fighter_bouts = RawUFCData.objects.for_fighter(fighter)
+
+    assert len(after_df) == (dates > since).sum()
+    assert after_df.columns.tolist() == ["date", "red_Fighter"]
+    assert "raw_bout_date" in RawUFCData.objects.after(since).explain()
+    assert (
+        fighter_bouts.count()
+        == raw_df[["red_Fighter", "blue_Fighter"]].eq(fighter).any(axis=1).sum()
+    )
+    assert RawUFCData.objects.after(date(2100, 1, 1)).to_dataframe().empty
+
+
+def test_only_the_table_changes_its_version(raw_path):
+    version_path = get_storage("orm").resolve(raw_path)
+    assert not version_path.exists()
+    raw_df = _raw_df()
+    _flush(raw_df.head(20), raw_path)
+    first_version = version_path.read_text()
+
+    with connection.cursor() as cursor:
+        cursor.execute("CREATE TABLE unrelated (id integer)")
+        cursor.execute("INSERT INTO unrelated VALUES (1)")
+        cursor.execute("DROP TABLE unrelated")
+    _flush(raw_df.head(0), raw_path)
+    assert version_path.read_text() == first_version
+
+    _flush(raw_df.tail(10), raw_path)
+    second_version = version_path.read_text()
+    assert second_version != first_version
+
+    rescraped = raw_df.head(1).copy()
+    rescraped["winner"] = "Draw"
+    _flush(rescraped, raw_path)
+    assert version_path.read_text() != second_version
+
+
+def test_writing_replaces_the_stored_bouts(raw_path):
+    storage = get_storage("orm")
+    with pytest.raises(FileNotFoundError):
+        storage.read(raw_path)
+
+    raw_df = _raw_df()
+    _flush(raw_df, raw_path)
+    storage.write(raw_df.tail(10), raw_path)
+
+    pd.testing.assert_frame_equal(
+        storage.read(raw_path),
+        raw_df.tail(10).reset_index(drop=True),
+    )
@@ -0,0 +1,71 @@
+import json
+
+from src.lib.data_managers import EventLogCache, EventStatus
+
+
+def test_status_changes_are_replayed_from_the_log(tmp_path):
+    log_path = tmp_path / "event_cache.jsonl"
+    cache = EventLogCache(log_path)
+    cache.mark("event-1", EventStatus.SCRAPED)
+    cache.mark("event-2", EventStatus.FAILED)
+    cache.mark("event-3", EventStatus.PARTIAL)
+    cache.mark("event-2", EventStatus.SCRAPED)
+
+    # Each change is appended rather than rewriting the cache.
+    assert len(log_path.read_text().splitlines()) == 4
+
+    replayed = EventLogCache(log_path)
+    assert replayed.get() == ["event-1", "event-2"]
+    assert replayed.get(EventStatus.PARTIAL) == ["event-3"]
+    assert "event-2" in replayed
+    assert "event-3" not in replayed
+    assert len(replayed) == 2
+
+
+def test_truncated_last_line_is_ignored(tmp_path):
+    log_path = tmp_path / "event_cache.jsonl"
+    cache = EventLogCache(log_path)
+    cache.mark("event-1", EventStatus.SCRAPED)
+    with open(log_path, "a") as f:
+        f.write('{"event": "event-2", "sta')
+
+    assert EventLogCache(log_path).get() == ["event-1"]
+
+
+def test_write_compacts_to_one_line_per_event(tmp_path):
+    log_path = tmp_path / "event_cache.jsonl"
+    cache = EventLogCache(log_path)
+    cache.mark("event-1", EventStatus.FAILED)
+    cache.mark("event-1", EventStatus.SCRAPED)
+    cache.mark("event-2", EventStatus.SCRAPED)
+
+    cache.write()
+
+    assert len(log_path.read_text().splitlines()) == 2
+    assert EventLogCache(log_path).get() == ["event-1", "event-2"]
+
+
+def test_legacy_json_cache_is_imported_in_order(tmp_path):
+    legacy_path = tmp_path / "event_cache.json"
+    legacy_path.write_text(json.dumps(["event-2", "event-1"]))
+
+    cache = EventLogCache(tmp_path / "event_cache.jsonl", legacy_json_path=legacy_path)
+
+    assert cache.get() == ["event-2", "event-1"]
+    assert (tmp_path / "event_cache.jsonl").exists()
+
+
+def test_history_complete_survives_replay_and_compaction(tmp_path):
+    log_path = tmp_path / "event_cache.jsonl"
+    cache = EventLogCache(log_path)
+    cache.mark("event-1", EventStatus.SCRAPED)
+    cache.mark("event-2", EventStatus.FAILED)
+    assert not EventLogCache(log_path).history_complete
+
+    cache.mark_history_complete()
+    replayed = EventLogCache(log_path)
+    assert replayed.history_complete
+    assert replayed.to_retry == ["event-2"]
+
+    replayed.write()
+    assert EventLogCache(log_path).history_complete
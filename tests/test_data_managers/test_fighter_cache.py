@@ -0,0 +1,54 @@
+import asyncio
+
+from src.lib.data_managers import FighterProfileCache
+
+
+def test_concurrent_requests_share_one_fetch():
+    cache = FighterProfileCache(ttl=None)
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"Height": "6' 1\"", "record": " 24-2-0"}
+
+    async def scrape():
+        return await asyncio.gather(
+            *(cache.get_or_fetch("fighter-a", fetch) for _ in range(3))
+        )
+
+    profiles = asyncio.run(scrape())
+
+    assert len(calls) == 1
+    assert all(profile == profiles[0] for profile in profiles)
+    assert cache.stats["misses"] == 1
+    assert cache.stats["coalesced"] == 2
+
+    asyncio.run(cache.get_or_fetch("fighter-a", fetch))
+    assert cache.stats["hits"] == 1
+
+
+def test_stale_profiles_are_refetched():
+    cache = FighterProfileCache(ttl=60)
+    cache.put("fighter-a", {"record": " 1-0-0"}, fetched_at=0)
+
+    assert cache.get("fighter-a") is None
+
+    async def fetch():
+        return {"record": " 2-0-0"}
+
+    profile = asyncio.run(cache.get_or_fetch("fighter-a", fetch))
+    assert profile == {"record": " 2-0-0"}
+
+
+def test_profiles_round_trip_through_csv(tmp_path):
+    csv_path = tmp_path / "fighter_profile_cache.csv"
+    cache = FighterProfileCache(csv_path, ttl=None)
+    cache.put("fighter-a", {"SLpM": "2.50", "STANCE": "Orthodox"})
+    cache.put("fighter-b", {"SLpM": "0.70"})
+    cache.write()
+
+    reloaded = FighterProfileCache(csv_path, ttl=None)
+
+    assert reloaded.get("fighter-a") == {"SLpM": "2.50", "STANCE": "Orthodox"}
+    assert reloaded.get("fighter-b") == {"SLpM": "0.70"}
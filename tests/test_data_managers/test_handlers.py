@@ -0,0 +1,105 @@
+import pandas as pd
+
+from src.config import PathSettings
+from src.lib.data_managers import (
+    CSVProcessingHandler,
+    EventLogCache,
+    EventStatus,
+    StreamingCSVProcessingHandler,
+)
+
+
+def test_rows_are_buffered_until_the_dataframe_is_needed(tmp_path):
+    csv_path = tmp_path / "raw_ufc_data.csv"
+    pd.DataFrame({"date": ["February 08, 2025"], "winner": ["W"]}).to_csv(
+        csv_path, index=False
+    )
+    handler = CSVProcessingHandler(csv_path)
+
+    handler.add_row({"date": "December 07, 2024", "red_KD": "0", "winner": "L"})
+    handler.add_row({"date": "February 01, 2025", "blue_KD": "1"})
+
+    # Existing columns first, then new columns in the order they were first seen.
+    assert handler.df.columns.tolist() == ["date", "winner", "red_KD", "blue_KD"]
+    assert handler.df["date"].tolist() == [
+        "February 08, 2025",
+        "December 07, 2024",
+        "February 01, 2025",
+    ]
+
+    handler.add_row({"date": "January 18, 2025"})
+    handler.write()
+
+    assert len(pd.read_csv(csv_path)) == 4
+
+
+def test_streaming_handler_appends_each_flush(tmp_path):
+    csv_path = tmp_path / "raw_ufc_data.csv"
+    handler = StreamingCSVProcessingHandler(csv_path)
+
+    handler.add_row({"date": "February 08, 2025", "red_Sig. str.": "147 of 314"})
+    handler.flush()
+    handler.add_row({"date": "December 07, 2024", "red_Sig. str.": "32 of 52"})
+    handler.write()
+
+    df = pd.read_csv(csv_path)
+    assert df.columns.tolist() == ["date", "red_Sig. str."]
+    assert df["red_Sig. str."].tolist() == ["147 of 314", "32 of 52"]
+
+    # A restarted run only reads the header and carries on appending.
+    resumed = StreamingCSVProcessingHandler(csv_path)
+    assert resumed.columns == ["date", "red_Sig. str."]
+    resumed.add_row({"red_Sig. str.": "26 of 50", "date": "February 01, 2025"})
+    resumed.flush()
+
+    assert pd.read_csv(csv_path)["date"].tolist() == [
+        "February 08, 2025",
+        "December 07, 2024",
+        "February 01, 2025",
+    ]
+
+
+def test_streaming_handler_rewrites_file_for_new_columns(tmp_path):
+    csv_path = tmp_path / "raw_ufc_data.csv"
+    handler = StreamingCSVProcessingHandler(csv_path)
+
+    handler.add_row({"date": "February 08, 2025"})
+    handler.flush()
+    handler.add_row({"date": "December 07, 2024", "red_STANCE": "Switch"})
+    handler.flush()
+
+    df = pd.read_csv(csv_path, keep_default_na=False)
+    assert df.columns.tolist() == ["date", "red_STANCE"]
+    assert df["red_STANCE"].tolist() == ["", "Switch"]
+    assert not (tmp_path / "raw_ufc_data.csv.tmp").exists()
+
+
+def test_card_scraped_again_after_a_crash_is_not_appended_twice(tmp_path):
+    csv_path = tmp_path / "raw_ufc_data.csv"
+    cache = EventLogCache(tmp_path / "event_cache.jsonl")
+    first_card = pd.read_csv(PathSettings.RAW_DATA_CSV, nrows=12, dtype=str)
+    card = pd.read_csv(
+        PathSettings.RAW_DATA_CSV, skiprows=range(1, 13), nrows=12, dtype=str
+    )
+
+    handler = StreamingCSVProcessingHandler(csv_path)
+    for row in first_card.to_dict("records"):
+        handler.add_row(row)
+    handler.flush()
+    cache.mark("event-1", EventStatus.SCRAPED)
+    for row in card.to_dict("records"):
+        handler.add_row(row)
+    handler.flush()
+    # The process dies before the card is marked as scraped.
+
+    restarted_cache = EventLogCache(tmp_path / "event_cache.jsonl")
+    assert "event-2" not in restarted_cache
+    resumed = StreamingCSVProcessingHandler(csv_path)
+    for row in card.to_dict("records"):
+        resumed.add_row(row)
+    resumed.write()
+    restarted_cache.mark("event-2", EventStatus.SCRAPED)
+
+    stored_df = pd.read_csv(csv_path)
+    assert len(stored_df) == len(first_card) + len(card)
+    assert not stored_df.duplicated(["date", "red_Fighter", "blue_Fighter"]).any()
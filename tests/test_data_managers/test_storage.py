@@ -0,0 +1,54 @@
+import pandas as pd
+import pytest
+
+from src.lib.constants.columns import Columns
+from src.lib.data_managers import CSVStorage, ParquetStorage, get_storage
+
+
+def _clean_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            Columns.DATE: pd.to_datetime(["2024-01-13", "2024-02-10"]),
+            Columns.RED_FIGHTER: ["Fighter A", "Fighter C"],
+            Columns.BLUE_FIGHTER: ["Fighter B", "Fighter D"],
+            Columns.WEIGHT_CLASS: ["Lightweight", "Heavyweight"],
+            Columns.HEIGHT_DIFF: [2.54, float("nan")],
+        }
+    )
+
+
+def test_parquet_round_trip_keeps_dtypes(tmp_path):
+    storage = ParquetStorage()
+    df = _clean_df()
+
+    storage.write(df, tmp_path / "clean_ufc_data.csv")
+    read_df = storage.read(tmp_path / "clean_ufc_data.csv")
+
+    assert (tmp_path / "clean_ufc_data.parquet").exists()
+    assert read_df[Columns.DATE].dtype == "datetime64[ns]"
+    assert read_df[Columns.HEIGHT_DIFF].dtype == "float64"
+    assert isinstance(read_df[Columns.WEIGHT_CLASS].dtype, pd.CategoricalDtype)
+    pd.testing.assert_frame_equal(
+        read_df, df, check_categorical=False, check_dtype=False
+    )
+
+
+@pytest.mark.parametrize("storage", [CSVStorage(), ParquetStorage()])
+def test_projected_read_uses_requested_order(tmp_path, storage):
+    storage.write(_clean_df(), tmp_path / "clean_ufc_data")
+
+    columns = [Columns.HEIGHT_DIFF, Columns.RED_FIGHTER]
+    read_df = storage.read(tmp_path / "clean_ufc_data", columns=columns)
+
+    assert list(read_df.columns) == columns
+
+
+@pytest.mark.parametrize("name", ["csv", "parquet"])
+def test_missing_file_raises(tmp_path, name):
+    with pytest.raises(FileNotFoundError):
+        get_storage(name).read(tmp_path / "missing")
+
+
+def test_unknown_backend_raises():
+    with pytest.raises(ValueError):
+        get_storage("feather")
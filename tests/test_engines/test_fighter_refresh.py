@@ -0,0 +1,85 @@
+import asyncio
+
+from aiohttp import web
+
+from src.config import PathSettings
+from src.lib.data_managers import FighterProfileCache, ProfileRefresh
+from src.lib.engines import ScrapingEngine
+from src.lib.networking import SessionManager
+from src.lib.scrapers import ParsingPool
+
+PROFILE = PathSettings.TEST_FIGHTER_PROFILE.read_text()
+ETAG = '"v1"'
+
+
+async def _serve_profiles(requests):
+    async def handler(request):
+        fighter = request.match_info["fighter"]
+        requests.append(fighter)
+        if fighter == "etag":
+            if request.headers.get("If-None-Match") == ETAG:
+                return web.Response(status=304, headers={"ETag": ETAG})
+            return web.Response(text=PROFILE, headers={"ETag": ETAG})
+        if fighter == "changed" and len(requests) > 3:
+            # Record changes after the first crawl.
+            return web.Response(text=PROFILE.replace("24-2-0", "25-2-0"))
+        return web.Response(text=PROFILE)
+
+    app = web.Application()
+    app.router.add_get("/fighter-details/{fighter}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    return runner
+
+
+def test_refresh_only_reparses_changed_profiles():
+    requests = []
+    engine = ScrapingEngine(
+        fighter_cache=FighterProfileCache(ttl=None),
+        parsing_pool=ParsingPool(max_workers=0),
+    )
+
+    async def crawl_then_refresh():
+        runner = await _serve_profiles(requests)
+        host, port = runner.addresses[0][:2]
+        urls = [
+            f"http://{host}:{port}/fighter-details/{fighter}"
+            for fighter in ("etag", "same", "changed")
+        ]
+        try:
+            async with SessionManager() as session:
+                for url in urls:
+                    await engine._get_fighter_profile(url, True, session)
+                counts = await engine.refresh_fighter_profiles(session)
+                return urls, counts, session.metrics.not_modified
+        finally:
+            await runner.cleanup()
+
+    urls, counts, not_modified = asyncio.run(crawl_then_refresh())
+
+    assert counts == {
+        ProfileRefresh.NOT_MODIFIED: 1,
+        ProfileRefresh.UNCHANGED: 1,
+        ProfileRefresh.UPDATED: 1,
+        ProfileRefresh.FAILED: 0,
+    }
+    assert not_modified == 1
+    assert engine.fighter_cache.validators(urls[0])["etag"] == ETAG
+    assert engine.fighter_cache.get(urls[1])["record"] == " 24-2-0"
+    assert engine.fighter_cache.get(urls[2])["record"] == " 25-2-0"
+
+
+def test_validators_are_persisted(tmp_path):
+    csv_path = tmp_path / "fighter_profile_cache.csv"
+    cache = FighterProfileCache(csv_path, ttl=None)
+    cache.put("fighter-a", {"record": " 24-2-0"})
+    cache.set_validators("fighter-a", {"etag": ETAG, "content_hash": "abc"})
+    cache.put("fighter-b", {"record": " 1-0-0"})
+    cache.write()
+
+    reloaded = FighterProfileCache(csv_path, ttl=None)
+
+    assert reloaded.validators("fighter-a") == {"etag": ETAG, "content_hash": "abc"}
+    assert reloaded.validators("fighter-b") == {}
+    assert reloaded.get("fighter-a") == {"record": " 24-2-0"}
@@ -0,0 +1,83 @@
+import json
+
+import pandas as pd
+
+from src.config import PathSettings
+from src.lib.engines import IncrementalDataCleaningEngine
+from src.lib.preprocessing.cleaners import (
+    CoreCleaner,
+    DateCleaner,
+    FighterCleaner,
+    HeightReachCleaner,
+    StatsCleaner,
+)
+
+CLEANERS = [CoreCleaner, FighterCleaner, DateCleaner, HeightReachCleaner, StatsCleaner]
+
+# The newest cards are at the top of the raw data. Older bouts are more often missing
+# a height or reach, which get filled from the weight class averages.
+RAW_DF = pd.read_csv(PathSettings.RAW_DATA_CSV, skiprows=range(1, 3501), nrows=300)
+NEW_BOUTS = 40
+
+
+def _clean(raw_df, directory):
+    raw_path = directory / "raw.csv"
+    raw_df.to_csv(raw_path, index=False)
+    engine = IncrementalDataCleaningEngine(
+        raw_path,
+        clean_path=directory / "clean.csv",
+        state_path=directory / "state.json",
+    )
+    engine.clean_raw_data(CLEANERS)
+    return pd.read_csv(directory / "clean.csv")
+
+
+def test_incremental_clean_matches_full_clean(tmp_path):
+    incremental_dir = tmp_path / "incremental"
+    full_dir = tmp_path / "full"
+    incremental_dir.mkdir()
+    full_dir.mkdir()
+
+    _clean(RAW_DF.iloc[NEW_BOUTS:], incremental_dir)
+    incremental_df = _clean(RAW_DF, incremental_dir)
+    full_df = _clean(RAW_DF, full_dir)
+
+    # The new bouts change the weight class averages used for earlier missing measurements.
+    state = json.loads((incremental_dir / "state.json").read_text())
+    assert any(state["cleaners"]["HeightReachCleaner"]["imputed"].values())
+
+    pd.testing.assert_frame_equal(incremental_df, full_df)
+    assert len(state["processed"]) == len(RAW_DF)
+
+
+def test_no_new_bouts_leaves_clean_data_untouched(tmp_path):
+    _clean(RAW_DF, tmp_path)
+    modified = (tmp_path / "clean.csv").stat().st_mtime_ns
+
+    _clean(RAW_DF, tmp_path)
+
+    assert (tmp_path / "clean.csv").stat().st_mtime_ns == modified
+
+
+def test_removed_bouts_trigger_full_clean(tmp_path):
+    _clean(RAW_DF, tmp_path)
+    clean_df = _clean(RAW_DF.iloc[NEW_BOUTS:], tmp_path)
+
+    full_dir = tmp_path / "full"
+    full_dir.mkdir()
+    pd.testing.assert_frame_equal(clean_df, _clean(RAW_DF.iloc[NEW_BOUTS:], full_dir))
+
+
+def test_card_appended_again_is_cleaned_once(tmp_path):
+    _clean(RAW_DF.iloc[NEW_BOUTS:], tmp_path)
+    # A new card, and a card already cleaned appended again.
+    raw_df = pd.concat(
+        [RAW_DF.iloc[NEW_BOUTS:], RAW_DF.iloc[:NEW_BOUTS], RAW_DF.iloc[-10:]],
+        ignore_index=True,
+    )
+    clean_df = _clean(raw_df, tmp_path)
+
+    full_dir = tmp_path / "full"
+    full_dir.mkdir()
+    pd.testing.assert_frame_equal(clean_df, _clean(raw_df, full_dir))
+    assert len(clean_df) == len(_clean(RAW_DF, full_dir))
@@ -0,0 +1,167 @@
+import time
+from pathlib import Path
+
+from src.lib.jobs.dag import DAGStage, PipelineDAG, StageResult
+
+
+def _fetch(params):
+    # Like a scraper, rewrites its output every time, here with the same contents.
+    directory = Path(params["dir"])
+    (directory / "raw.txt").write_text((directory / "site.txt").read_text())
+    (directory / "fighters.txt").write_text("fighters")
+
+
+def _clean(params):
+    directory = Path(params["dir"])
+    (directory / "clean.txt").write_text((directory / "raw.txt").read_text().upper())
+
+
+def _next_event(params):
+    directory = Path(params["dir"])
+    start = time.time()
+    time.sleep(0.3)
+    (directory / "next_event.txt").write_text("next")
+    (directory / "next_event.times").write_text(f"{start} {time.time()}")
+
+
+def _features(params):
+    directory = Path(params["dir"])
+    (directory / "features.txt").write_text((directory / "clean.txt").read_text())
+    (directory / "next_event_features.txt").write_text(
+        (directory / "next_event.txt").read_text() + " averaged"
+    )
+
+
+def _features_in_place(params):
+    directory = Path(params["dir"])
+    (directory / "features.txt").write_text((directory / "clean.txt").read_text())
+    # Rewrites one of its own inputs.
+    next_event = directory / "next_event.txt"
+    next_event.write_text(next_event.read_text() + " averaged")
+
+
+def _slow_clean(params):
+    directory = Path(params["dir"])
+    start = time.time()
+    time.sleep(0.3)
+    _clean(params)
+    (directory / "clean.times").write_text(f"{start} {time.time()}")
+
+
+def _fail(params):
+    raise ValueError("bad data")
+
+
+def _stages(directory, clean=_clean, in_place=False):
+    return [
+        DAGStage(
+            "fetch",
+            _fetch,
+            outputs=[directory / "raw.txt", directory / "fighters.txt"],
+            cacheable=False,
+        ),
+        DAGStage(
+            "next_event",
+            _next_event,
+            inputs=[directory / "fighters.txt"],
+            outputs=[directory / "next_event.txt"],
+            cacheable=False,
+        ),
+        DAGStage(
+            "clean",
+            clean,
+            inputs=[directory / "raw.txt"],
+            outputs=[directory / "clean.txt"],
+        ),
+        DAGStage(
+            "features",
+            _features_in_place if in_place else _features,
+            inputs=[directory / "clean.txt", directory / "next_event.txt"],
+            outputs=[
+                directory / "features.txt",
+                directory
+                / ("next_event.txt" if in_place else "next_event_features.txt"),
+            ],
+        ),
+    ]
+
+
+def _run(directory, dag_stages, **kwargs):
+    dag = PipelineDAG(dag_stages, directory / "state.json")
+    report = dag.run({"dir": str(directory)}, **kwargs)
+    return {result["stage"]: result for result in report}
+
+
+def test_dependencies_come_from_the_files(tmp_path):
+    dag = PipelineDAG(_stages(tmp_path), tmp_path / "state.json")
+
+    assert dag.dependencies == {
+        "fetch": set(),
+        "next_event": {"fetch"},
+        "clean": {"fetch"},
+        "features": {"clean", "next_event"},
+    }
+
+
+def test_up_to_date_stages_are_skipped(tmp_path):
+    (tmp_path / "site.txt").write_text("bouts")
+
+    first = _run(tmp_path, _stages(tmp_path))
+    assert {result["status"] for result in first.values()} == {StageResult.RAN}
+    assert first["clean"]["reason"] == "never run"
+    assert (tmp_path / "features.txt").read_text() == "BOUTS"
+
+    # The scrapers run again but write what they wrote last time, so nothing after them runs.
+    second = _run(tmp_path, _stages(tmp_path))
+    assert second["fetch"]["status"] == StageResult.RAN
+    assert second["next_event"]["status"] == StageResult.RAN
+    assert second["clean"]["status"] == StageResult.SKIPPED
+    assert second["features"]["status"] == StageResult.SKIPPED
+    assert (tmp_path / "next_event_features.txt").read_text() == "next averaged"
+
+    (tmp_path / "site.txt").write_text("more bouts")
+    third = _run(tmp_path, _stages(tmp_path))
+    assert third["clean"]["reason"] == "inputs changed: raw.txt"
+    assert (tmp_path / "features.txt").read_text() == "MORE BOUTS"
+
+    (tmp_path / "clean.txt").unlink()
+    rerun = _run(tmp_path, _stages(tmp_path)[2:])
+    assert rerun["clean"]["reason"] == "outputs missing: clean.txt"
+
+
+def test_stage_rewriting_its_input_is_skipped(tmp_path):
+    (tmp_path / "site.txt").write_text("bouts")
+    _run(tmp_path, _stages(tmp_path, in_place=True))
+
+    # Without the scrapers every stage is up to date, features' own rewrite included.
+    report = _run(tmp_path, _stages(tmp_path, in_place=True)[2:])
+
+    assert report["clean"]["status"] == StageResult.SKIPPED
+    assert report["features"]["status"] == StageResult.SKIPPED
+    assert _run(tmp_path, _stages(tmp_path)[2:], force=True)["clean"]["reason"] == (
+        "forced"
+    )
+
+
+def test_independent_stages_run_in_parallel(tmp_path):
+    (tmp_path / "site.txt").write_text("bouts")
+
+    _run(tmp_path, _stages(tmp_path, clean=_slow_clean))
+
+    clean_start, clean_end = map(float, (tmp_path / "clean.times").read_text().split())
+    next_start, next_end = map(
+        float, (tmp_path / "next_event.times").read_text().split()
+    )
+    assert clean_start < next_end and next_start < clean_end
+
+
+def test_failed_stage_blocks_its_dependents_and_runs_again(tmp_path):
+    (tmp_path / "site.txt").write_text("bouts")
+
+    report = _run(tmp_path, _stages(tmp_path, clean=_fail))
+
+    assert report["clean"]["status"] == StageResult.FAILED
+    assert report["clean"]["error"] == "ValueError: bad data"
+    assert report["next_event"]["status"] == StageResult.RAN
+    assert report["features"]["status"] == StageResult.BLOCKED
+    assert _run(tmp_path, _stages(tmp_path))["clean"]["reason"] == "never run"
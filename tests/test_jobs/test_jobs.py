@@ -0,0 +1,100 @@
+import os
+
+import pytest
+
+from src.lib.jobs import JobQueue, JobRunner, JobStatus, StageStatus, run_job
+
+
+def _write_marker(params):
+    with open(params["path"], "a") as f:
+        f.write("ran\n")
+
+
+def _fail(params):
+    raise RuntimeError("stage failed")
+
+
+def _exit(params):
+    os._exit(3)
+
+
+KINDS = {
+    "clean_data": [("first", _write_marker), ("second", _write_marker)],
+    "train": [("first", _write_marker), ("broken", _fail), ("never", _write_marker)],
+    "pipeline": [("crash", _exit)],
+}
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(tmp_path / "jobs.sqlite3", KINDS)
+
+
+def test_jobs_are_claimed_in_order_and_waiting_duplicates_coalesced(queue):
+    first = queue.enqueue("clean_data", {"full": False})
+    second = queue.enqueue("train")
+
+    assert queue.enqueue("clean_data", {"full": False}) == first
+    assert queue.enqueue("clean_data", {"full": True}) != first
+    assert queue.claim()["id"] == first
+    # Once it's running the same job can be queued again.
+    assert queue.enqueue("clean_data", {"full": False}) != first
+    assert queue.claim()["id"] == second
+    with pytest.raises(ValueError):
+        queue.enqueue("scrape_past_events")
+
+
+def test_run_job_records_stages(queue, tmp_path):
+    marker = tmp_path / "marker.txt"
+    job_id = queue.enqueue("clean_data", {"path": str(marker)})
+    queue.claim()
+
+    run_job(queue.db_path, job_id, KINDS)
+
+    job = queue.get(job_id)
+    assert job["status"] == JobStatus.SUCCEEDED
+    assert job["progress"] == "2/2"
+    assert [stage["status"] for stage in job["stages"]] == [StageStatus.DONE] * 2
+    assert all(stage["seconds"] is not None for stage in job["stages"])
+    assert marker.read_text() == "ran\nran\n"
+
+
+def test_failed_stage_stops_the_job(queue, tmp_path):
+    marker = tmp_path / "marker.txt"
+    job_id = queue.enqueue("train", {"path": str(marker)})
+    queue.claim()
+
+    run_job(queue.db_path, job_id, KINDS)
+
+    job = queue.get(job_id)
+    assert job["status"] == JobStatus.FAILED
+    assert job["error"] == "RuntimeError: stage failed"
+    assert job["progress"] == "1/3"
+    assert [stage["status"] for stage in job["stages"]] == [
+        StageStatus.DONE,
+        StageStatus.FAILED,
+        StageStatus.PENDING,
+    ]
+    assert marker.read_text() == "ran\n"
+
+
+def test_runner_runs_jobs_in_worker_processes(queue, tmp_path):
+    marker = tmp_path / "marker.txt"
+    succeeded = queue.enqueue("clean_data", {"path": str(marker)})
+    crashed = queue.enqueue("pipeline")
+
+    JobRunner(queue, max_jobs=2, poll_interval=0.01).run(until_empty=True)
+
+    assert queue.get(succeeded)["status"] == JobStatus.SUCCEEDED
+    assert queue.get(succeeded)["error"] is None
+    assert queue.get(crashed)["status"] == JobStatus.FAILED
+    assert queue.get(crashed)["error"] == "Worker process exited with code 3"
+    assert marker.read_text() == "ran\nran\n"
+
+
+def test_interrupted_jobs_are_failed(queue):
+    job_id = queue.enqueue("train")
+    queue.claim()
+
+    assert queue.fail_interrupted() == [job_id]
+    assert queue.get(job_id)["status"] == JobStatus.FAILED
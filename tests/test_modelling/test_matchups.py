@@ -0,0 +1,162 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+
+from src.lib.constants.columns import INFERENCE_COLUMNS
+from src.lib.exceptions import UnknownFighterException
+from src.lib.modelling import FeatureEncoders, MatchupPredictor
+from src.lib.modelling.forest import ForestArrays
+
+FEATURES = [str(column) for column in INFERENCE_COLUMNS]
+STANCES = ["Orthodox", "Southpaw", "Switch"]
+WEIGHT_CLASSES = ["Lightweight", "Welterweight"]
+
+
+def _training_df(n_bouts=60, seed=0):
+    rng = np.random.default_rng(seed)
+    fighters = [f"Fighter {i}" for i in range(10)]
+    df = pd.DataFrame(
+        {
+            "date": pd.date_range("2020-01-01", periods=n_bouts, freq="W"),
+            "weight_class": rng.choice(WEIGHT_CLASSES, n_bouts),
+            "title_bout": rng.choice(["N", "Y"], n_bouts),
+            "winner": rng.choice(["W", "L"], n_bouts),
+            "red_fighter": rng.choice(fighters[:5], n_bouts),
+            "blue_fighter": rng.choice(fighters[5:], n_bouts),
+        }
+    )
+    for corner in ("red", "blue"):
+        df[f"{corner}_stance"] = rng.choice(STANCES, n_bouts)
+        df[f"{corner}_dob"] = "1990-06-15"
+        for column in ["height", "reach"]:
+            df[f"{corner}_{column}"] = rng.uniform(160, 200, n_bouts).round()
+        for column in ["wins", "losses"]:
+            df[f"{corner}_{column}"] = rng.integers(0, 20, n_bouts)
+        for stat in MatchupPredictor.AVERAGED_STATS:
+            df[f"{corner}_{stat}"] = rng.uniform(0, 1, n_bouts)
+            # The pre-fight averages the model is trained on.
+            df[f"{corner}_{stat.replace('percent', 'average')}"] = rng.uniform(
+                0, 1, n_bouts
+            )
+    df["red_age"] = rng.integers(20, 40, n_bouts)
+    df["blue_age"] = rng.integers(20, 40, n_bouts)
+    df["height_diff"] = df["red_height"] - df["blue_height"]
+    df["reach_diff"] = df["red_reach"] - df["blue_reach"]
+    return df
+
+
+def _predictor(training_df):
+    encoders = FeatureEncoders.fit(training_df)
+    model = RandomForestClassifier(n_estimators=20, max_depth=4, random_state=0)
+    model.fit(
+        encoders.transform(training_df[FEATURES]),
+        encoders.encode_outcome(training_df["winner"]),
+    )
+    states = MatchupPredictor.fighter_states(
+        training_df[MatchupPredictor.TRAINING_COLUMNS]
+    )
+    return MatchupPredictor(model, encoders, states)
+
+
+def test_forest_arrays_match_sklearn():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(300, 6))
+    X[rng.uniform(size=X.shape) < 0.05] = np.nan
+    model = RandomForestClassifier(n_estimators=25, max_depth=6, random_state=0)
+    model.fit(X, rng.integers(0, 3, len(X)))
+
+    np.testing.assert_allclose(
+        ForestArrays(model).predict_proba(X), model.predict_proba(X)
+    )
+
+
+def test_fighter_states_are_latest_bout_and_averages():
+    training_df = _training_df()
+    states = MatchupPredictor.fighter_states(
+        training_df[MatchupPredictor.TRAINING_COLUMNS]
+    )
+
+    fighter = training_df["red_fighter"].iloc[-1]
+    latest = training_df[training_df["red_fighter"] == fighter].iloc[-1]
+    assert states.loc[fighter, "weight_class"] == latest["weight_class"]
+    assert states.loc[fighter, "wins"] == latest["red_wins"]
+    assert states.loc[fighter, "stance"] == latest["red_stance"]
+    assert states.loc[fighter, "td_average"] == pytest.approx(
+        training_df.loc[training_df["red_fighter"] == fighter, "red_td_percent"].mean()
+    )
+
+
+def test_predictions_match_model_on_assembled_features():
+    training_df = _training_df()
+    predictor = _predictor(training_df)
+    states = predictor.fighter_states
+    matchups = pd.DataFrame(
+        {
+            "red_fighter": ["Fighter 0", "Fighter 1", "Fighter 7"],
+            "blue_fighter": ["Fighter 5", "Fighter 6", "Fighter 2"],
+            "title_bout": ["Y", None, "N"],
+            "date": ["2025-03-01"] * 3,
+        }
+    )
+
+    red = states.loc[matchups["red_fighter"]].reset_index(drop=True)
+    blue = states.loc[matchups["blue_fighter"]].reset_index(drop=True)
+    features = pd.DataFrame(
+        {
+            "weight_class": red["weight_class"],
+            "title_bout": matchups["title_bout"].fillna("N"),
+            "height_diff": red["height"] - blue["height"],
+            "reach_diff": red["reach"] - blue["reach"],
+            # Born 1990-06-15, so 34 on 2025-03-01.
+            "red_age": 34,
+            "blue_age": 34,
+        }
+    )
+    for corner, corner_states in (("red", red), ("blue", blue)):
+        for column in MatchupPredictor.CORNER_FEATURES:
+            features[f"{corner}_{column}"] = corner_states[column]
+    expected = predictor.model.predict_proba(
+        predictor.encoders.transform(features[FEATURES])
+    )[:, 1]
+
+    predictions = predictor.predict(matchups)
+
+    np.testing.assert_allclose(predictions["red_win_probability"], expected)
+    assert predictions["predicted_winner"].tolist() == [
+        red_fighter if probability > 0.5 else blue_fighter
+        for red_fighter, blue_fighter, probability in zip(
+            matchups["red_fighter"], matchups["blue_fighter"], expected
+        )
+    ]
+
+
+def test_stances_encoded_the_same_in_both_corners():
+    encoders = FeatureEncoders.fit(_training_df())
+    df = pd.DataFrame(
+        {
+            "weight_class": ["Lightweight"] * 3,
+            "title_bout": ["N"] * 3,
+            "red_stance": STANCES,
+            "blue_stance": STANCES,
+        }
+    )
+
+    encoded = encoders.transform(df)
+
+    assert encoded["red_stance"].tolist() == encoded["blue_stance"].tolist()
+    assert encoders.encode("stance", ["Open Stance"]).tolist() == [-1]
+
+
+def test_unknown_fighters_raise():
+    predictor = _predictor(_training_df())
+    matchups = pd.DataFrame(
+        {
+            "red_fighter": ["Fighter 0", "Nobody"],
+            "blue_fighter": ["Someone", "Fighter 5"],
+        }
+    )
+
+    with pytest.raises(UnknownFighterException) as exc:
+        predictor.predict(matchups)
+    assert sorted(exc.value.fighters) == ["Nobody", "Someone"]
@@ -0,0 +1,149 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from joblib import dump
+from sklearn.ensemble import RandomForestClassifier
+
+from src.lib.constants.columns import INFERENCE_COLUMNS
+from src.lib.exceptions import ModelNotTrainedException, NoNextEventException
+from src.lib.modelling import FeatureEncoders, Inference, ModelRegistry
+from src.lib.modelling import registry as registry_module
+
+FEATURES = [str(column) for column in INFERENCE_COLUMNS]
+CATEGORIES = {
+    "weight_class": ["Lightweight", "Welterweight"],
+    "title_bout": ["N", "Y"],
+    "red_stance": ["Orthodox", "Southpaw"],
+    "blue_stance": ["Orthodox", "Southpaw"],
+}
+
+
+def _features(n_rows, rng):
+    features = pd.DataFrame(
+        rng.uniform(0, 1, (n_rows, len(FEATURES))), columns=FEATURES
+    )
+    for column, values in CATEGORIES.items():
+        features[column] = rng.choice(values, n_rows)
+    return features
+
+
+def _write_model(path, seed=0):
+    rng = np.random.default_rng(seed)
+    features = _features(200, rng)
+    features["winner"] = rng.choice(["W", "L"], len(features))
+    encoders = FeatureEncoders.fit(features)
+    encoders.save(path.with_name("encoders.joblib"))
+    model = RandomForestClassifier(n_estimators=5, max_depth=3, random_state=seed)
+    model.fit(
+        encoders.transform(features[FEATURES]),
+        encoders.encode_outcome(features["winner"]),
+    )
+    dump(model, path)
+
+
+def _registry(tmp_path):
+    return ModelRegistry(
+        tmp_path / "model.joblib",
+        tmp_path / "next_event.csv",
+        encoders_path=tmp_path / "encoders.joblib",
+    )
+
+
+def _write_card(path, n_bouts=4, seed=0):
+    rng = np.random.default_rng(seed)
+    card = _features(n_bouts, rng)
+    card.insert(0, "red_fighter", [f"Red {i}" for i in range(n_bouts)])
+    card.insert(1, "blue_fighter", [f"Blue {i}" for i in range(n_bouts)])
+    card.to_csv(path, index=False)
+
+
+def _bump_mtime(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _count_loads(monkeypatch):
+    loads = []
+    load = registry_module.load
+
+    def counting_load(*args, **kwargs):
+        loads.append(args)
+        return load(*args, **kwargs)
+
+    monkeypatch.setattr(registry_module, "load", counting_load)
+    return loads
+
+
+def test_predictions_loaded_once_and_match_inference(tmp_path, monkeypatch):
+    _write_model(tmp_path / "model.joblib")
+    _write_card(tmp_path / "next_event.csv")
+    loads = _count_loads(monkeypatch)
+    registry = _registry(tmp_path)
+
+    predictions = registry.predictions()
+
+    assert registry.predictions() is predictions
+    assert len(loads) == 1
+    assert predictions == (
+        Inference(
+            tmp_path / "model.joblib",
+            tmp_path / "next_event.csv",
+            encoders=tmp_path / "encoders.joblib",
+        ).predict()
+    )
+
+
+def test_changed_files_are_reloaded(tmp_path, monkeypatch):
+    _write_model(tmp_path / "model.joblib")
+    _write_card(tmp_path / "next_event.csv")
+    loads = _count_loads(monkeypatch)
+    registry = _registry(tmp_path)
+    registry.predictions()
+
+    _write_card(tmp_path / "next_event.csv", n_bouts=6, seed=1)
+    _bump_mtime(tmp_path / "next_event.csv")
+    assert len(registry.predictions()) == 6
+    assert len(loads) == 1
+
+    _write_model(tmp_path / "model.joblib", seed=1)
+    _bump_mtime(tmp_path / "model.joblib")
+    model = registry.model()
+    assert len(loads) == 2
+    assert registry.predictions() == (
+        Inference(
+            model, tmp_path / "next_event.csv", encoders=tmp_path / "encoders.joblib"
+        ).predict()
+    )
+
+
+def test_model_saved_without_encoders_must_be_retrained(tmp_path):
+    _write_model(tmp_path / "model.joblib")
+    _write_card(tmp_path / "next_event.csv")
+    # Models trained before the encoders were saved alongside them.
+    (tmp_path / "encoders.joblib").unlink()
+    registry = _registry(tmp_path)
+
+    with pytest.raises(ModelNotTrainedException, match="encoders.joblib is missing"):
+        registry.predictions()
+    with pytest.raises(ModelNotTrainedException):
+        Inference(
+            tmp_path / "model.joblib",
+            tmp_path / "next_event.csv",
+            encoders=tmp_path / "encoders.joblib",
+        )
+
+    _write_model(tmp_path / "model.joblib")
+    assert len(registry.predictions()) == 4
+
+
+def test_no_next_card_has_no_predictions(tmp_path):
+    _write_model(tmp_path / "model.joblib")
+    registry = _registry(tmp_path)
+
+    with pytest.raises(NoNextEventException, match="next_event.csv is missing"):
+        registry.predictions()
+
+    _write_card(tmp_path / "next_event.csv")
+    assert len(registry.predictions()) == 4
@@ -0,0 +1,70 @@
+import asyncio
+import time
+
+from aiohttp import web
+
+from src.lib.networking import AdaptiveRateLimiter, SessionManager, TokenBucket
+
+URL = "http://www.ufcstats.com/statistics/events/completed"
+
+
+def test_token_bucket_shapes_request_rate():
+    bucket = TokenBucket(rate=100, capacity=1)
+
+    async def take(n):
+        for _ in range(n):
+            await bucket.acquire()
+
+    start = time.perf_counter()
+    asyncio.run(take(21))
+
+    # First token is available straight away, the other 20 arrive at 100/s.
+    assert time.perf_counter() - start >= 0.19
+
+
+def test_rate_is_cut_once_per_throttle_burst_and_recovers():
+    limiter = AdaptiveRateLimiter(
+        requests_per_second=10,
+        min_requests_per_second=1,
+        max_requests_per_second=12,
+        backoff_factor=0.5,
+        recovery_step=1,
+        throttle_cooldown=60,
+    )
+
+    for _ in range(5):
+        limiter.record_throttle(URL)
+    assert limiter.rate(URL) == 5
+
+    for _ in range(10):
+        limiter.record_success(URL)
+    assert limiter.rate(URL) == 12
+
+
+def test_throttled_requests_are_retried():
+    responses = [web.Response(status=429, headers={"Retry-After": "0"})]
+
+    async def handler(request):
+        if responses:
+            return responses.pop()
+        return web.Response(text="ok")
+
+    async def fetch():
+        app = web.Application()
+        app.router.add_get("/", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        host, port = runner.addresses[0][:2]
+        try:
+            async with SessionManager() as session:
+                html = await session.get_text(f"http://{host}:{port}/")
+                return html, session
+        finally:
+            await runner.cleanup()
+
+    html, session = asyncio.run(fetch())
+
+    assert html == "ok"
+    assert session.metrics.throttled == 1
+    assert session.metrics.retries == 1
@@ -0,0 +1,43 @@
+import asyncio
+
+from aiohttp import web
+
+from src.lib.networking import SessionManager
+
+
+async def _serve(handler) -> web.AppRunner:
+    app = web.Application()
+    app.router.add_get("/{page}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    return runner
+
+
+def test_requests_in_flight_stay_within_budget():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return web.Response(text=request.match_info["page"])
+
+    async def scrape():
+        runner = await _serve(handler)
+        host, port = runner.addresses[0][:2]
+        try:
+            async with SessionManager(max_concurrent_requests=3) as session:
+                return await asyncio.gather(
+                    *(session.get_text(f"http://{host}:{port}/{i}") for i in range(20))
+                )
+        finally:
+            await runner.cleanup()
+
+    pages = asyncio.run(scrape())
+
+    assert pages == [str(i) for i in range(20)]
+    assert peak <= 3
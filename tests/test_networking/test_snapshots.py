@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from src.config import PathSettings
+from src.lib.exceptions import ScrapingException
+from src.lib.networking import SessionManager, SnapshotStore
+from src.lib.scrapers import FighterScraper
+
+from .test_session import _serve
+
+
+def test_recorded_pages_are_replayed_without_the_network(tmp_path):
+    store = SnapshotStore(tmp_path / "snapshots")
+
+    async def handler(request):
+        # Every page but the first has the same body.
+        page = request.match_info["page"]
+        return web.Response(text="first" if page == "0" else "same")
+
+    async def record():
+        runner = await _serve(handler)
+        host, port = runner.addresses[0][:2]
+        try:
+            async with SessionManager(
+                snapshot_mode="record", snapshot_store=store
+            ) as session:
+                urls = [f"http://{host}:{port}/{i}" for i in range(3)]
+                pages = [await session.get_text(url) for url in urls]
+                pages.append(await session.get_text(urls[0], params={"page": 2}))
+                return urls, pages
+        finally:
+            await runner.cleanup()
+
+    urls, recorded = asyncio.run(record())
+
+    # Identical bodies are only stored once.
+    assert len(store) == 4
+    assert len(list(store.objects_dir.glob("*/*.html.gz"))) == 2
+
+    async def replay():
+        # The server is gone, so any request would fail.
+        async with SessionManager(
+            snapshot_mode="replay", snapshot_store=SnapshotStore(store.root)
+        ) as session:
+            pages = [await session.get_text(url) for url in urls]
+            pages.append(await session.get_text(urls[0], params={"page": 2}))
+            with pytest.raises(ScrapingException):
+                await session.get_text(urls[0], params={"page": 3})
+            return pages, session.metrics
+
+    replayed, metrics = asyncio.run(replay())
+
+    assert replayed == recorded
+    assert metrics.replayed == 4
+    assert metrics.failed == 1
+
+
+def test_scraper_parses_a_replayed_page(tmp_path):
+    url = "http://www.ufcstats.com/fighter-details/test"
+    store = SnapshotStore(tmp_path / "snapshots")
+    store.put(url, PathSettings.TEST_FIGHTER_PROFILE.read_text())
+
+    async def scrape():
+        async with SessionManager(
+            snapshot_mode="replay", snapshot_store=store
+        ) as session:
+            return await FighterScraper(
+                url, red_corner=True, session=session
+            ).scrape_url()
+
+    profile = asyncio.run(scrape())
+
+    assert profile["red_record"] == " 24-2-0"
@@ -0,0 +1,29 @@
+import pandas as pd
+
+from src.lib.preprocessing.cleaners import DateCleaner
+
+
+def _bouts():
+    return pd.DataFrame(
+        {
+            "date": ["March 09, 2024", "March 09, 2024", "July 01, 2023"],
+            "red_dob": ["Oct 24, 1994", "--", "Jul 01, 1993"],
+            "blue_dob": ["Apr 16, 1990", "Jan 14, 1994", "Jan 01, 1993"],
+        }
+    )
+
+
+def test_dates_parsed_and_missing_dobs_dropped():
+    df = DateCleaner(_bouts()).clean()
+
+    assert df.index.tolist() == [0, 2]
+    assert df.loc[0, "date"] == pd.Timestamp("2024-03-09")
+    assert df.loc[2, "red_dob"] == pd.Timestamp("1993-07-01")
+
+
+def test_ages_rounded_to_nearest_year():
+    df = DateCleaner(_bouts()).clean()
+
+    assert df["red_age"].tolist() == [29, 30]
+    assert df["blue_age"].tolist() == [34, 30]
+    assert df["red_age"].dtype == "int64"
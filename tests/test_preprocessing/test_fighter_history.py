@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+from src.lib.preprocessing.feature_engineering.fighter import FighterHistory
+
+
+def _bouts():
+    # Newest first, as in the data. A fights B, C then B again, switching corners.
+    return pd.DataFrame(
+        {
+            "date": pd.to_datetime(["2024-03-01", "2024-02-01", "2024-01-01"]),
+            "red_fighter": ["B", "A", "A"],
+            "blue_fighter": ["A", "C", "B"],
+            "red_td_percent": [0.9, 0.2, 0.4],
+            "blue_td_percent": [0.6, 0.1, 0.3],
+        }
+    )
+
+
+def test_long_format_is_chronological_per_fighter():
+    history = FighterHistory(_bouts(), ["td_percent"])
+    a_bouts = history.long_df[history.long_df["fighter"] == "A"]
+
+    assert a_bouts["bout"].tolist() == [2, 1, 0]
+    assert a_bouts["corner"].tolist() == ["red", "red", "blue"]
+    assert a_bouts["td_percent"].tolist() == [0.4, 0.2, 0.6]
+    assert a_bouts["position"].tolist() == [0, 1, 2]
+    assert (a_bouts["n_bouts"] == 3).all()
+
+
+def test_pre_fight_averages_scattered_back_to_corners():
+    history = FighterHistory(_bouts(), ["td_percent"])
+
+    corners = history.to_corners(history.pre_fight_averages())
+
+    assert corners.columns.tolist() == ["red_td_percent", "blue_td_percent"]
+    # A's average going into each bout covers only their earlier bouts.
+    assert np.isnan(corners.loc[2, "red_td_percent"])
+    assert corners.loc[1, "red_td_percent"] == 0.4
+    assert corners.loc[0, "blue_td_percent"] == (0.4 + 0.2) / 2
+    # B's second bout, C's only bout.
+    assert corners.loc[0, "red_td_percent"] == 0.3
+    assert np.isnan(corners.loc[1, "blue_td_percent"])
+
+
+def test_first_bouts_only_for_fighters_with_more_than_one_bout():
+    history = FighterHistory(_bouts(), ["td_percent"])
+    first = history.long_df[history.first_bouts()]
+
+    assert sorted(zip(first["fighter"], first["bout"])) == [("A", 2), ("B", 2)]
+
+
+def test_regression_df_from_third_bout():
+    regression_df = FighterHistory(_bouts(), ["td_percent"]).regression_df()
+
+    # Only A has three bouts, X is the average going into the third, Y into the second.
+    assert regression_df.to_dict("list") == {
+        "X_td_percent": [(0.4 + 0.2) / 2],
+        "Y_td_percent": [0.4],
+    }
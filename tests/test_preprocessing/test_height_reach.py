@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+from src.lib.preprocessing.cleaners import HeightReachCleaner
+
+
+def _bouts():
+    return pd.DataFrame(
+        {
+            "date": pd.to_datetime(["2024-01-01"] * 4),
+            "weight_class": [
+                "Lightweight",
+                "Lightweight",
+                "Lightweight",
+                "Heavyweight",
+            ],
+            "red_fighter": ["A", "B", "C", "D"],
+            "blue_fighter": ["E", "F", "G", "H"],
+            "red_height": ["5' 10\"", "6' 0\"", "5' 10\"", "6' 4\""],
+            "blue_height": ["5' 8\"", "--", "5' 8\"", "6' 3\""],
+            "red_reach": ['70"', '74"', '70"', '80"'],
+            "blue_reach": ['72"', '72"', "--", '78"'],
+        }
+    )
+
+
+def test_measurements_are_converted_to_cm():
+    cleaner = HeightReachCleaner(_bouts())
+
+    heights = cleaner._convert_height(pd.Series(["5' 10\"", "6'0", "--"]))
+    reaches = cleaner._convert_reach(pd.Series(['70"', "--", np.nan]))
+
+    assert heights[:2].tolist() == [178.0, 183.0]
+    assert reaches[0] == 70 * 2.54
+    assert heights[2:].isna().all() and reaches[1:].isna().all()
+
+
+def test_missing_measurements_filled_with_weight_class_average():
+    df = HeightReachCleaner(_bouts()).clean()
+
+    # Only the first lightweight bout has every measurement.
+    assert df.loc[1, "blue_height"] == 173.0
+    assert df.loc[2, "blue_reach"] == 72 * 2.54
+    assert df.loc[1, "height_diff"] == 183.0 - 173.0
+    assert (
+        not df[["red_height", "blue_height", "red_reach", "blue_reach"]]
+        .isna()
+        .any(axis=None)
+    )
@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+
+from src.config import PathSettings
+from src.lib.engines import DataCleaningEngine
+from src.lib.preprocessing.cleaners import (
+    CoreCleaner,
+    DateCleaner,
+    FighterCleaner,
+    HeightReachCleaner,
+    StatsCleaner,
+)
+from src.lib.preprocessing.feature_engineering import (
+    FeatureEngineering,
+    FighterStatsStore,
+    IncrementalFeatureEngineering,
+)
+from src.lib.preprocessing.feature_engineering.fighter import FighterHistory
+from src.lib.preprocessing.feature_engineering.regression import RegressionModelStore
+
+CLEANERS = [CoreCleaner, FighterCleaner, DateCleaner, HeightReachCleaner, StatsCleaner]
+
+# The newest cards are at the top of the data.
+CLEAN_DF, _ = DataCleaningEngine._run_cleaners(
+    pd.read_csv(PathSettings.RAW_DATA_CSV, nrows=2000), CLEANERS
+)
+NEW_BOUTS = 40
+
+
+def _engineer(clean_df, directory):
+    clean_path = directory / "clean.csv"
+    clean_df.to_csv(clean_path, index=False)
+    feature_engineering = IncrementalFeatureEngineering(
+        clean_path,
+        model_store=RegressionModelStore(directory / "models.json"),
+        training_path=directory / "training.csv",
+        stats_store_path=directory / "fighter_stats.json",
+    )
+    feature_engineering.run()
+    return feature_engineering
+
+
+def _full_run(clean_df, directory):
+    directory.mkdir()
+    clean_df.to_csv(directory / "clean.csv", index=False)
+    FeatureEngineering(
+        directory / "clean.csv",
+        allow_creation=False,
+        model_store=RegressionModelStore(directory / "models.json"),
+        training_path=directory / "training.csv",
+    ).run()
+    return pd.read_csv(directory / "training.csv")
+
+
+def test_incremental_run_matches_full_run(tmp_path):
+    _engineer(CLEAN_DF.iloc[NEW_BOUTS:], tmp_path)
+    _engineer(CLEAN_DF, tmp_path)
+
+    # Running sums and the models updated from them differ from the full run's
+    # expanding means and refitted models in the last few bits.
+    pd.testing.assert_frame_equal(
+        pd.read_csv(tmp_path / "training.csv"),
+        _full_run(CLEAN_DF, tmp_path / "full"),
+        check_exact=False,
+        rtol=1e-9,
+    )
+
+
+def test_bout_in_the_clean_data_twice_is_added_once(tmp_path):
+    _engineer(CLEAN_DF.iloc[NEW_BOUTS:], tmp_path)
+    # New bouts, and bouts already added repeated at the end.
+    clean_df = pd.concat([CLEAN_DF, CLEAN_DF.iloc[-10:]], ignore_index=True)
+    _engineer(clean_df, tmp_path)
+
+    training_df = pd.read_csv(tmp_path / "training.csv")
+    assert len(training_df) == len(CLEAN_DF)
+    pd.testing.assert_frame_equal(
+        training_df,
+        _full_run(clean_df, tmp_path / "full"),
+        check_exact=False,
+        rtol=1e-9,
+    )
+
+
+def test_store_averages_match_fighter_history(tmp_path):
+    _engineer(CLEAN_DF, tmp_path)
+    store = FighterStatsStore.load(tmp_path / "fighter_stats.json")
+
+    history = FighterHistory(pd.read_csv(tmp_path / "clean.csv"), store.stat_cols)
+    expected = history.long_df.groupby("fighter")[store.stat_cols].mean()
+    fighters = pd.Series(expected.index)
+
+    np.testing.assert_allclose(
+        store.pre_fight_averages(fighters).to_numpy(), expected.to_numpy()
+    )
+    assert store.pre_fight_averages(pd.Series(["Unknown Fighter"])).isna().all(None)
+
+
+def test_next_event_averages_keep_profile_stats_for_debutants(tmp_path):
+    feature_engineering = _engineer(CLEAN_DF, tmp_path)
+    veteran = CLEAN_DF["red_fighter"].iloc[0]
+    next_event_df = pd.DataFrame(
+        {
+            "red_fighter": [veteran],
+            "blue_fighter": ["Debuting Fighter"],
+            "red_td_average": [0.5],
+            "blue_td_average": [0.25],
+        }
+    )
+
+    updated = feature_engineering.next_event_averages(next_event_df)
+
+    veteran_bouts = FighterHistory(CLEAN_DF, ["td_percent"]).long_df.query(
+        "fighter == @veteran"
+    )
+    assert np.isclose(
+        updated.loc[0, "red_td_average"], veteran_bouts["td_percent"].mean()
+    )
+    assert updated.loc[0, "blue_td_average"] == 0.25
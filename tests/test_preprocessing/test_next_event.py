@@ -0,0 +1,58 @@
+import pandas as pd
+
+from src.lib.constants.columns import INFERENCE_COLUMNS
+from src.lib.preprocessing.cleaners import (
+    CoreCleaner,
+    DateCleaner,
+    FighterCleaner,
+    HeightReachCleaner,
+    StatsCleaner,
+)
+
+CLEANERS = [CoreCleaner, FighterCleaner, DateCleaner, HeightReachCleaner, StatsCleaner]
+
+
+def _bout(red_dob="Jul 23, 1990", **values):
+    # A bout as scrape_next_event adds it, before cleaning.
+    corners = {
+        "Striking Accuracy": ("51%", "47%"),
+        "Defense": ("58%", "55%"),
+        "Takedown Accuracy": ("40%", "35%"),
+        "Takedown Defense": ("75%", "70%"),
+        "Stance": ("Orthodox", None),
+        "DOB": (red_dob, "Mar 01, 1992"),
+        "Height": ("6' 1\"", "5' 11\""),
+        "Reach": ('76"', '74"'),
+        "record": ("20-5-0", "11-7-0 (1 NC)"),
+    }
+    bout = {
+        "date": "February 15, 2025",
+        "location": "Las Vegas, Nevada, USA",
+        "red_fighter": "Red",
+        "blue_fighter": "Blue",
+        "weight_class": "Middleweight",
+        "title_bout": "N",
+    }
+    for stat, (red, blue) in corners.items():
+        bout[f"red_{stat}"], bout[f"blue_{stat}"] = red, blue
+    return {**bout, **values}
+
+
+def test_next_card_cleans_into_the_inference_columns():
+    df = pd.DataFrame([_bout(), _bout(red_dob="--", red_fighter="Unknown")])
+    for cleaner in CLEANERS:
+        df = cleaner(df).clean_next_event()
+
+    assert set(INFERENCE_COLUMNS).issubset(df.columns)
+    assert df.loc[0, ["red_age", "blue_age"]].tolist() == [35, 33]
+    assert df.loc[
+        0, ["red_wins", "red_losses", "blue_wins", "blue_losses"]
+    ].tolist() == [
+        20,
+        5,
+        11,
+        7,
+    ]
+    assert df["blue_stance"].tolist() == ["Orthodox", "Orthodox"]
+    # Kept on the card, inference leaves out bouts with a missing value.
+    assert pd.isna(df.loc[1, "red_age"])
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+from src.lib.preprocessing.feature_engineering.regression import (
+    RegressionModel,
+    RegressionModelStore,
+)
+
+
+def _regression_df(seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(0, 1, 200)
+    return pd.DataFrame({"X_td_percent": x, "Y_td_percent": 0.1 + 0.8 * x})
+
+
+def test_batch_predictions_match_statsmodels():
+    model = RegressionModel(_regression_df(), "X_td_percent", "Y_td_percent")
+    inputs = np.array([0.0, 0.25, 0.9])
+
+    expected = [
+        model.model.get_prediction(np.array([1, x])).predicted[0] for x in inputs
+    ]
+
+    np.testing.assert_allclose(model.predict_batch(inputs), expected, rtol=1e-12)
+    assert model.predict(0.25) == model.predict_batch(inputs)[1]
+
+
+def test_store_returns_models_only_for_the_same_data(tmp_path):
+    store = RegressionModelStore(tmp_path / "models.json")
+    df = _regression_df()
+    fingerprint = store.fingerprint(df)
+    model = RegressionModel(df, "X_td_percent", "Y_td_percent")
+
+    assert store.load(fingerprint) is None
+    store.save(fingerprint, {"takedowns": model})
+
+    loaded = store.load(fingerprint)["takedowns"]
+    assert (loaded.intercept, loaded.slope) == (model.intercept, model.slope)
+    assert loaded.x_col == "X_td_percent"
+    assert store.load(store.fingerprint(_regression_df(seed=1))) is None
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+
+from src.config import PathSettings
+from src.lib.preprocessing.cleaners import CoreCleaner, StatsCleaner
+
+
+def _raw_bouts():
+    return CoreCleaner(pd.read_csv(PathSettings.RAW_DATA_CSV, nrows=1000)).clean()
+
+
+def _reference_clean(df):
+    """
+    The previous StatsCleaner, which found the "x of y" columns by their values
+    and converted each column separately.
+    """
+    attempt_landed_columns = [
+        column
+        for column in df.columns
+        if df[column].dtype == object
+        and df[column].apply(lambda x: "of" in str(x)).any()
+        and "fighter" not in column
+    ]
+    for column in attempt_landed_columns:
+        split = df[column].str.split(" of ", expand=True)
+        landed, attempted = split[0].astype(float), split[1].astype(float)
+        df[f"{column}_attempted"] = attempted
+        df[f"{column}_landed"] = landed
+        df[f"{column}_percent"] = (landed / attempted).fillna(0)
+        df.drop(columns=column, inplace=True)
+
+    for column in [column for column in df.columns if "%" in column]:
+        df[column] = df[column].str.strip("%").astype("float") / 100
+
+    for new_col, source_col in {
+        "red_sig_strike_defence_percent": "blue_sig_str_%",
+        "blue_sig_strike_defence_percent": "red_sig_str_%",
+        "red_td_defence_percent": "blue_td_%",
+        "blue_td_defence_percent": "red_td_%",
+    }.items():
+        df[new_col] = 1 - df[source_col]
+    return df
+
+
+def test_matches_previous_implementation():
+    cleaned = StatsCleaner(_raw_bouts()).clean()
+    reference = _reference_clean(_raw_bouts())
+
+    assert cleaned.columns.tolist() == reference.columns.tolist()
+    for column in reference.columns:
+        if cleaned[column].dtype in (np.int16, np.float32):
+            np.testing.assert_allclose(
+                cleaned[column], reference[column], rtol=1e-6, err_msg=column
+            )
+        else:
+            pd.testing.assert_series_equal(cleaned[column], reference[column])
+
+
+def test_compact_dtypes():
+    cleaned = StatsCleaner(_raw_bouts()).clean()
+
+    assert cleaned["red_sig_str_landed"].dtype == np.int16
+    assert cleaned["blue_td_attempted"].dtype == np.int16
+    assert cleaned["red_total_str_percent"].dtype == np.float32
+    assert cleaned["blue_td_%"].dtype == np.float32
+    assert cleaned["red_td_defence_percent"].dtype == np.float32
+
+
+def test_no_attempts_is_zero_percent():
+    df = pd.DataFrame(
+        {
+            "red_td": ["0 of 0", "2 of 4"],
+            "red_td_%": ["0", "50%"],
+            "blue_td_%": ["0"] * 2,
+        }
+    )
+
+    cleaned = StatsCleaner(df).clean()
+
+    assert cleaned["red_td_percent"].tolist() == [0.0, 0.5]
+    assert cleaned["blue_td_defence_percent"].tolist() == [1.0, 0.5]
+
+
+def test_missing_counts_are_left_as_nan():
+    df = pd.DataFrame(
+        {
+            "red_td": ["1 of 2", np.nan],
+            "red_td_%": ["50%", np.nan],
+            "blue_td_%": ["0"] * 2,
+        }
+    )
+
+    cleaned = StatsCleaner(df).clean()
+
+    assert cleaned["red_td_landed"].dtype == np.float32
+    assert cleaned["red_td_landed"].tolist()[0] == 1.0
+    assert np.isnan(cleaned["red_td_attempted"].iloc[1])
+    assert cleaned["red_td_percent"].tolist() == [0.5, 0.0]
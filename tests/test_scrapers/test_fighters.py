@@ -17,4 +17,4 @@ def test_fighter(monkeypatch):
 
     expected_record = ["Record", " 24-2-0"]
 
-    assert fighter._extract_fighter_record() == expected_record
+    assert fighter._extract_fighter_record(fighter._get_soup()) == expected_record
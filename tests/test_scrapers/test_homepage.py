@@ -0,0 +1,106 @@
+import asyncio
+
+from bs4 import BeautifulSoup
+
+from src.config import ScraperSettings
+from src.lib.scrapers import HomepageScraper
+
+EVENTS_PER_PAGE = 2
+FINAL_PAGE = 10
+
+
+def _event_link(page, i):
+    return f"http://www.ufcstats.com/event-details/{page}-{i}"
+
+
+def _listing_page(page):
+    events = "".join(
+        f'<a class="b-link b-link_style_black" href="{_event_link(page, i)}">Event</a>'
+        for i in range(EVENTS_PER_PAGE)
+    )
+    pagination = "".join(
+        f'<a class="b-statistics__paginate-link" href="?page={i}">{i}</a>'
+        for i in range(1, FINAL_PAGE + 1)
+    )
+    pagination += '<a class="b-statistics__paginate-link" href="?page=all">All</a>'
+    return BeautifulSoup(f"<html>{events}{pagination}</html>", "lxml")
+
+
+def _scrape_links(monkeypatch, cache, **kwargs):
+    requested_pages = []
+
+    async def listing_soup(self, params=None):
+        page = params["page"] if params else 1
+        requested_pages.append(page)
+        return _listing_page(page)
+
+    monkeypatch.setattr(HomepageScraper, "_aget_soup", listing_soup)
+    homepage = HomepageScraper(url="dummy", cache=cache, **kwargs)
+    links = asyncio.run(homepage.scrape_url())
+    return links, requested_pages
+
+
+def test_backfill_requests_every_page_once(monkeypatch):
+    links, requested_pages = _scrape_links(monkeypatch, cache=[])
+
+    assert sorted(requested_pages) == list(range(1, FINAL_PAGE + 1))
+    assert links == [
+        _event_link(page, i)
+        for page in range(1, FINAL_PAGE + 1)
+        for i in range(EVENTS_PER_PAGE)
+    ]
+
+
+def test_incremental_run_stops_at_first_fully_cached_page(monkeypatch):
+    cache = [
+        _event_link(page, i)
+        for page in range(1, FINAL_PAGE + 1)
+        for i in range(EVENTS_PER_PAGE)
+    ]
+    new_event = cache.pop(0)
+
+    links, requested_pages = _scrape_links(
+        monkeypatch, cache=cache, history_complete=True
+    )
+
+    assert links == [new_event]
+    # Page 2 is fully cached, so only the first batch after the homepage is requested.
+    assert sorted(requested_pages) == list(
+        range(1, ScraperSettings.HOMEPAGE_PAGES_PER_BATCH + 2)
+    )
+
+
+def test_interrupted_backfill_resumes_on_every_page(monkeypatch):
+    # The first three pages were scraped before the backfill was interrupted.
+    cache = [
+        _event_link(page, i) for page in range(1, 4) for i in range(EVENTS_PER_PAGE)
+    ]
+
+    links, requested_pages = _scrape_links(monkeypatch, cache=cache)
+
+    assert sorted(requested_pages) == list(range(1, FINAL_PAGE + 1))
+    assert links == [
+        _event_link(page, i)
+        for page in range(4, FINAL_PAGE + 1)
+        for i in range(EVENTS_PER_PAGE)
+    ]
+
+
+def test_failed_event_on_an_older_page_is_retried(monkeypatch):
+    cache = [
+        _event_link(page, i)
+        for page in range(1, FINAL_PAGE + 1)
+        for i in range(EVENTS_PER_PAGE)
+    ]
+    failed_event = _event_link(5, 1)
+    cache.remove(failed_event)
+
+    links, requested_pages = _scrape_links(
+        monkeypatch, cache=cache, history_complete=True, to_retry=[failed_event]
+    )
+
+    assert links == [failed_event]
+    # Listed past the fully cached pages until page 6, the first after the failed event.
+    assert sorted(requested_pages) == list(
+        range(1, 2 * ScraperSettings.HOMEPAGE_PAGES_PER_BATCH + 2)
+    )
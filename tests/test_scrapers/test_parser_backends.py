@@ -0,0 +1,53 @@
+import pytest
+from bs4 import BeautifulSoup
+
+from src.config import PathSettings, ScraperSettings
+from src.lib.scrapers import BoutScraper, CardScraper, FighterScraper
+from src.lib.scrapers.xpath import first_with_class, get_text, parse_html
+
+
+def _page(name):
+    return (PathSettings.TEST_PAGES / name).read_text()
+
+
+PAGES = [
+    (CardScraper.parse_html, ("event", _page("event_details.html"))),
+    (BoutScraper.parse_html, ("bout", _page("fight_details.html"), "d", "l")),
+    (
+        BoutScraper.parse_html,
+        ("bout", _page("fight_details_red_loss.html"), "d", "l"),
+    ),
+    (FighterScraper.parse_html, ("fighter", _page("fighter_profile.html"), True)),
+    (FighterScraper.parse_html, ("fighter", _page("fighter_profile.html"), False)),
+]
+
+
+@pytest.mark.parametrize("parse, args", PAGES)
+def test_lxml_backend_matches_bs4(parse, args):
+    assert parse(*args, backend="lxml") == parse(*args, backend="bs4")
+
+
+def test_text_is_collected_like_bs4():
+    html = (
+        '<html><body><div class="box target">\n   <!-- note -->  \n'
+        "<b>Date:</b>\t<script>var a = 1;</script>   Jan 1\n"
+        "<pre>  \n  </pre><i>   </i></div></body></html>"
+    )
+    expected = BeautifulSoup(html, "lxml").find(class_="target").text
+
+    assert get_text(first_with_class("target")(parse_html(html))[0]) == expected
+
+
+def test_unknown_backend_raises():
+    with pytest.raises(ValueError):
+        CardScraper.parse_html("event", _page("event_details.html"), backend="re")
+
+
+@pytest.mark.parametrize("parse, args", PAGES)
+def test_backend_setting_is_read_when_parsing(parse, args, monkeypatch):
+    monkeypatch.setattr(ScraperSettings, "PARSER_BACKEND", "re")
+    with pytest.raises(ValueError):
+        parse(*args)
+
+    monkeypatch.setattr(ScraperSettings, "PARSER_BACKEND", "bs4")
+    assert parse(*args) == parse(*args, backend="lxml")
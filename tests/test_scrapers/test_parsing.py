@@ -0,0 +1,22 @@
+import asyncio
+
+from src.config import PathSettings
+from src.lib.scrapers import FighterScraper, ParsingPool
+
+
+def test_pool_parses_the_same_profile_as_inline():
+    html = PathSettings.TEST_FIGHTER_PROFILE.read_text()
+
+    async def parse(parsing_pool):
+        return await asyncio.gather(
+            parsing_pool.run(FighterScraper.parse_html, "dummy", html, True),
+            parsing_pool.run(FighterScraper.parse_html, "dummy", html, False),
+        )
+
+    inline = asyncio.run(parse(ParsingPool(max_workers=0)))
+    with ParsingPool(max_workers=2) as parsing_pool:
+        pooled = asyncio.run(parse(parsing_pool))
+
+    assert pooled == inline
+    assert inline[0]["red_record"] == " 24-2-0"
+    assert inline[1]["blue_record"] == " 24-2-0"